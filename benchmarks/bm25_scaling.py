@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import List
+
+import numpy as np
+
+from temporal_graph_rag.index.bm25 import BM25Index
+
+
+def build_corpus(count: int, vocab_size: int, seed: int) -> List[List[str]]:
+    rng = np.random.default_rng(seed)
+    # Zipf-like term distribution, 8-24 tokens per doc.
+    lengths = rng.integers(8, 25, size=count)
+    terms = (rng.zipf(1.3, size=int(lengths.sum())) - 1) % vocab_size
+    words = [f"t{i}" for i in range(vocab_size)]
+    corpus: List[List[str]] = []
+    offset = 0
+    for length in lengths.tolist():
+        corpus.append([words[t] for t in terms[offset : offset + length].tolist()])
+        offset += length
+    return corpus
+
+
+def time_queries(fn, queries: List[List[str]]) -> float:
+    start = time.perf_counter_ns()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter_ns() - start) / len(queries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="BM25 scoring: rank_bm25 scan vs CSR inverted index")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--vocab", type=int, default=50_000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--top-k", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--skip-baseline-above",
+        type=int,
+        default=1_000_000,
+        help="Skip rank_bm25 for corpora larger than this (it is slow to build)",
+    )
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    print(f"{'docs':>10} {'rank_bm25 ms':>14} {'csr ms':>10} {'speedup':>9} {'build s':>9}")
+    for size in args.sizes:
+        corpus = build_corpus(size, args.vocab, args.seed)
+        queries = [random.choice(corpus)[:3] for _ in range(args.queries)]
+
+        start = time.perf_counter()
+        index = BM25Index(corpus)
+        build_s = time.perf_counter() - start
+        csr_ns = time_queries(lambda q: index.top_k(q, args.top_k), queries)
+
+        baseline = "skipped"
+        speedup = "-"
+        if size <= args.skip_baseline_above:
+            from rank_bm25 import BM25Okapi
+
+            reference = BM25Okapi(corpus)
+
+            def scan(query: List[str]) -> None:
+                scores = reference.get_scores(query)
+                np.argsort(scores)[::-1][: args.top_k]
+
+            base_ns = time_queries(scan, queries[: max(1, args.queries // 4)])
+            baseline = f"{base_ns / 1e6:.2f}"
+            speedup = f"{base_ns / csr_ns:.1f}x"
+        print(f"{size:>10} {baseline:>14} {csr_ns / 1e6:>10.3f} {speedup:>9} {build_s:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
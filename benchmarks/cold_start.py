@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from temporal_graph_rag import TemporalGraphRAG
+
+
+PEOPLE = ["Alice", "Bob", "Chloe", "Dev", "Ethan", "Fatima", "Grace", "Hiro"]
+PROJECTS = ["Orion", "Helios", "Nova", "Atlas", "Aurora", "Zephyr"]
+
+
+def make_docs(count: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    docs = []
+    for i in range(count):
+        year = rng.choice([2022, 2023, 2024, 2025])
+        month = rng.randint(1, 12)
+        docs.append(
+            {
+                "id": f"doc-{i}",
+                "content": f"{rng.choice(PEOPLE)} led Project {rng.choice(PROJECTS)} "
+                f"starting {year}-{month:02d} (ticket {rng.randint(1, 99_999)}).",
+                "valid_from": datetime(year, month, 1),
+                "valid_to": datetime(year, month, 28) if rng.random() < 0.8 else None,
+            }
+        )
+    return docs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold start: build from docs vs open a snapshot")
+    parser.add_argument("--docs", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    docs = make_docs(args.docs, args.seed)
+    query = "Who led Project Orion in 2024?"
+    started = time.perf_counter()
+    engine = TemporalGraphRAG(docs, temporal_prefilter=True)
+    build_s = time.perf_counter() - started
+    expected = [source.doc_id for source in engine.query(query).sources]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "snapshot"
+        started = time.perf_counter()
+        engine.save_snapshot(path)
+        save_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        restored = TemporalGraphRAG.from_snapshot(path)
+        open_s = time.perf_counter() - started
+        started = time.perf_counter()
+        got = [source.doc_id for source in restored.query(query).sources]
+        first_query_s = time.perf_counter() - started
+
+    print(f"{args.docs} docs")
+    print(f"  build from docs: {build_s * 1000:,.1f} ms")
+    print(f"  save snapshot:   {save_s * 1000:,.1f} ms")
+    print(f"  open snapshot:   {open_s * 1000:,.1f} ms")
+    print(f"  first query:     {first_query_s * 1000:,.1f} ms")
+    print(f"  same answer:     {got == expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from temporal_graph_rag.index.dense import DenseIndex
+
+
+def clustered_vectors(count: int, dim: int, clusters: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=count)
+    return centers[labels] + 0.35 * rng.normal(size=(count, dim)).astype(np.float32)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dense retrieval: brute force vs IVF recall/latency")
+    parser.add_argument("--docs", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nlist", type=int, default=0, help="IVF lists (default: 4*sqrt(docs))")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    vectors = clustered_vectors(args.docs, args.dim, clusters=256, seed=args.seed)
+    queries = clustered_vectors(args.queries, args.dim, clusters=256, seed=args.seed + 1)
+    index = DenseIndex(vectors)
+
+    start = time.perf_counter_ns()
+    exact = [index.search(q, args.k)[0] for q in queries]
+    brute_ms = (time.perf_counter_ns() - start) / args.queries / 1e6
+
+    start = time.perf_counter_ns()
+    index.search_batch(queries, args.k)
+    batch_ms = (time.perf_counter_ns() - start) / args.queries / 1e6
+
+    nlist = args.nlist or int(4 * np.sqrt(args.docs))
+    start = time.perf_counter()
+    index.train_ivf(nlist, seed=args.seed)
+    train_s = time.perf_counter() - start
+
+    print(f"Docs: {args.docs}  dim: {args.dim}  k: {args.k}  nlist: {nlist} (trained in {train_s:.2f}s)")
+    print(f"{'mode':>16} {'recall@k':>9} {'ms/query':>9}")
+    print(f"{'brute':>16} {1.0:>9.3f} {brute_ms:>9.3f}")
+    print(f"{'brute (batched)':>16} {1.0:>9.3f} {batch_ms:>9.3f}")
+    for nprobe in args.nprobe:
+        start = time.perf_counter_ns()
+        approx = [index.search(q, args.k, nprobe=nprobe)[0] for q in queries]
+        ivf_ms = (time.perf_counter_ns() - start) / args.queries / 1e6
+        recall = np.mean(
+            [len(set(a.tolist()) & set(e.tolist())) / args.k for a, e in zip(approx, exact)]
+        )
+        print(f"{f'ivf nprobe={nprobe}':>16} {recall:>9.3f} {ivf_ms:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
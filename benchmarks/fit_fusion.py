@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections import defaultdict
+from dataclasses import replace
+
+from temporal_hotpot import build_docs, synthetic_dataset
+
+from temporal_graph_rag import TemporalGraphRAG
+from temporal_graph_rag.fusion import FusionConfig, optimize, score_ranges
+from temporal_graph_rag.retrievers import RowHits
+
+
+def retrieve_cases(engine: TemporalGraphRAG, cases: list) -> list:
+    """Retrieval lists per case, fetched once so each config only re-runs fusion."""
+    prepared = []
+    for case in cases:
+        ctx = engine._parse_temporal_context(case.text, case.ref_time)
+        lists, _ = engine._retrieve_all(case.text, ctx, engine._depth(engine._top_k))
+        prepared.append((ctx, lists, case.ground_truth.lower()))
+    return prepared
+
+
+def raw_scores(prepared: list) -> dict:
+    scores = defaultdict(list)
+    for _, lists, _ in prepared:
+        for hits in lists:
+            if isinstance(hits, RowHits):
+                scores[hits.source].extend(hits.scores.tolist())
+            else:
+                for result in hits:
+                    scores[result.source].append(result.score)
+    return scores
+
+
+def mrr(engine: TemporalGraphRAG, prepared: list, config: FusionConfig, top_k: int) -> float:
+    """Mean reciprocal rank of the first fused source naming the ground-truth person."""
+    total = 0.0
+    for ctx, lists, person in prepared:
+        fused = engine._temporal_rrf(lists, ctx, top_k=top_k, config=config)
+        for rank, result in enumerate(fused, start=1):
+            if result.content.lower().startswith(person):
+                total += 1.0 / rank
+                break
+    return total / len(prepared)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fit fusion weights on the synthetic temporal set")
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--doc-count", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--out", default="fusion.json")
+    args = parser.parse_args()
+
+    docs = build_docs(args.doc_count, args.seed)
+    engine = TemporalGraphRAG(docs=docs)
+    cases = synthetic_dataset(docs, 2 * args.samples)
+    random.Random(args.seed).shuffle(cases)
+    train = retrieve_cases(engine, cases[: args.samples])
+    holdout = retrieve_cases(engine, cases[args.samples :])
+    scores = raw_scores(train)
+    sources = sorted(scores)
+
+    baseline = FusionConfig()
+    start = replace(baseline, normalization=score_ranges(scores))
+    started = time.perf_counter()
+    best, score = optimize(
+        lambda config: mrr(engine, train, config, args.top_k),
+        start=start,
+        sources=sources,
+        rounds=args.rounds,
+    )
+    elapsed = time.perf_counter() - started
+
+    print(f"{len(train)} train / {len(holdout)} held-out queries over {args.doc_count} docs")
+    print(f"  baseline   train MRR {mrr(engine, train, baseline, args.top_k):.4f}, "
+          f"held-out MRR {mrr(engine, holdout, baseline, args.top_k):.4f}")
+    print(f"  fitted     train MRR {score:.4f}, "
+          f"held-out MRR {mrr(engine, holdout, best, args.top_k):.4f} ({elapsed:.1f} s)")
+    print(f"  method={best.method} rrf_k={best.rrf_k:g} weights={best.weights}")
+    best.save(args.out)
+    print(f"Saved {args.out}; load it with TGRAG_FUSION_CONFIG={args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from temporal_graph_rag.index.graph import TemporalGraph
+
+
+def build(rows: int, entities: int, per_row: int, seed: int) -> TemporalGraph:
+    rng = np.random.default_rng(seed)
+    mentions = rng.integers(0, entities, size=(rows, per_row))
+    names = [f"E{i}" for i in range(entities)]
+    valid_from = rng.integers(0, 10 * 365 * 86_400, size=rows)
+    valid_to = valid_from + rng.integers(30 * 86_400, 3 * 365 * 86_400, size=rows)
+    graph = TemporalGraph()
+    graph.add(range(rows), ([names[e] for e in row] for row in mentions.tolist()), valid_from, valid_to)
+    return graph
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Temporal graph: 1-2 hop expansion latency")
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--entities", type=int, default=50_000)
+    parser.add_argument("--per-row", type=int, default=4)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    graph = build(args.rows, args.entities, args.per_row, args.seed)
+    build_s = time.perf_counter() - started
+    print(f"{args.rows} rows, {len(graph):,} edges, built in {build_s:.2f} s")
+
+    rng = np.random.default_rng(args.seed + 1)
+    seeds = rng.integers(0, args.entities, size=(args.queries, 2))
+    year = 365 * 86_400
+    for hops in (1, 2):
+        latencies = []
+        reached = 0
+        for pair in seeds.tolist():
+            start = int(rng.integers(0, 8)) * year
+            began = time.perf_counter()
+            rows, _, _ = graph.expand(pair, start, start + 2 * year, hops=hops, max_frontier=1000)
+            latencies.append(time.perf_counter() - began)
+            reached += rows.shape[0]
+        p50, p95 = np.percentile(latencies, [50, 95]) * 1000
+        print(f"  {hops} hop: p50 {p50:.2f} ms, p95 {p95:.2f} ms, {reached / len(latencies):.0f} rows/query")
+
+
+if __name__ == "__main__":
+    main()
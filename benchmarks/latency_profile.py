@@ -7,7 +7,8 @@ import time
 from datetime import datetime
 from typing import List
 
-from temporal_graph_rag import TemporalGraphRAG
+from temporal_graph_rag import TemporalGraphRAG, telemetry
+from temporal_graph_rag.temporal.parser import parse_temporal_context, scan
 
 
 DEFAULT_QUERIES = [
@@ -61,6 +62,56 @@ def run_queries(engine: TemporalGraphRAG, queries: List[str], samples: int) -> L
     return latencies_ns
 
 
+def run_batched(
+    engine: TemporalGraphRAG, queries: List[str], samples: int, batch_size: int
+) -> float:
+    """Throughput (queries/s) of ``query_many`` over the same query mix."""
+    batch = [queries[i % len(queries)] for i in range(samples)]
+    start = time.perf_counter_ns()
+    for lo in range(0, samples, batch_size):
+        engine.query_many(batch[lo : lo + batch_size])
+    elapsed_ns = time.perf_counter_ns() - start
+    return samples / (elapsed_ns / 1e9)
+
+
+def profile_parse(queries: List[str], samples: int) -> tuple[float, float]:
+    """Mean temporal-parse cost in ns: cold (memo cleared) vs memoized."""
+    ref = datetime(2024, 6, 1)
+    cold_ns = 0
+    for i in range(samples):
+        scan.cache_clear()
+        start = time.perf_counter_ns()
+        parse_temporal_context(queries[i % len(queries)], ref)
+        cold_ns += time.perf_counter_ns() - start
+    start = time.perf_counter_ns()
+    for i in range(samples):
+        parse_temporal_context(queries[i % len(queries)], ref)
+    warm_ns = time.perf_counter_ns() - start
+    return cold_ns / samples, warm_ns / samples
+
+
+def profile_stages(engine: TemporalGraphRAG, queries: List[str], samples: int) -> dict:
+    """Mean seconds per (stage, retriever) from the telemetry histograms."""
+    from prometheus_client import CollectorRegistry
+
+    registry = CollectorRegistry()
+    telemetry.configure(metrics=True, tracing=False, registry=registry)
+    try:
+        run_queries(engine, queries, samples)
+    finally:
+        telemetry.disable()
+    sums: dict = {}
+    counts: dict = {}
+    for metric in registry.collect():
+        for sample in metric.samples:
+            label = (sample.labels.get("stage"), sample.labels.get("retriever"))
+            if sample.name.endswith("_sum"):
+                sums[label] = sample.value
+            elif sample.name.endswith("_count"):
+                counts[label] = sample.value
+    return {label: sums[label] / counts[label] for label in sums if counts.get(label)}
+
+
 def summarize(latencies_ns: List[int]) -> dict:
     sorted_ns = sorted(latencies_ns)
     p50 = sorted_ns[int(0.50 * (len(sorted_ns) - 1))]
@@ -98,6 +149,10 @@ def main() -> None:
     parser.add_argument("--doc-count", type=int, default=500)
     parser.add_argument("--seed", type=int, default=7)
     parser.add_argument("--out", default="assets/latency_profile.png")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument(
+        "--stages", action="store_true", help="Per-stage breakdown (requires prometheus_client)"
+    )
     args = parser.parse_args()
 
     docs = build_docs(args.doc_count, args.seed)
@@ -114,6 +169,22 @@ def main() -> None:
     print(f"  min: {stats['min_ns'] / 1e6:.3f} ms ({stats['min_ns'] / 1e3:.1f} µs)")
     print(f"  max: {stats['max_ns'] / 1e6:.3f} ms ({stats['max_ns'] / 1e3:.1f} µs)")
 
+    single_qps = stats["count"] / (sum(latencies_ns) / 1e9)
+    batch_qps = run_batched(engine, DEFAULT_QUERIES, args.samples, args.batch_size)
+    cold_ns, warm_ns = profile_parse(DEFAULT_QUERIES, args.samples)
+    print("Temporal parse:")
+    print(f"  cold: {cold_ns / 1e3:.1f} µs")
+    print(f"  memoized: {warm_ns / 1e3:.1f} µs")
+    print("Throughput:")
+    print(f"  query: {single_qps:,.0f} qps")
+    print(f"  query_many (batch={args.batch_size}): {batch_qps:,.0f} qps")
+
+    if args.stages:
+        print("Stages (mean, instrumented run):")
+        for (stage, retriever), mean_s in profile_stages(engine, DEFAULT_QUERIES, args.samples).items():
+            label = f"{stage}[{retriever}]" if retriever else stage
+            print(f"  {label}: {mean_s * 1e6:.1f} µs")
+
     plot(latencies_ns, args.out)
     print(f"Chart saved to {args.out}")
 
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime
+
+import numpy as np
+
+from temporal_graph_rag.retrievers import Neo4jGraphRetriever
+from temporal_graph_rag.temporal.parser import parse_temporal_context
+
+WORDS = ["orion", "apollo", "vega", "atlas", "lyra", "helix", "nova", "titan", "delta", "kepler"]
+
+
+class _StandInTx:
+    def __init__(self, driver: "StandInDriver") -> None:
+        self.driver = driver
+
+    def run(self, query: str, **params: object) -> list:
+        queries = params.get("queries") or [{"idx": 0}]
+        return [
+            {"idx": q["idx"], "id": f"d{q['idx']}-{i}", "content": "stand-in", "score": 1.0}
+            for q in queries
+            for i in range(min(int(params.get("limit", 10)), 10))
+        ]
+
+
+class _StandInSession:
+    def __init__(self, driver: "StandInDriver") -> None:
+        self.driver = driver
+
+    def _transaction(self, work: object) -> object:
+        # A managed transaction pipelines BEGIN/RUN/PULL/COMMIT: one network round trip.
+        self.driver.round_trips += 1
+        time.sleep(self.driver.rtt_s)
+        return work(_StandInTx(self.driver))
+
+    execute_read = execute_write = _transaction
+
+    def close(self) -> None:
+        pass
+
+
+class StandInDriver:
+    """Counts sessions and transaction round trips, sleeping ``rtt_ms`` per round trip."""
+
+    def __init__(self, rtt_ms: float) -> None:
+        self.rtt_s = rtt_ms / 1000
+        self.sessions = 0
+        self.round_trips = 0
+
+    def session(self, **config: object) -> _StandInSession:
+        self.sessions += 1
+        return _StandInSession(self)
+
+    def close(self) -> None:
+        pass
+
+
+def make_queries(count: int, seed: int) -> list:
+    rng = np.random.default_rng(seed)
+    return [
+        f"{' '.join(rng.choice(WORDS, size=2))} in {int(rng.integers(2019, 2025))}"
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Neo4j retriever: round trips per query")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--rtt-ms", type=float, default=1.0, help="simulated round trip (stand-in)")
+    parser.add_argument("--uri", default=None, help="measure a real server instead of the stand-in")
+    parser.add_argument("--user", default="neo4j")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    retriever = Neo4jGraphRetriever(args.uri or "bolt://localhost:7687", args.user, args.password)
+    stand_in = None
+    if args.uri is None:
+        retriever._driver = stand_in = StandInDriver(args.rtt_ms)
+    now = datetime(2024, 6, 1)
+    queries = make_queries(args.queries, args.seed)
+    ctxs = [parse_temporal_context(query, now) for query in queries]
+    target = args.uri or f"stand-in driver, {args.rtt_ms:g} ms RTT"
+    print(f"{len(queries)} queries against {target}")
+
+    def report(label: str, run: object) -> None:
+        before = (stand_in.sessions, stand_in.round_trips) if stand_in else (0, 0)
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        line = f"  {label:<13} {elapsed * 1000:8.1f} ms total, {elapsed * 1e6 / len(queries):8.1f} us/query"
+        if stand_in:
+            sessions = stand_in.sessions - before[0]
+            trips = stand_in.round_trips - before[1]
+            line += f", {trips / len(queries):.3f} round trips/query, {sessions} sessions opened"
+        print(line)
+
+    report("retrieve", lambda: [retriever.retrieve(q, c) for q, c in zip(queries, ctxs)])
+    report("retrieve_many", lambda: retriever.retrieve_many(queries, ctxs))
+    retriever.close()
+
+
+if __name__ == "__main__":
+    main()
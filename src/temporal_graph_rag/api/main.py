@@ -1,20 +1,67 @@
+import asyncio
+import importlib
+import os
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import HTMLResponse, Response
 from pydantic import BaseModel, Field
 
 from temporal_graph_rag import TemporalGraphRAG
 from temporal_graph_rag.api.ui import UI_HTML
+from temporal_graph_rag import telemetry
+from temporal_graph_rag.cache import LRUQueryCache
+from temporal_graph_rag.fusion import CascadeConfig, FusionConfig
+from temporal_graph_rag.index.dense import hashing_embedder
+from temporal_graph_rag.snapshot import needs_embedding_fn
+from temporal_graph_rag.types import QueryResponse as EngineResponse
+
+
+def _embedding_fn(spec: str) -> Callable[[str], Iterable[float]]:
+    """``TGRAG_EMBEDDING_FN``: ``hashing:<dim>`` or a ``module:function`` import path."""
+    name, _, attr = spec.partition(":")
+    if name == "hashing":
+        return hashing_embedder(int(attr or 256))
+    if not attr:
+        raise RuntimeError(f"TGRAG_EMBEDDING_FN must be module:function or hashing:<dim>, got {spec!r}")
+    return getattr(importlib.import_module(name), attr)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    engine = TemporalGraphRAG()
+    # Histograms if prometheus_client is installed; spans if an OTel SDK is configured.
+    telemetry.configure()
+    # Workers open a prebuilt snapshot (memory-mapped, shared pages) when one is configured.
+    snapshot = os.environ.get("TGRAG_SNAPSHOT")
+    # A fitted fusion config (benchmarks/fit_fusion.py) overrides the snapshot's.
+    options = {"cache": LRUQueryCache()}
+    fusion_path = os.environ.get("TGRAG_FUSION_CONFIG")
+    if fusion_path:
+        options["fusion"] = FusionConfig.load(fusion_path)
+    # Cascade tiers, e.g. "graph;sparse;dense" (";" between tiers, "," within one).
+    tiers = os.environ.get("TGRAG_CASCADE")
+    if tiers:
+        options["cascade"] = CascadeConfig([tier.split(",") for tier in tiers.split(";")])
+    if snapshot:
+        # A dense retriever embeds queries with the function the snapshot was built with.
+        spec = os.environ.get("TGRAG_EMBEDDING_FN")
+        if spec:
+            options["embedding_fn"] = _embedding_fn(spec)
+        elif needs_embedding_fn(snapshot):
+            raise RuntimeError(
+                f"snapshot {snapshot} has a dense retriever; set TGRAG_EMBEDDING_FN to the "
+                "embedding function it was built with (module:function or hashing:<dim>)"
+            )
+        engine = TemporalGraphRAG.from_snapshot(snapshot, **options)
+    else:
+        engine = TemporalGraphRAG(**options)
     app.state.engine = engine
     try:
         yield
     finally:
-        engine.close()
+        await engine.aclose()
+        telemetry.disable()
 
 
 app = FastAPI(title="Temporal Graph RAG", version="0.1.0", lifespan=lifespan)
@@ -23,6 +70,19 @@ app = FastAPI(title="Temporal Graph RAG", version="0.1.0", lifespan=lifespan)
 class QueryRequest(BaseModel):
     query: str = Field(..., min_length=3)
     reference_time: datetime | None = None
+    top_k: int = Field(5, ge=1, le=100)
+    # Transaction time: answer from the fact versions believed at this instant.
+    as_of: datetime | None = None
+
+
+class BatchQueryItem(BaseModel):
+    query: str = Field(..., min_length=3)
+    reference_time: datetime | None = None
+
+
+class BatchQueryRequest(BaseModel):
+    queries: list[BatchQueryItem] = Field(..., min_length=1, max_length=1000)
+    top_k: int = Field(5, ge=1, le=100)
 
 
 class SourceItem(BaseModel):
@@ -33,12 +93,17 @@ class SourceItem(BaseModel):
     source_scores: dict[str, float]
     valid_from: datetime | None
     valid_to: datetime | None
+    transaction_from: datetime | None = None
+    transaction_to: datetime | None = None
 
 
 class QueryResponse(BaseModel):
     answer: str
     sources: list[SourceItem]
     temporal_context: dict
+    degraded_sources: list[str] = []
+    degraded_reasons: dict[str, str] = {}
+    skipped_sources: list[str] = []
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -48,13 +113,56 @@ def home() -> HTMLResponse:
 
 @app.get("/health")
 def health() -> dict:
-    return {"status": "ok"}
+    backends = app.state.engine.backend_status()
+    # Still serving (fusion runs without them), but some backend is failing fast.
+    degraded = any(stats["state"] != "closed" for stats in backends.values())
+    return {"status": "degraded" if degraded else "ok", "backends": backends}
+
+
+@app.get("/cache/stats")
+def cache_stats() -> dict:
+    cache = app.state.engine.cache
+    return cache.stats() if cache is not None else {}
+
+
+@app.get("/cascade/stats")
+def cascade_stats() -> dict:
+    return app.state.engine.cascade_stats()
+
+
+@app.get("/metrics")
+def metrics() -> Response:
+    try:
+        payload, content_type = telemetry.render_metrics()
+    except RuntimeError:
+        return Response("metrics disabled: install prometheus_client\n", status_code=503)
+    return Response(payload, media_type=content_type)
 
 
 @app.post("/query", response_model=QueryResponse)
-def query(req: QueryRequest) -> QueryResponse:
+async def query(req: QueryRequest) -> QueryResponse:
     engine = app.state.engine
-    res = engine.query(req.query, req.reference_time)
+    try:
+        res = await engine.aquery(req.query, req.reference_time, top_k=req.top_k, as_of=req.as_of)
+    except ValueError as err:  # e.g. ``as_of`` before the compacted history horizon
+        raise HTTPException(status_code=422, detail=str(err)) from err
+    return _to_response(res)
+
+
+@app.post("/query/batch", response_model=list[QueryResponse])
+async def query_batch(req: BatchQueryRequest) -> list[QueryResponse]:
+    engine = app.state.engine
+    # Batch scoring is CPU-bound; keep it off the event loop.
+    results = await asyncio.to_thread(
+        engine.query_many,
+        [item.query for item in req.queries],
+        [item.reference_time for item in req.queries],
+        req.top_k,
+    )
+    return [_to_response(res) for res in results]
+
+
+def _to_response(res: EngineResponse) -> QueryResponse:
     sources = [
         SourceItem(
             doc_id=s.doc_id,
@@ -64,6 +172,8 @@ def query(req: QueryRequest) -> QueryResponse:
             source_scores=s.source_scores,
             valid_from=s.valid_from,
             valid_to=s.valid_to,
+            transaction_from=s.transaction_from,
+            transaction_to=s.transaction_to,
         )
         for s in res.sources
     ]
@@ -77,4 +187,7 @@ def query(req: QueryRequest) -> QueryResponse:
             "time_end": res.temporal_context.time_end,
             "granularity": res.temporal_context.granularity,
         },
+        degraded_sources=res.degraded_sources,
+        degraded_reasons=res.degraded_reasons,
+        skipped_sources=res.skipped_sources,
     )
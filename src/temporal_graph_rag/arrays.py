@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+
+
+def load_array(path: Union[str, Path], mmap: bool = True) -> np.ndarray:
+    """Load an ``.npy`` file, memory-mapped read-only when ``mmap``.
+
+    Returns a plain ``ndarray`` view of the mapping: ``np.memmap`` indexing
+    carries per-call subclass overhead that dominates scalar lookups.
+    """
+    return np.asarray(np.load(Path(path), mmap_mode="r" if mmap else None))
+
+
+class GrowableArray:
+    """Append-only array with amortized O(1) growth; ``values`` is the filled prefix.
+
+    Growth may reallocate, so re-read ``values`` after :meth:`extend`.
+    """
+
+    def __init__(self, values: np.ndarray) -> None:
+        self._data = values
+        self.size = int(values.shape[0])
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._data[: self.size]
+
+    def extend(self, values: np.ndarray) -> None:
+        need = self.size + values.shape[0]
+        if need > self._data.shape[0] or not self._data.flags.writeable:
+            grown = np.empty(max(need, 2 * self.size, 16), dtype=self._data.dtype)
+            grown[: self.size] = self._data[: self.size]
+            self._data = grown
+        self._data[self.size : need] = values
+        self.size = need
+
+    def writable(self) -> np.ndarray:
+        if not self._data.flags.writeable:
+            self._data = np.array(self._data)  # copy-on-write for a memory-mapped snapshot
+        return self.values
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Protocol
+
+from temporal_graph_rag.types import FusedRetrievalResult, QueryResponse, TemporalContext
+
+
+_BUCKET_FORMATS = {"year": "%Y", "month": "%Y-%m", "day": "%Y-%m-%d"}
+
+
+def cache_key(query: str, ctx: TemporalContext, top_k: int) -> str:
+    """Key on normalized query text plus the temporal context at its granularity.
+
+    The reference time is truncated to ``ctx.granularity`` so that
+    ``reference_time=datetime.utcnow()`` still maps repeated questions onto
+    one entry (recency weighting may drift by up to one bucket).
+    """
+    text = " ".join(query.lower().split()).rstrip("?!.")
+    bucket_format = _BUCKET_FORMATS.get(ctx.granularity, "%Y-%m-%d")
+    parts = [
+        text,
+        ctx.reference_time.strftime(bucket_format),
+        ",".join(ctx.operators),
+        ctx.time_start.isoformat() if ctx.time_start else "",
+        ctx.time_end.isoformat() if ctx.time_end else "",
+        str(top_k),
+    ]
+    return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+class EmbeddingCache:
+    """Thread-safe LRU of query embeddings keyed by whitespace-normalized text.
+
+    Case is kept: embedding models generally distinguish it.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, List[float]] = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(text.split())
+
+    def get(self, text: str) -> Optional[List[float]]:
+        key = self.normalize(text)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return vector
+
+    def set(self, text: str, vector: Iterable[float]) -> List[float]:
+        vector = [float(x) for x in vector]
+        if self.max_entries <= 0:
+            return vector
+        key = self.normalize(text)
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+        return vector
+
+    def get_or_compute(self, text: str, embed: Callable[[str], Iterable[float]]) -> List[float]:
+        vector = self.get(text)
+        return vector if vector is not None else self.set(text, embed(text))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats.as_dict(), "entries": len(self._entries)}
+
+
+class QueryCache(Protocol):
+    def get(self, key: str) -> Optional[QueryResponse]:
+        ...
+
+    def set(self, key: str, value: QueryResponse, doc_ids: Iterable[str]) -> None:
+        ...
+
+    def invalidate_documents(self, doc_ids: Iterable[str]) -> int:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+    def stats(self) -> dict:
+        ...
+
+
+class LRUQueryCache:
+    """In-process LRU with per-entry TTL and doc-id tags for invalidation."""
+
+    def __init__(self, max_entries: int = 4096, ttl_s: Optional[float] = 300.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._entries: OrderedDict[str, tuple[float, QueryResponse, frozenset[str]]] = OrderedDict()
+        self._by_doc: dict[str, set[str]] = {}
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[QueryResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            expires_at, value, _ = entry
+            if expires_at < time.monotonic():
+                self._drop(key)
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def set(self, key: str, value: QueryResponse, doc_ids: Iterable[str]) -> None:
+        expires_at = time.monotonic() + self.ttl_s if self.ttl_s is not None else float("inf")
+        tags = frozenset(doc_ids)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (expires_at, value, tags)
+            for doc_id in tags:
+                self._by_doc.setdefault(doc_id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._stats.evictions += 1
+
+    def invalidate_documents(self, doc_ids: Iterable[str]) -> int:
+        dropped = 0
+        with self._lock:
+            for doc_id in doc_ids:
+                for key in self._by_doc.pop(doc_id, set()):
+                    if key in self._entries:
+                        self._drop(key)
+                        dropped += 1
+            self._stats.invalidations += dropped
+        return dropped
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._by_doc.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats.as_dict(), "entries": len(self._entries)}
+
+    def _drop(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for doc_id in tags:
+            keys = self._by_doc.get(doc_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_doc[doc_id]
+
+
+def _encode_response(response: QueryResponse) -> bytes:
+    def default(value: object) -> str:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        raise TypeError(f"cannot encode {type(value).__name__}")
+
+    return json.dumps(asdict(response), default=default).encode("utf-8")
+
+
+def _decode_response(payload: bytes) -> QueryResponse:
+    """Inverse of :func:`_encode_response`; builds plain dataclasses, never code."""
+
+    def when(value: Optional[str]) -> Optional[datetime]:
+        return datetime.fromisoformat(value) if value is not None else None
+
+    data = json.loads(payload)
+    ctx = data["temporal_context"]
+    sources = []
+    for source in data["sources"]:
+        for name in ("valid_from", "valid_to", "transaction_from", "transaction_to"):
+            source[name] = when(source[name])
+        sources.append(FusedRetrievalResult(**source))
+    return QueryResponse(
+        answer=data["answer"],
+        sources=sources,
+        temporal_context=TemporalContext(
+            reference_time=when(ctx["reference_time"]),
+            operators=ctx["operators"],
+            time_start=when(ctx["time_start"]),
+            time_end=when(ctx["time_end"]),
+            granularity=ctx["granularity"],
+        ),
+        degraded_sources=data["degraded_sources"],
+        degraded_reasons=data["degraded_reasons"],
+        skipped_sources=data["skipped_sources"],
+    )
+
+
+class RedisQueryCache:
+    """Shared cache backend over a ``redis.Redis``-compatible client.
+
+    Entries are JSON-encoded ``QueryResponse`` objects with a server-side TTL
+    (JSON, not pickle: whoever can write to Redis must not get code execution
+    in every worker). Each cited doc id keeps a set of keys so invalidation
+    works across workers; a set expires with the newest entry it lists.
+    """
+
+    def __init__(self, client: object, prefix: str = "tgrag:q:", ttl_s: Optional[float] = 300.0) -> None:
+        self._client = client
+        self._prefix = prefix
+        self.ttl_s = ttl_s
+        self._stats = CacheStats()
+
+    def get(self, key: str) -> Optional[QueryResponse]:
+        payload = self._client.get(self._prefix + key)
+        if payload is None:
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        return _decode_response(payload)
+
+    def set(self, key: str, value: QueryResponse, doc_ids: Iterable[str]) -> None:
+        # Milliseconds: whole seconds would truncate a sub-second TTL to the invalid EX 0.
+        ttl_ms = max(1, math.ceil(self.ttl_s * 1000)) if self.ttl_s is not None else None
+        pipe = self._client.pipeline()
+        pipe.set(self._prefix + key, _encode_response(value), px=ttl_ms)
+        for doc_id in set(doc_ids):
+            tag = f"{self._prefix}doc:{doc_id}"
+            pipe.sadd(tag, key)
+            if ttl_ms is not None:
+                pipe.pexpire(tag, ttl_ms)
+        pipe.execute()
+
+    def invalidate_documents(self, doc_ids: Iterable[str]) -> int:
+        dropped = 0
+        for doc_id in doc_ids:
+            tag = f"{self._prefix}doc:{doc_id}"
+            keys = self._client.smembers(tag)
+            if keys:
+                dropped += self._client.delete(
+                    *(self._prefix + (k.decode() if isinstance(k, bytes) else k) for k in keys)
+                )
+            self._client.delete(tag)
+        self._stats.invalidations += dropped
+        return dropped
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(match=self._prefix + "*"))
+        if keys:
+            self._stats.invalidations += self._client.delete(*keys)
+
+    def stats(self) -> dict:
+        return self._stats.as_dict()
@@ -35,7 +35,11 @@ def main() -> None:
     args = parser.parse_args()
 
     engine = TemporalGraphRAG()
-    result = engine.query(args.query, reference_time=_parse_reference_time(args.reference_time))
+    result = engine.query(
+        args.query,
+        reference_time=_parse_reference_time(args.reference_time),
+        top_k=args.limit,
+    )
 
     if args.json:
         payload = {
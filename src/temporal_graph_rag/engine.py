@@ -1,14 +1,73 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Iterable, List, Optional
-import calendar
-import re
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import asyncio
+import contextvars
+import logging
 import math
+import threading
+import time
 
-from temporal_graph_rag.retrievers import BM25Retriever, InMemoryDenseRetriever, InMemoryGraphRetriever, Retriever
+import numpy as np
+
+from temporal_graph_rag.cache import QueryCache, cache_key
+from temporal_graph_rag.fusion import CascadeConfig, FusionConfig, max_boost, max_contribution
+from temporal_graph_rag.resilience import CircuitOpenError
+from temporal_graph_rag.telemetry import stage
+from temporal_graph_rag.retrievers import BM25Retriever, InMemoryDenseRetriever, InMemoryGraphRetriever, Retriever, RowHits
+from temporal_graph_rag.store import DocumentStore
+from temporal_graph_rag.temporal.bitemporal import BitemporalIndex
+from temporal_graph_rag.temporal.epoch import OPEN_START, from_epoch, to_epoch
+from temporal_graph_rag.temporal.interval_index import IntervalIndex
+from temporal_graph_rag.temporal.parser import parse_temporal_context
 from temporal_graph_rag.types import FusedRetrievalResult, QueryResponse, RetrievalResult, TemporalContext
 
+logger = logging.getLogger(__name__)
+
+# One retriever's answer: rows of the engine's store, or materialized results.
+Hits = Union[RowHits, List[RetrievalResult]]
+
+_US = 1_000_000
+_US_PER_DAY = 86_400 * _US
+
+
+class _Call:
+    """A retriever call on the shared pool; its deadline starts when a worker runs it."""
+
+    def __init__(self) -> None:
+        self._began = threading.Event()
+        self._began_at = 0.0
+
+    def run(self, fn: Callable[..., Hits], *args) -> Hits:
+        self._began_at = time.monotonic()
+        self._began.set()
+        return fn(*args)
+
+    def remaining(self, deadline: float) -> float:
+        # Submission holds a free worker, so a start only lags if the pool shut down.
+        if not self._began.wait(deadline):
+            return 0.0
+        return max(0.0, self._began_at + deadline - time.monotonic())
+
+
+@dataclass
+class _Fusion:
+    """Per-document fusion arrays, before the top documents are materialized."""
+
+    keys: np.ndarray  # store rows; negative for results the store does not hold
+    scores: np.ndarray
+    boosts: np.ndarray  # each document's temporal boost
+    order: np.ndarray  # best first, ties in order of first appearance
+    final: np.ndarray  # per-entry contributions
+    owner: np.ndarray  # entry -> document
+    entry_sources: np.ndarray
+    names: Dict[int, str]
+    foreign: Dict[int, RetrievalResult]
+
 
 class TemporalGraphRAG:
     """Minimal, runnable temporal RAG skeleton with hybrid fusion.
@@ -18,155 +77,908 @@ class TemporalGraphRAG:
 
     def __init__(
         self,
-        docs: Optional[List[dict]] = None,
+        docs: Optional[Union[List[dict], DocumentStore]] = None,
         retrievers: Optional[List[Retriever]] = None,
+        temporal_prefilter: bool = False,
+        parallel: bool = False,
+        retriever_timeout_s: Optional[float] = None,
+        retriever_timeouts: Optional[dict[str, float]] = None,
+        max_concurrent_queries: int = 8,
+        top_k: int = 5,
+        candidate_k: Optional[int] = 50,
+        cache: Optional[QueryCache] = None,
+        interval_index: Optional[IntervalIndex] = None,
+        history_index: Optional[BitemporalIndex] = None,
+        fusion: Optional[FusionConfig] = None,
+        cascade: Optional[CascadeConfig] = None,
+        history_retention: Optional[timedelta] = None,
+        history_horizon: Optional[datetime] = None,
     ) -> None:
-        self._docs = docs or [
-            {
-                "id": "doc-1",
-                "content": "Alice led Project Orion from 2023-01 to 2024-02.",
-                "valid_from": datetime(2023, 1, 1),
-                "valid_to": datetime(2024, 2, 28),
-            },
-            {
-                "id": "doc-2",
-                "content": "Bob took over infrastructure in 2024-03 after the reorg.",
-                "valid_from": datetime(2024, 3, 1),
-                "valid_to": None,
-            },
-            {
-                "id": "doc-3",
-                "content": "The March 2024 reorg shifted ownership to Platform Ops.",
-                "valid_from": datetime(2024, 3, 1),
-                "valid_to": datetime(2024, 3, 31),
-            },
-        ]
+        if isinstance(docs, DocumentStore):
+            self._docs = docs
+        else:
+            docs = list(docs) if docs is not None else [
+                {
+                    "id": "doc-1",
+                    "content": "Alice led Project Orion from 2023-01 to 2024-02.",
+                    "valid_from": datetime(2023, 1, 1),
+                    "valid_to": datetime(2024, 2, 28),
+                },
+                {
+                    "id": "doc-2",
+                    "content": "Bob took over infrastructure in 2024-03 after the reorg.",
+                    "valid_from": datetime(2024, 3, 1),
+                    "valid_to": None,
+                },
+                {
+                    "id": "doc-3",
+                    "content": "The March 2024 reorg shifted ownership to Platform Ops.",
+                    "valid_from": datetime(2024, 3, 1),
+                    "valid_to": datetime(2024, 3, 31),
+                },
+            ]
+            self._docs = DocumentStore.from_docs(docs)
+        if interval_index is None:
+            interval_index = IntervalIndex(self._docs.valid_from, self._docs.valid_to)
+            interval_index.remove(np.flatnonzero(~self._docs.live).tolist())
+        elif len(interval_index) != len(self._docs):
+            raise ValueError("interval_index rows must align with docs")
+        self._interval_index = interval_index
+        # Transaction-time index over every version ever written, for ``as_of`` queries.
+        if history_index is None:
+            history_index = BitemporalIndex(self._docs.transaction_from, self._docs.transaction_to)
+        elif len(history_index) != len(self._docs):
+            raise ValueError("history_index rows must align with docs")
+        self._history = history_index
+        # Versions closed before the horizon are purged from the indexes, so
+        # ``as_of`` queries before it are refused. With ``history_retention``,
+        # writes compact versions closed longer ago than that.
+        self._history_retention = history_retention
+        self._history_horizon = history_horizon
+        self._closed_since_compaction = 0
+        # With prefiltering, the default retrievers only score docs whose
+        # validity window overlaps the query window (hard filter).
+        shared_index = self._interval_index if temporal_prefilter else None
         self._retrievers = retrievers or [
-            InMemoryGraphRetriever(self._docs),
-            InMemoryDenseRetriever(self._docs),
-            BM25Retriever(self._docs),
+            InMemoryGraphRetriever(self._docs, interval_index=shared_index),
+            InMemoryDenseRetriever(self._docs, interval_index=shared_index),
+            BM25Retriever(self._docs, interval_index=shared_index),
+        ]
+        # Deadlines are per retriever name; ``retriever_timeout_s`` is the default.
+        # Abandoning a late call needs a worker thread, so deadlines apply with
+        # ``parallel=True`` and in ``aquery``; a sequential ``query`` waits it out.
+        self._parallel = parallel
+        self._retriever_timeout_s = retriever_timeout_s
+        self._retriever_timeouts = dict(retriever_timeouts or {})
+        if not parallel and (retriever_timeout_s is not None or self._retriever_timeouts):
+            logger.warning("Retriever deadlines only apply to query() with parallel=True")
+        # The shared pool runs ``max_concurrent_queries`` fan-outs at once; each
+        # call first takes a worker permit, so it never queues behind another query.
+        self._pool_size = max(1, max_concurrent_queries) * max(1, len(self._retrievers))
+        self._workers = threading.BoundedSemaphore(self._pool_size)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # ``top_k`` bounds the fused answer; ``candidate_k`` bounds each retriever's
+        # list (None = unbounded), so per-query work scales with k, not the corpus.
+        self._top_k = top_k
+        self._candidate_k = candidate_k
+        self._cache = cache
+        # Fusion weights and boost factors; FusionConfig() is the original fixed scheme.
+        self.fusion = fusion or FusionConfig()
+        self._cascade = cascade
+        self._tiers = self._resolve_tiers(cascade) if cascade is not None else []
+        self._cascade_counts = {"queries": 0, "skipped": {self._tier_label(t): 0 for t in self._tiers[1:]}}
+        self._cascade_lock = threading.Lock()
+
+    @property
+    def cache(self) -> Optional[QueryCache]:
+        return self._cache
+
+    def save_snapshot(self, path: Union[str, Path]) -> None:
+        """Write docs and indexes so :meth:`from_snapshot` can memory-map them."""
+        from temporal_graph_rag.snapshot import save_snapshot
+
+        save_snapshot(self, path)
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        path: Union[str, Path],
+        embedding_fn: Optional[Callable[[str], Iterable[float]]] = None,
+        mmap: bool = True,
+        **kwargs,
+    ) -> "TemporalGraphRAG":
+        """Open a snapshot without re-tokenizing or re-embedding; ``kwargs`` go to ``__init__``."""
+        from temporal_graph_rag.snapshot import load_snapshot
+
+        return load_snapshot(path, embedding_fn=embedding_fn, mmap=mmap, **kwargs)
+
+    def add_documents(self, docs: Sequence[dict]) -> int:
+        """Upsert documents into the interval index and every writable retriever.
+
+        Retrievers without ``add_documents`` (e.g. loaded by an external job)
+        are skipped. New facts can change any answer, so the cache is cleared.
+        Use :class:`~temporal_graph_rag.ingestion.pipeline.IngestionPipeline`
+        to stream large files through this in chunks.
+        """
+        docs = list(docs)
+        if not docs:
+            return 0
+        added, removed = self._docs.upsert(docs)
+        self._write("add_documents", docs, added, removed)
+        # Index last: a prefiltered retriever must already hold every row it can be handed.
+        self._interval_index.remove(removed)
+        self._interval_index.insert(self._docs.valid_from[added], self._docs.valid_to[added])
+        self._record_history(added, removed)
+        if self._cache is not None:
+            self._cache.clear()
+        return len(docs)
+
+    def update_document(self, doc: dict) -> None:
+        """Replace a document (new content or validity window) in place of a rebuild."""
+        self.add_documents([doc])
+
+    def delete_document(self, doc_id: str) -> bool:
+        """Remove a document everywhere; returns whether the engine indexed it."""
+        removed = self._docs.delete([doc_id])
+        self._write("delete_document", doc_id, range(0), removed)
+        self._interval_index.remove(removed)
+        self._record_history(range(0), removed)
+        self.invalidate_documents([doc_id])
+        return bool(removed)
+
+    def _write(self, method: str, payload: object, added: range, removed: List[int]) -> None:
+        # Retrievers sharing the engine's store only update their index; others
+        # (own store, remote backend) take the write themselves.
+        for retriever in self._retrievers:
+            if self._shares_store(retriever):
+                with stage("ingest", retriever.name):
+                    retriever.index_rows(added, removed)
+                continue
+            write = getattr(retriever, method, None)
+            if callable(write):
+                with stage("ingest", retriever.name):
+                    write(payload)
+
+    def _record_history(self, added: range, removed: List[int]) -> None:
+        store = self._docs
+        if removed:
+            self._history.close(removed, store.transaction_to[removed])
+        if len(added):
+            self._history.append(store.transaction_from[added], store.transaction_to[added])
+        self._closed_since_compaction += len(removed)
+        # Compact once closed versions reach an eighth of the store, so the
+        # cost amortizes like the segment merges it triggers.
+        if self._history_retention is not None and 8 * self._closed_since_compaction > len(store):
+            self.compact_history(datetime.utcnow() - self._history_retention)
+
+    @property
+    def history_horizon(self) -> Optional[datetime]:
+        """Oldest ``as_of`` still answerable; ``None`` if no history was compacted."""
+        return self._history_horizon
+
+    def compact_history(self, before: datetime) -> int:
+        """Purge versions no longer believed at ``before`` from every index.
+
+        Retrievers sharing the engine's store drop the rows with
+        ``purge_rows``; ``as_of`` queries before ``before`` then raise
+        ``ValueError``. Returns how many versions were purged.
+        """
+        store = self._docs
+        rows = np.flatnonzero(~store.live & (store.transaction_to <= to_epoch(before)))
+        for retriever in self._retrievers:
+            purge = getattr(retriever, "purge_rows", None)
+            if self._shares_store(retriever) and callable(purge):
+                with stage("ingest", retriever.name):
+                    purge(rows.tolist())
+        if self._history_horizon is None or to_epoch(before) > to_epoch(self._history_horizon):
+            self._history_horizon = before
+        self._closed_since_compaction = 0
+        return int(rows.shape[0])
+
+    def _shares_store(self, retriever: Retriever) -> bool:
+        return getattr(retriever, "docs", None) is self._docs and hasattr(retriever, "retrieve_rows")
+
+    def invalidate_documents(self, doc_ids: Iterable[str]) -> int:
+        """Drop cached answers citing any of ``doc_ids`` (call on ingest/update/delete)."""
+        if self._cache is None:
+            return 0
+        return self._cache.invalidate_documents(doc_ids)
+
+    def query(
+        self,
+        query: str,
+        reference_time: Optional[datetime] = None,
+        top_k: Optional[int] = None,
+        as_of: Optional[datetime] = None,
+    ) -> QueryResponse:
+        """Answer ``query``; with ``as_of``, from the versions believed at that instant.
+
+        ``reference_time`` positions the question in valid time ("last year"),
+        ``as_of`` in transaction time ("what did we know on date X").
+        """
+        with stage("query"):
+            ref_time = reference_time or datetime.utcnow()
+            ctx = self._parse_temporal_context(query, ref_time)
+            top_k = self._top_k if top_k is None else top_k
+            if as_of is not None:
+                return self._query_as_of(query, ctx, top_k, as_of)
+            key = self._cache_key(query, ctx, top_k)
+            cached = self._cache_lookup(key, ctx)
+            if cached is not None:
+                return cached
+
+            if self._tiers:
+                return self._remember(key, self._cascade_query(query, ctx, top_k))
+            results_lists, degraded = self._retrieve_all(query, ctx, self._depth(top_k))
+            return self._remember(key, self._respond(query, ctx, results_lists, degraded, top_k))
+
+    def query_many(
+        self,
+        queries: Sequence[str],
+        reference_times: Optional[Sequence[Optional[datetime]]] = None,
+        top_k: Optional[int] = None,
+    ) -> List[QueryResponse]:
+        """Answer a batch of queries, one batched call per retriever.
+
+        Retrievers exposing ``retrieve_many`` share work across the batch
+        (one embedding matrix, shared BM25 postings, one backend round trip);
+        others are called per query. A failing retriever degrades every
+        query in the batch.
+        """
+        if reference_times is None:
+            reference_times = [None] * len(queries)
+        if len(reference_times) != len(queries):
+            raise ValueError("reference_times must align with queries")
+        now = datetime.utcnow()
+        ctxs = [
+            self._parse_temporal_context(query, ref_time or now)
+            for query, ref_time in zip(queries, reference_times)
         ]
+        top_k = self._top_k if top_k is None else top_k
+        depth = self._depth(top_k)
 
-    def query(self, query: str, reference_time: Optional[datetime] = None) -> QueryResponse:
-        ref_time = reference_time or datetime.utcnow()
-        ctx = self._parse_temporal_context(query, ref_time)
+        responses: List[Optional[QueryResponse]] = [None] * len(queries)
+        keys = [self._cache_key(query, ctx, top_k) for query, ctx in zip(queries, ctxs)]
+        pending: List[int] = []
+        for i, (key, ctx) in enumerate(zip(keys, ctxs)):
+            responses[i] = self._cache_lookup(key, ctx)
+            if responses[i] is None:
+                pending.append(i)
+        if not pending:
+            return responses
+        miss_queries = [queries[i] for i in pending]
+        miss_ctxs = [ctxs[i] for i in pending]
 
-        results_lists = [retriever.retrieve(query, ctx) for retriever in self._retrievers]
-        fused = self._temporal_rrf(results_lists, ctx)
-        top = fused[:5]
+        per_query: List[List[Hits]] = [[] for _ in pending]
+        degraded: Dict[str, str] = {}
+        for retriever in self._retrievers:
+            shared = self._shares_store(retriever)
+            try:
+                with stage("retrieve_batch", retriever.name):
+                    retrieve_many = getattr(
+                        retriever, "retrieve_rows_many" if shared else "retrieve_many", None
+                    )
+                    if callable(retrieve_many):
+                        batch = retrieve_many(miss_queries, miss_ctxs, depth)
+                    else:
+                        retrieve = self._fetcher(retriever)
+                        batch = [retrieve(q, ctx, depth) for q, ctx in zip(miss_queries, miss_ctxs)]
+            except Exception as exc:
+                self._degrade(degraded, retriever.name, exc)
+                batch = [[] for _ in pending]
+            for lists, results in zip(per_query, batch):
+                lists.append(results)
+
+        for i, lists in zip(pending, per_query):
+            response = self._respond(queries[i], ctxs[i], lists, dict(degraded), top_k)
+            responses[i] = self._remember(keys[i], response)
+        return responses
 
-        answer = self._synthesize(query, top, ctx)
-        return QueryResponse(answer=answer, sources=top, temporal_context=ctx)
+    async def aquery(
+        self,
+        query: str,
+        reference_time: Optional[datetime] = None,
+        top_k: Optional[int] = None,
+        as_of: Optional[datetime] = None,
+    ) -> QueryResponse:
+        """Async variant of :meth:`query`; retrievers run concurrently on the event loop."""
+        with stage("query"):
+            ref_time = reference_time or datetime.utcnow()
+            ctx = self._parse_temporal_context(query, ref_time)
+            top_k = self._top_k if top_k is None else top_k
+            if as_of is not None:
+                return await asyncio.to_thread(
+                    contextvars.copy_context().run, self._query_as_of, query, ctx, top_k, as_of
+                )
+            key = self._cache_key(query, ctx, top_k)
+            cached = self._cache_lookup(key, ctx)
+            if cached is not None:
+                return cached
+
+            if self._tiers:
+                return self._remember(key, await self._acascade_query(query, ctx, top_k))
+            results_lists, degraded = await self._aretrieve_all(query, ctx, self._depth(top_k))
+            return self._remember(key, self._respond(query, ctx, results_lists, degraded, top_k))
+
+    async def aclose(self) -> None:
+        for retriever in self._retrievers:
+            aclose = getattr(retriever, "aclose", None)
+            if callable(aclose):
+                await aclose()
+        self.close()
 
     def close(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
         for retriever in self._retrievers:
             close = getattr(retriever, "close", None)
             if callable(close):
                 close()
 
-    def _parse_temporal_context(self, query: str, ref_time: datetime) -> TemporalContext:
-        operators: List[str] = []
-        time_start: Optional[datetime] = None
-        time_end: Optional[datetime] = None
-        granularity = "day"
-
-        lower = query.lower()
-        if "before" in lower:
-            operators.append("BEFORE")
-        if "after" in lower:
-            operators.append("AFTER")
-        if "during" in lower:
-            operators.append("DURING")
-        if "between" in lower:
-            operators.append("BETWEEN")
-
-        year_match = re.search(r"(19|20)\d{2}", lower)
-        if year_match:
-            year = int(year_match.group(0))
-            time_start = datetime(year, 1, 1)
-            time_end = datetime(year, 12, 31)
-            granularity = "year"
-
-        month_match = re.search(
-            r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s+((19|20)\d{2})",
-            lower,
+    def _query_as_of(
+        self, query: str, ctx: TemporalContext, top_k: int, as_of: datetime
+    ) -> QueryResponse:
+        """Rank the versions believed at ``as_of`` (not cached: history is per instant).
+
+        Indexes keep superseded and deleted rows as tombstones, so each
+        retriever with ``retrieve_versions`` scores just the believed rows and
+        the lists are fused as usual; at ``as_of=now`` this is a plain query.
+        Retrievers that cannot rank past versions (remote backends, stores of
+        their own, no ``retrieve_versions``) are reported as degraded with
+        reason ``"no_history"``.
+        """
+        horizon = self._history_horizon
+        if horizon is not None and to_epoch(as_of) < to_epoch(horizon):
+            raise ValueError(f"as_of {as_of.isoformat()} is before the history horizon {horizon.isoformat()}")
+        versioned: List[Retriever] = []
+        degraded: Dict[str, str] = {}
+        for retriever in self._retrievers:
+            if self._shares_store(retriever) and hasattr(retriever, "retrieve_versions"):
+                versioned.append(retriever)
+            else:
+                degraded[retriever.name] = "no_history"
+        with stage("retrieve", "history"):
+            rows = self._history.believed_at(as_of)
+            depth = self._depth(top_k)
+            results_lists: List[Hits] = [
+                retriever.retrieve_versions(query, ctx, rows, depth) for retriever in versioned
+            ]
+        return self._respond(query, ctx, results_lists, degraded, top_k)
+
+    def _depth(self, top_k: int) -> Optional[int]:
+        if self._candidate_k is None:
+            return None
+        return max(self._candidate_k, top_k)
+
+    def _cache_key(self, query: str, ctx: TemporalContext, top_k: int) -> Optional[str]:
+        return cache_key(query, ctx, top_k) if self._cache is not None else None
+
+    def _cache_lookup(self, key: Optional[str], ctx: TemporalContext) -> Optional[QueryResponse]:
+        if key is None:
+            return None
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        # Same bucket, but report the caller's own reference time.
+        return replace(cached, temporal_context=ctx)
+
+    def _remember(self, key: Optional[str], response: QueryResponse) -> QueryResponse:
+        # Partial (degraded) answers are not cached so a recovered backend is used again.
+        if key is not None and not response.degraded_sources:
+            self._cache.set(key, response, [source.doc_id for source in response.sources])
+        return response
+
+    def _respond(
+        self,
+        query: str,
+        ctx: TemporalContext,
+        results_lists: List[Hits],
+        degraded: Dict[str, str],
+        top_k: int,
+        fused: Optional[List[FusedRetrievalResult]] = None,
+        skipped: Optional[List[str]] = None,
+    ) -> QueryResponse:
+        if fused is None:
+            with stage("fusion"):
+                fused = self._temporal_rrf(results_lists, ctx, top_k=top_k)
+        top = fused[: max(top_k, 0)]
+        with stage("synthesis"):
+            answer = self._synthesize(query, top, ctx)
+        return QueryResponse(
+            answer=answer,
+            sources=top,
+            temporal_context=ctx,
+            degraded_sources=list(degraded),
+            degraded_reasons=degraded,
+            skipped_sources=skipped or [],
         )
-        if month_match:
-            month_map = {
-                "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
-                "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-            }
-            month = month_map[month_match.group(1)[:3]]
-            year = int(month_match.group(2))
-            month_end = calendar.monthrange(year, month)[1]
-            time_start = datetime(year, month, 1)
-            time_end = datetime(year, month, month_end)
-            granularity = "month"
-
-        return TemporalContext(
-            reference_time=ref_time,
-            operators=operators,
-            time_start=time_start,
-            time_end=time_end,
-            granularity=granularity,
+
+    def cascade_stats(self) -> dict:
+        """Cascaded queries and, per tier, how many of them skipped it."""
+        with self._cascade_lock:
+            counts = self._cascade_counts
+            return {"queries": counts["queries"], "skipped": dict(counts["skipped"])}
+
+    def _resolve_tiers(self, cascade: CascadeConfig) -> List[List[int]]:
+        positions = {retriever.name: i for i, retriever in enumerate(self._retrievers)}
+        tiers: List[List[int]] = []
+        for tier in cascade.tiers:
+            unknown = [name for name in tier if name not in positions]
+            if unknown:
+                raise ValueError(f"cascade names unknown retrievers: {unknown}")
+            tiers.append([positions.pop(name) for name in tier])
+        if positions:
+            tiers.append(sorted(positions.values()))
+        return [tier for tier in tiers if tier]
+
+    def _tier_label(self, tier: List[int]) -> str:
+        return "+".join(self._retrievers[i].name for i in tier)
+
+    def _cascade_decided(
+        self, results_lists: List[Hits], ctx: TemporalContext, top_k: int, remaining: List[List[int]]
+    ) -> Optional[List[FusedRetrievalResult]]:
+        """Fused top-k if ``remaining`` tiers cannot change the top-k set or order, else ``None``.
+
+        A list adds at most its rank-0 score times the document's own temporal
+        boost, so each fused document is bounded by its boost, and documents
+        no list has returned yet by the largest boost for the query window.
+        """
+        if self.fusion.method == "combmnz":
+            return None
+        windowed = bool(ctx.time_start and ctx.time_end)
+        later = [self._retrievers[i] for tier in remaining for i in tier]
+        # What the remaining lists can add per unit of a document's boost.
+        headroom = self._cascade.bound_scale * sum(
+            max_contribution(self.fusion, retriever.name, windowed, boost=1.0) for retriever in later
+        )
+        with stage("fusion"):
+            fusion = self._fuse(results_lists, ctx)
+        if fusion is None or fusion.keys.shape[0] < top_k:
+            return None
+        largest = max_boost(self.fusion, windowed)
+        scores = fusion.scores[fusion.order]
+        if all(self._shares_store(retriever) for retriever in later):
+            reach = scores + headroom * fusion.boosts[fusion.order]
+        else:
+            # Remote results carry their own validity, so their boost is unknown here.
+            reach = scores + headroom * largest
+        # The set is final once no document outside it can pass the k-th ...
+        outside = max(float(reach[top_k:].max(initial=0.0)), headroom * largest)
+        if scores[top_k - 1] <= outside:
+            return None
+        # ... and the order once no document can pass the one ranked above it.
+        if np.any(scores[: top_k - 1] <= reach[1:top_k]):
+            return None
+        return self._materialize(fusion, fusion.order[: top_k + 1])
+
+    def _record_cascade(self, skipped_tiers: List[List[int]]) -> List[str]:
+        with self._cascade_lock:
+            self._cascade_counts["queries"] += 1
+            for tier in skipped_tiers:
+                self._cascade_counts["skipped"][self._tier_label(tier)] += 1
+        return [self._retrievers[i].name for tier in skipped_tiers for i in tier]
+
+    def _cascade_query(self, query: str, ctx: TemporalContext, top_k: int) -> QueryResponse:
+        """Run retriever tiers in order, stopping once the top-k set is decided."""
+        depth = self._depth(top_k)
+        results_lists: List[Hits] = [[] for _ in self._retrievers]
+        degraded: Dict[str, str] = {}
+        fused: Optional[List[FusedRetrievalResult]] = None
+        for position, tier in enumerate(self._tiers):
+            lists, failed = self._retrieve_all(query, ctx, depth, [self._retrievers[i] for i in tier])
+            for i, hits in zip(tier, lists):
+                results_lists[i] = hits
+            degraded.update(failed)
+            remaining = self._tiers[position + 1 :]
+            if remaining:
+                fused = self._cascade_decided(results_lists, ctx, top_k, remaining)
+                if fused is not None:
+                    skipped = self._record_cascade(remaining)
+                    return self._respond(query, ctx, results_lists, degraded, top_k, fused, skipped)
+        self._record_cascade([])
+        return self._respond(query, ctx, results_lists, degraded, top_k)
+
+    async def _acascade_query(self, query: str, ctx: TemporalContext, top_k: int) -> QueryResponse:
+        """Async :meth:`_cascade_query`; ``speculative`` starts all tiers and cancels the rest."""
+        depth = self._depth(top_k)
+
+        def start(tier: List[int]) -> List[asyncio.Future]:
+            return [
+                asyncio.ensure_future(self._arun_retriever(self._retrievers[i], query, ctx, depth))
+                for i in tier
+            ]
+
+        tasks = [start(tier) if self._cascade.speculative else None for tier in self._tiers]
+        results_lists: List[Hits] = [[] for _ in self._retrievers]
+        degraded: Dict[str, str] = {}
+        try:
+            for position, tier in enumerate(self._tiers):
+                running = tasks[position] or start(tier)
+                outcomes = await asyncio.gather(*running, return_exceptions=True)
+                lists, failed = self._collect([self._retrievers[i] for i in tier], outcomes)
+                for i, hits in zip(tier, lists):
+                    results_lists[i] = hits
+                degraded.update(failed)
+                remaining = self._tiers[position + 1 :]
+                if remaining:
+                    fused = self._cascade_decided(results_lists, ctx, top_k, remaining)
+                    if fused is not None:
+                        skipped = self._record_cascade(remaining)
+                        return self._respond(query, ctx, results_lists, degraded, top_k, fused, skipped)
+        finally:
+            for running in tasks:
+                for task in running or ():
+                    task.cancel()
+        self._record_cascade([])
+        return self._respond(query, ctx, results_lists, degraded, top_k)
+
+    def _retrieve_all(
+        self,
+        query: str,
+        ctx: TemporalContext,
+        depth: Optional[int] = None,
+        retrievers: Optional[Sequence[Retriever]] = None,
+    ) -> Tuple[List[Hits], Dict[str, str]]:
+        """Run every retriever (or just ``retrievers``), degrading failed or late ones to empty lists.
+
+        Result lists keep retriever order so fusion is identical in both modes.
+        """
+        retrievers = self._retrievers if retrievers is None else retrievers
+        degraded: Dict[str, str] = {}
+        if not self._parallel or len(retrievers) < 2:
+            results_lists = []
+            for retriever in retrievers:
+                try:
+                    results_lists.append(self._call_retriever(retriever, query, ctx, depth))
+                except Exception as exc:
+                    self._degrade(degraded, retriever.name, exc)
+                    results_lists.append([])
+            return results_lists, degraded
+
+        executor = self._pool()
+        calls: List[Optional[Tuple[Future, _Call]]] = []
+        for retriever in retrievers:
+            deadline = self._retriever_timeouts.get(retriever.name, self._retriever_timeout_s)
+            # Late calls keep their worker until they return; when every worker is
+            # busy for a whole deadline the pool is saturated and the call is shed.
+            if not self._workers.acquire(timeout=deadline):
+                calls.append(None)
+                continue
+            call = _Call()
+            # Copy the caller's context so retriever spans nest under the query span.
+            try:
+                future = executor.submit(
+                    contextvars.copy_context().run, call.run, self._call_retriever, retriever, query, ctx, depth
+                )
+            except BaseException:
+                # e.g. RuntimeError from a pool shut down by close(); keep the permit count whole.
+                self._workers.release()
+                raise
+            future.add_done_callback(lambda _: self._workers.release())
+            calls.append((future, call))
+        results_lists = []
+        for retriever, submitted in zip(retrievers, calls):
+            deadline = self._retriever_timeouts.get(retriever.name, self._retriever_timeout_s)
+            try:
+                if submitted is None:
+                    raise FutureTimeout()
+                future, call = submitted
+                results_lists.append(future.result(None if deadline is None else call.remaining(deadline)))
+            except FutureTimeout:
+                logger.warning("Retriever %s missed its %.3fs deadline", retriever.name, deadline)
+                degraded[retriever.name] = "timeout"
+                results_lists.append([])
+            except Exception as exc:
+                self._degrade(degraded, retriever.name, exc)
+                results_lists.append([])
+        return results_lists, degraded
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._pool_size, thread_name_prefix="tgrag-retrieve"
+                )
+            return self._executor
+
+    async def _aretrieve_all(
+        self, query: str, ctx: TemporalContext, depth: Optional[int] = None
+    ) -> Tuple[List[Hits], Dict[str, str]]:
+        """Async fan-out with the same deadline/degradation rules as :meth:`_retrieve_all`."""
+        outcomes = await asyncio.gather(
+            *(self._arun_retriever(retriever, query, ctx, depth) for retriever in self._retrievers),
+            return_exceptions=True,
         )
+        return self._collect(self._retrievers, outcomes)
+
+    async def _arun_retriever(
+        self, retriever: Retriever, query: str, ctx: TemporalContext, depth: Optional[int]
+    ) -> Hits:
+        aretrieve = getattr(retriever, "aretrieve", None)
+        if callable(aretrieve):
+            call = aretrieve(query, ctx, depth)
+        else:
+            call = asyncio.to_thread(self._fetcher(retriever), query, ctx, depth)
+        deadline = self._retriever_timeouts.get(retriever.name, self._retriever_timeout_s)
+        with stage("retrieve", retriever.name):
+            return await asyncio.wait_for(call, timeout=deadline)
+
+    def _collect(
+        self, retrievers: Sequence[Retriever], outcomes: Sequence[object]
+    ) -> Tuple[List[Hits], Dict[str, str]]:
+        """Split gathered outcomes into result lists and degraded retrievers."""
+        results_lists: List[Hits] = []
+        degraded: Dict[str, str] = {}
+        for retriever, outcome in zip(retrievers, outcomes):
+            if isinstance(outcome, BaseException):
+                if isinstance(outcome, asyncio.CancelledError):
+                    raise outcome
+                self._degrade(degraded, retriever.name, outcome)
+                results_lists.append([])
+            else:
+                results_lists.append(outcome)
+        return results_lists, degraded
+
+    def _degrade(self, degraded: Dict[str, str], name: str, exc: BaseException) -> None:
+        """Record why retriever ``name`` contributed nothing to this answer."""
+        if isinstance(exc, CircuitOpenError):
+            logger.warning("Retriever %s skipped: %s", name, exc)
+            degraded[name] = "circuit_open"
+        elif isinstance(exc, (FutureTimeout, asyncio.TimeoutError)):
+            logger.warning("Retriever %s missed its deadline", name)
+            degraded[name] = "timeout"
+        else:
+            logger.warning("Retriever %s failed", name, exc_info=exc)
+            degraded[name] = "error"
+
+    def backend_status(self) -> Dict[str, dict]:
+        """Resilience state (circuit, attempts, hedges) per retriever that has a policy."""
+        return {
+            retriever.name: retriever.resilience.stats()
+            for retriever in self._retrievers
+            if getattr(retriever, "resilience", None) is not None
+        }
+
+    def _call_retriever(
+        self, retriever: Retriever, query: str, ctx: TemporalContext, depth: Optional[int]
+    ) -> Hits:
+        with stage("retrieve", retriever.name):
+            return self._fetcher(retriever)(query, ctx, depth)
+
+    def _fetcher(self, retriever: Retriever) -> Callable[..., Hits]:
+        # Retrievers over the engine's store return rows; fusion materializes the top k.
+        return retriever.retrieve_rows if self._shares_store(retriever) else retriever.retrieve
+
+    def _parse_temporal_context(self, query: str, ref_time: datetime) -> TemporalContext:
+        with stage("parse"):
+            return parse_temporal_context(query, ref_time)
 
     def _temporal_rrf(
         self,
-        results_lists: Iterable[List[RetrievalResult]],
+        results_lists: Iterable[Hits],
         ctx: TemporalContext,
-        k: int = 60,
+        k: Optional[float] = None,
+        top_k: Optional[int] = None,
+        config: Optional[FusionConfig] = None,
     ) -> List[FusedRetrievalResult]:
-        scores: dict[str, float] = {}
-        source_scores: dict[str, dict[str, float]] = {}
-        doc_map: dict[str, RetrievalResult] = {}
+        """Temporal fusion over every list at once, on flat NumPy arrays.
+
+        Each hit becomes one ``(key, rank, boost, source)`` entry. Keys are rows
+        of the engine's store; results it does not hold (remote backends) get
+        negative keys and keep their own content. Per-key sums use
+        ``np.add.at``, which adds in entry order, so scores and tie order match
+        the sequential formulation exactly. ``config`` (default
+        :attr:`fusion`) picks RRF (``k`` overrides its constant) or
+        CombSUM/CombMNZ over normalized raw scores.
+        """
+        fusion = self._fuse(results_lists, ctx, k, config)
+        if fusion is None:
+            return []
+        order = fusion.order if top_k is None else fusion.order[: max(top_k, 0)]
+        return self._materialize(fusion, order)
+
+    def _fuse(
+        self,
+        results_lists: Iterable[Hits],
+        ctx: TemporalContext,
+        k: Optional[float] = None,
+        config: Optional[FusionConfig] = None,
+    ) -> Optional[_Fusion]:
+        """The array half of :meth:`_temporal_rrf`; ``None`` when no list has a hit."""
+        config = config or self.fusion
+        comb = config.method != "rrf"
+        store = self._docs
+        keys: List[np.ndarray] = []
+        boosts: List[np.ndarray] = []
+        source_ids: List[np.ndarray] = []
+        ranks: List[np.ndarray] = []
+        # Normalized raw scores, gathered only for CombSUM/CombMNZ.
+        normalized: List[np.ndarray] = []
+        source_codes: Dict[str, int] = {}
+        foreign: Dict[str, RetrievalResult] = {}
+        foreign_keys: Dict[str, int] = {}
 
         for results in results_lists:
-            for rank, result in enumerate(results):
-                rrf = 1.0 / (k + rank + 1)
-                temporal_boost = self._temporal_boost(result, ctx)
-                source_weight = 1.2 if result.source == "graph" else 1.0
-                final = rrf * temporal_boost * source_weight
-
-                scores[result.doc_id] = scores.get(result.doc_id, 0.0) + final
-                if result.doc_id not in source_scores:
-                    source_scores[result.doc_id] = {}
-                source_scores[result.doc_id][result.source] = (
-                    source_scores[result.doc_id].get(result.source, 0.0) + final
+            if isinstance(results, RowHits):
+                rows = np.asarray(results.rows, dtype=np.int64)
+                keys.append(rows)
+                boosts.append(
+                    self._temporal_boosts(store.valid_from[rows], store.valid_to[rows], ctx, config)
                 )
-                doc_map[result.doc_id] = result
+                code = source_codes.setdefault(results.source, len(source_codes))
+                source_ids.append(np.full(rows.shape[0], code, dtype=np.int64))
+                if comb:
+                    scores = np.asarray(results.scores, dtype=np.float64)
+                    normalized.append(config.normalize(results.source, scores))
+            else:
+                codes: List[int] = []
+                for result in results:
+                    row = store.row_of(result.doc_id)
+                    if row is None:
+                        foreign[result.doc_id] = result
+                        row = -1 - foreign_keys.setdefault(result.doc_id, len(foreign_keys))
+                    codes.append(row)
+                keys.append(np.asarray(codes, dtype=np.int64))
+                boosts.append(
+                    np.asarray(
+                        [self._temporal_boost(r.valid_from, r.valid_to, ctx, config) for r in results],
+                        dtype=np.float64,
+                    )
+                )
+                source_ids.append(
+                    np.asarray(
+                        [source_codes.setdefault(r.source, len(source_codes)) for r in results],
+                        dtype=np.int64,
+                    )
+                )
+                if comb:
+                    normalized.append(self._normalize_results(results, config))
+            ranks.append(np.arange(keys[-1].shape[0], dtype=np.int64))
+
+        entry_keys = np.concatenate(keys) if keys else np.empty(0, dtype=np.int64)
+        if not entry_keys.size:
+            return None
+        entry_sources = np.concatenate(source_ids)
+        if comb:
+            base = np.concatenate(normalized)
+        else:
+            base = 1.0 / ((config.rrf_k if k is None else k) + np.concatenate(ranks) + 1)
+        weights = np.asarray([config.weight(name) for name in source_codes], dtype=np.float64)
+        entry_boosts = np.concatenate(boosts)
+        final = base * entry_boosts * weights[entry_sources]
 
-        sorted_ids = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        unique, first_seen, owner = np.unique(entry_keys, return_index=True, return_inverse=True)
+        scores = np.zeros(unique.shape[0], dtype=np.float64)
+        np.add.at(scores, owner, final)
+        if config.method == "combmnz":
+            scores *= np.bincount(owner, minlength=unique.shape[0])
+        doc_boosts = np.empty(unique.shape[0], dtype=np.float64)
+        doc_boosts[owner] = entry_boosts
+        return _Fusion(
+            keys=unique,
+            scores=scores,
+            boosts=doc_boosts,
+            # Best score first, ties in order of first appearance (as a stable sort would).
+            order=np.lexsort((first_seen, -scores)),
+            final=final,
+            owner=owner,
+            entry_sources=entry_sources,
+            names={code: name for name, code in source_codes.items()},
+            foreign={-1 - code: foreign[doc_id] for doc_id, code in foreign_keys.items()},
+        )
+
+    def _materialize(self, fusion: _Fusion, order: np.ndarray) -> List[FusedRetrievalResult]:
+        """Fused results for the documents at ``order`` positions of ``fusion``."""
+        store = self._docs
+        owner, final, entry_sources, names = fusion.owner, fusion.final, fusion.entry_sources, fusion.names
+        # Entries grouped by key, in entry order within a group (stable sort),
+        # so per-source sums add in the same order as ``scores``.
+        by_owner = np.argsort(owner, kind="stable")
+        bounds = np.searchsorted(owner[by_owner], np.arange(fusion.keys.shape[0] + 1))
         fused_results: List[FusedRetrievalResult] = []
-        for doc_id, fused_score in sorted_ids:
-            base = doc_map[doc_id]
-            per_source = source_scores.get(doc_id, {})
+        for idx in order.tolist():
+            per_source: Dict[str, float] = {}
+            for pos in by_owner[bounds[idx] : bounds[idx + 1]].tolist():
+                name = names[int(entry_sources[pos])]
+                per_source[name] = per_source.get(name, 0.0) + float(final[pos])
+            key = int(fusion.keys[idx])
+            if key < 0:
+                base = fusion.foreign[key]
+                doc_id, content = base.doc_id, base.content
+                valid_from, valid_to = base.valid_from, base.valid_to
+                recorded = (base.transaction_from, base.transaction_to)
+            else:
+                doc_id, content = store.doc_id(key), store.content(key)
+                valid_from = from_epoch(int(store.valid_from[key]))
+                valid_to = from_epoch(int(store.valid_to[key]))
+                recorded = (
+                    from_epoch(int(store.transaction_from[key])),
+                    from_epoch(int(store.transaction_to[key])),
+                )
             fused_results.append(
                 FusedRetrievalResult(
-                    doc_id=base.doc_id,
-                    content=base.content,
+                    doc_id=doc_id,
+                    content=content,
                     sources=sorted(per_source.keys()),
-                    fused_score=fused_score,
+                    fused_score=float(fusion.scores[idx]),
                     source_scores=per_source,
-                    valid_from=base.valid_from,
-                    valid_to=base.valid_to,
+                    valid_from=valid_from,
+                    valid_to=valid_to,
+                    transaction_from=recorded[0],
+                    transaction_to=recorded[1],
                 )
             )
         return fused_results
 
-    def _temporal_boost(self, result: RetrievalResult, ctx: TemporalContext) -> float:
+    @staticmethod
+    def _normalize_results(results: List[RetrievalResult], config: FusionConfig) -> np.ndarray:
+        """Per-source normalized raw scores of a materialized list (sources may mix)."""
+        raw = np.asarray([r.score for r in results], dtype=np.float64)
+        labels = np.asarray([r.source for r in results], dtype=object)
+        out = np.empty_like(raw)
+        for source in dict.fromkeys(labels.tolist()):
+            mask = labels == source
+            out[mask] = config.normalize(source, raw[mask])
+        return out
+
+    def _temporal_boosts(
+        self,
+        valid_from: np.ndarray,
+        valid_to: np.ndarray,
+        ctx: TemporalContext,
+        config: Optional[FusionConfig] = None,
+    ) -> np.ndarray:
+        """:meth:`_temporal_boost` over epoch-second arrays.
+
+        Day offsets are integer arithmetic on microseconds (``timedelta.days``
+        floors); ``exp`` runs once per distinct offset through ``math.exp`` so
+        boosts are bit-identical to the scalar path.
+        """
+        config = config or self.fusion
+        boosts = np.ones(valid_from.shape[0], dtype=np.float64)
+        bounded = valid_from > OPEN_START
+        if not bounded.any():
+            return boosts
+        ref = ctx.reference_time
+        ref_us = to_epoch(ref) * _US + ref.microsecond
+        days = np.abs((ref_us - valid_from[bounded] * _US) // _US_PER_DAY)
+        distinct, which = np.unique(days, return_inverse=True)
+        scale = config.recency_days
+        recency = config.recency_floor + np.asarray(
+            [math.exp(-d / scale) for d in distinct.tolist()]
+        )[which]
+
+        if ctx.time_start and ctx.time_end:
+            # Whole-second bounds: ``vf <= end`` floors ``end``, ``vt >= start`` ceils ``start``.
+            end = to_epoch(ctx.time_end)
+            start = to_epoch(ctx.time_start) + (1 if ctx.time_start.microsecond else 0)
+            overlaps = (valid_from[bounded] <= end) & (valid_to[bounded] >= start)
+            recency = recency * np.where(overlaps, config.in_window, config.out_of_window)
+        boosts[bounded] = recency
+        return boosts
+
+    def _temporal_boost(
+        self,
+        valid_from: Optional[datetime],
+        valid_to: Optional[datetime],
+        ctx: TemporalContext,
+        config: Optional[FusionConfig] = None,
+    ) -> float:
         """Soft filter: penalize out-of-window results without dropping them."""
-        if result.valid_from is None:
+        if valid_from is None:
             return 1.0
+        config = config or self.fusion
         ref = ctx.reference_time
-        days = abs((ref - result.valid_from).days)
-        recency_boost = 0.5 + math.exp(-days / 365.0)
+        days = abs((ref - valid_from).days)
+        recency_boost = config.recency_floor + math.exp(-days / config.recency_days)
 
         window_factor = 1.0
         if ctx.time_start and ctx.time_end:
-            valid_to = result.valid_to or datetime.max
-            overlaps = result.valid_from <= ctx.time_end and valid_to >= ctx.time_start
-            window_factor = 1.2 if overlaps else 0.35
+            overlaps = valid_from <= ctx.time_end and (valid_to or datetime.max) >= ctx.time_start
+            window_factor = config.in_window if overlaps else config.out_of_window
 
         return recency_boost * window_factor
 
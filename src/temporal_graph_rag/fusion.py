@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+FUSION_METHODS = ("rrf", "combsum", "combmnz")
+
+
+@dataclass(frozen=True)
+class FusionConfig:
+    """Tunable knobs of the engine's temporal fusion.
+
+    ``method="rrf"`` scores an entry ``1 / (rrf_k + rank + 1)``.
+    ``"combsum"`` uses the retriever's raw score normalized to ``[0, 1]``
+    (by the cached ``normalization`` range of its source, else by its own
+    list's min-max), and ``"combmnz"`` further multiplies each document's
+    sum by the number of lists that returned it. Every entry is scaled by
+    its source weight (``weights``, else ``default_weight``) and a temporal
+    boost of ``recency_floor + exp(-days / recency_days)``, times
+    ``in_window`` / ``out_of_window`` when the query has a window. The
+    defaults reproduce the original fixed fusion.
+    """
+
+    method: str = "rrf"
+    rrf_k: float = 60
+    weights: Dict[str, float] = field(default_factory=lambda: {"graph": 1.2})
+    default_weight: float = 1.0
+    recency_floor: float = 0.5
+    recency_days: float = 365.0
+    in_window: float = 1.2
+    out_of_window: float = 0.35
+    # Per-source raw score range ``(lo, hi)`` mapped to [0, 1] by CombSUM/CombMNZ.
+    normalization: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.method not in FUSION_METHODS:
+            raise ValueError(f"method must be one of {FUSION_METHODS}, got {self.method!r}")
+
+    def weight(self, source: str) -> float:
+        return self.weights.get(source, self.default_weight)
+
+    def normalize(self, source: str, scores: np.ndarray) -> np.ndarray:
+        """Raw scores of one list mapped to ``[0, 1]``."""
+        bounds = self.normalization.get(source)
+        if bounds is None:
+            if not scores.size:
+                return scores
+            bounds = (float(scores.min()), float(scores.max()))
+        lo, hi = bounds
+        if hi <= lo:
+            return np.ones_like(scores)
+        return np.clip((scores - lo) / (hi - lo), 0.0, 1.0)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["normalization"] = {name: list(bounds) for name, bounds in self.normalization.items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FusionConfig":
+        data = dict(data)
+        data["normalization"] = {
+            name: (float(lo), float(hi)) for name, (lo, hi) in data.get("normalization", {}).items()
+        }
+        return cls(**data)
+
+    def save(self, path: Union[str, Path]) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "FusionConfig":
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+
+def score_ranges(
+    scores_by_source: Dict[str, Sequence[float]], quantiles: Tuple[float, float] = (0.05, 0.95)
+) -> Dict[str, Tuple[float, float]]:
+    """Robust ``(lo, hi)`` raw-score range per source, for :attr:`FusionConfig.normalization`."""
+    ranges = {}
+    for source, scores in scores_by_source.items():
+        if len(scores):
+            lo, hi = np.quantile(np.asarray(scores, dtype=np.float64), quantiles)
+            ranges[source] = (float(lo), float(hi))
+    return ranges
+
+
+# Coordinate-ascent search space: multiplicative steps around the current value.
+_STEPS = (0.5, 0.8, 1.25, 2.0)
+
+
+def optimize(
+    objective: Callable[[FusionConfig], float],
+    start: Optional[FusionConfig] = None,
+    sources: Sequence[str] = ("graph", "dense", "sparse"),
+    methods: Sequence[str] = FUSION_METHODS,
+    rounds: int = 3,
+) -> Tuple[FusionConfig, float]:
+    """Fit a config maximizing ``objective`` by coordinate ascent, per fusion method.
+
+    Each round tries scaling every source weight, ``rrf_k`` and the
+    temporal factors by a few fixed steps, keeping any strict improvement.
+    ``objective`` should fuse cached retrieval lists (no retrieval per call).
+    Returns the best config and its objective value.
+    """
+    start = start or FusionConfig()
+    best, best_score = start, objective(start)
+    for method in methods:
+        config = replace(start, method=method)
+        score = objective(config)
+        for _ in range(rounds):
+            improved = False
+            for name in _knobs(method, sources):
+                for step in _STEPS:
+                    candidate = _scaled(config, name, step)
+                    value = objective(candidate)
+                    if value > score:
+                        config, score, improved = candidate, value, True
+            if not improved:
+                break
+        if score > best_score:
+            best, best_score = config, score
+    return best, best_score
+
+
+def _knobs(method: str, sources: Sequence[str]) -> List[str]:
+    knobs = [f"weight:{source}" for source in sources]
+    if method == "rrf":
+        knobs.append("rrf_k")
+    return knobs + ["recency_days", "in_window", "out_of_window"]
+
+
+def _scaled(config: FusionConfig, knob: str, step: float) -> FusionConfig:
+    if knob.startswith("weight:"):
+        source = knob.split(":", 1)[1]
+        return replace(config, weights={**config.weights, source: config.weight(source) * step})
+    return replace(config, **{knob: getattr(config, knob) * step})
+
+
+def max_boost(config: FusionConfig, windowed: bool) -> float:
+    """Largest temporal boost any entry can get (recency at zero days, best window factor)."""
+    factor = max(config.in_window, config.out_of_window) if windowed else 1.0
+    # Entries without a valid_from are never boosted (1.0).
+    return max(1.0, (config.recency_floor + 1.0) * factor)
+
+
+def max_contribution(
+    config: FusionConfig, source: str, windowed: bool, boost: Optional[float] = None
+) -> float:
+    """Upper bound on what one list from ``source`` can add to a document's fused score.
+
+    ``boost`` is the document's own temporal boost when known (every list
+    boosts a document alike); the default is the largest any entry can get.
+    """
+    best = 1.0 / (config.rrf_k + 1) if config.method == "rrf" else 1.0
+    return best * config.weight(source) * (max_boost(config, windowed) if boost is None else boost)
+
+
+@dataclass(frozen=True)
+class CascadeConfig:
+    """Tiered retrieval: run ``tiers`` of retriever names in order, stopping early.
+
+    After each tier the engine bounds what the remaining retrievers could
+    still add to each document (:func:`max_contribution` at the document's
+    own boost, or the largest one for documents not yet returned, summed
+    and scaled by ``bound_scale``). Later tiers are skipped once no document
+    outside the top k can pass the k-th and none inside it can pass the one
+    above it (with ``speculative``, the async path starts
+    every tier at once and cancels the rest instead). ``bound_scale=1``
+    keeps the top-k set and order identical to a full run; smaller values
+    trade exactness for more skips. ``fused_score`` and ``source_scores``
+    still leave out the skipped tiers (``QueryResponse.skipped_sources``),
+    so they are partial sums. Retrievers not named in any tier form a last
+    tier. CombMNZ has no additive bound, so it never stops early.
+    """
+
+    tiers: Tuple[Tuple[str, ...], ...] = ()
+    bound_scale: float = 1.0
+    speculative: bool = False
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tiers", tuple(tuple(tier) for tier in self.tiers))
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from temporal_graph_rag.arrays import GrowableArray, load_array
+from temporal_graph_rag.index.segments import SegmentedPostings
+
+
+class BM25Index:
+    """Okapi BM25 over a term-major CSR posting matrix.
+
+    Scores match ``rank_bm25.BM25Okapi`` bit for bit (same IDF floor, same
+    per-term accumulation order), but a query only touches the postings of
+    its own terms instead of every document.
+
+    Postings (row ``indices`` and term frequencies ``data``) are a
+    :class:`SegmentedPostings` keyed by term, so :meth:`add` appends a delta
+    segment and :meth:`delete` tombstones a row. Document lengths and
+    frequencies are growable columns updated per write in O(postings);
+    idf and avgdl cover live rows only and are recomputed (vectorized) on
+    the next query, and length normalisation is computed for just the
+    scored rows. Tombstoned postings are kept: ``include_deleted`` scores past versions
+    too, with statistics over every version still kept (:meth:`purge` drops
+    old ones). Row ids never change.
+    """
+
+    _SNAPSHOT_ARRAYS = ("doc_len", "doc_freq", "idf")
+
+    def __init__(
+        self,
+        corpus: Iterable[Sequence[str]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+    ) -> None:
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.average_idf = 0.0
+
+        self.vocab: dict[str, int] = {}
+        self.corpus_size = 0
+        self.postings = SegmentedPostings(("indices", "data"))
+        self.avgdl = 0.0
+        self.idf = np.zeros(0, dtype=np.float64)
+        self._doc_len = GrowableArray(np.zeros(0, dtype=np.int64))
+        # Live documents per term, kept in step by add/delete.
+        self._doc_freq = GrowableArray(np.zeros(0, dtype=np.int64))
+        self._n_deleted = 0
+        self._n_purged = 0
+        self._live_len = 0
+        self._total_len = 0
+        self._stale = False
+        # ``(idf, avgdl)`` over every version, for ``include_deleted``; reset by add.
+        self._history: Optional[Tuple[np.ndarray, float]] = None
+        self.add(corpus)
+
+    @property
+    def doc_len(self) -> np.ndarray:
+        return self._doc_len.values
+
+    @property
+    def doc_freq(self) -> np.ndarray:
+        return self._doc_freq.values
+
+    def add(self, corpus: Iterable[Sequence[str]]) -> range:
+        """Append documents and return their row ids. Cost is O(new postings), amortized."""
+        vocab = self.vocab
+        first_row = self._doc_len.size
+        doc_len: List[int] = []
+        term_ids: List[int] = []
+        doc_ids: List[int] = []
+        freqs: List[int] = []
+        for row, tokens in enumerate(corpus, start=first_row):
+            doc_len.append(len(tokens))
+            counts: dict[int, int] = {}
+            for token in tokens:
+                term = vocab.setdefault(token, len(vocab))
+                counts[term] = counts.get(term, 0) + 1
+            term_ids.extend(counts.keys())
+            doc_ids.extend([row] * len(counts))
+            freqs.extend(counts.values())
+        if not doc_len:
+            return range(first_row, first_row)
+
+        terms = np.asarray(term_ids, dtype=np.int64)
+        self._doc_freq.extend(np.zeros(len(vocab) - self._doc_freq.size, dtype=np.int64))
+        seen, counts = np.unique(terms, return_counts=True)
+        self._doc_freq.writable()[seen] += counts
+        self._doc_len.extend(np.asarray(doc_len, dtype=np.int64))
+        self._live_len += sum(doc_len)
+        self._total_len += sum(doc_len)
+        self.corpus_size = self._doc_len.size - self._n_deleted
+        self.postings.append(
+            terms,
+            [np.asarray(doc_ids, dtype=np.int64), np.asarray(freqs, dtype=np.int64)],
+            self._doc_len.size,
+        )
+        self._stale = True
+        self._history = None
+        return range(first_row, self._doc_len.size)
+
+    def delete(self, row: int, tokens: Sequence[str]) -> None:
+        """Tombstone ``row``; ``tokens`` must be the ones it was added with (O(doc))."""
+        if self.postings.deleted[row]:
+            return
+        self.postings.delete([row])
+        self._n_deleted += 1
+        self._live_len -= int(self.doc_len[row])
+        self.corpus_size -= 1
+        self._doc_freq.writable()[[self.vocab[token] for token in set(tokens)]] -= 1
+        self._stale = True
+
+    def purge(self, rows: Sequence[int]) -> None:
+        """Drop deleted ``rows`` from history too, postings and all-version statistics alike."""
+        purged = self.postings.purge(rows)
+        if purged.size:
+            self._n_purged += int(purged.shape[0])
+            self._total_len -= int(self.doc_len[purged].sum())
+            self._history = None
+
+    def save_snapshot(self, directory: Union[str, Path]) -> None:
+        """Write merged postings and fresh statistics as ``.npy`` files plus metadata."""
+        directory = Path(directory)
+        self.postings.save(directory)
+        if self._stale:
+            self._refresh()
+        for name in self._SNAPSHOT_ARRAYS:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+        meta = {
+            "k1": self.k1,
+            "b": self.b,
+            "epsilon": self.epsilon,
+            "average_idf": self.average_idf,
+            "avgdl": self.avgdl,
+            "corpus_size": self.corpus_size,
+            "n_deleted": self._n_deleted,
+            "n_purged": self._n_purged,
+            "live_len": self._live_len,
+            "total_len": self._total_len,
+        }
+        (directory / "meta.json").write_text(json.dumps(meta))
+        (directory / "vocab.json").write_text(json.dumps(list(self.vocab)))
+
+    @classmethod
+    def open_snapshot(cls, directory: Union[str, Path], mmap: bool = True) -> "BM25Index":
+        """Open a snapshot; postings are memory-mapped and ready to score (no refresh)."""
+        directory = Path(directory)
+        meta = json.loads((directory / "meta.json").read_text())
+        index = cls.__new__(cls)
+        index.k1, index.b, index.epsilon = meta["k1"], meta["b"], meta["epsilon"]
+        index.average_idf = meta["average_idf"]
+        index.avgdl = meta["avgdl"]
+        index.corpus_size = meta["corpus_size"]
+        index._n_deleted = meta["n_deleted"]
+        index._n_purged = meta["n_purged"]
+        index._live_len = meta["live_len"]
+        index._total_len = meta["total_len"]
+        terms = json.loads((directory / "vocab.json").read_text())
+        index.vocab = dict(zip(terms, range(len(terms))))
+        index.idf = load_array(directory / "idf.npy", mmap)
+        # Growable columns copy a mapped array on their first write.
+        index._doc_len = GrowableArray(load_array(directory / "doc_len.npy", mmap))
+        index._doc_freq = GrowableArray(load_array(directory / "doc_freq.npy", mmap))
+        index.postings = SegmentedPostings.open(directory, ("indices", "data"), mmap)
+        index._stale = False
+        index._history = None
+        return index
+
+    def _refresh(self) -> None:
+        self.avgdl = self._live_len / self.corpus_size if self.corpus_size else 0.0
+        self.idf, self.average_idf = self._compute_idf(self.doc_freq, self.corpus_size)
+        self._stale = False
+
+    def _history_stats(self) -> Tuple[np.ndarray, float]:
+        """``(idf, avgdl)`` over every version still kept, tombstoned rows included."""
+        if self._history is None:
+            corpus_size = self._doc_len.size - self._n_purged
+            # Each (term, row) is one posting, so posting counts are document frequencies.
+            doc_freq = np.zeros(len(self.vocab), dtype=np.int64)
+            counts = self.postings.key_counts()
+            doc_freq[: counts.shape[0]] = counts
+            idf, _ = self._compute_idf(doc_freq, corpus_size)
+            self._history = (idf, self._total_len / corpus_size if corpus_size else 0.0)
+        return self._history
+
+    def _compute_idf(self, doc_freq: np.ndarray, corpus_size: int) -> Tuple[np.ndarray, float]:
+        """``(idf, average_idf)`` for ``corpus_size`` documents."""
+        idf = np.zeros(doc_freq.shape[0], dtype=np.float64)
+        # Terms only in deleted rows are skipped; rank_bm25 would not know them.
+        known = np.flatnonzero(doc_freq)
+        if not known.size:
+            return idf, 0.0
+        freq = doc_freq[known]
+        # Frequencies take few distinct values, so scalar math.log runs once per
+        # value (bit-identical to rank_bm25) and the rest is a table lookup.
+        # cumsum adds in vocabulary order like its running sum, unlike np.sum.
+        distinct = np.flatnonzero(np.bincount(freq))
+        table = np.zeros(int(distinct[-1]) + 1, dtype=np.float64)
+        table[distinct] = [math.log(corpus_size - f + 0.5) - math.log(f + 0.5) for f in distinct.tolist()]
+        values = table[freq]
+        average_idf = float(np.cumsum(values)[-1]) / known.shape[0]
+        values[values < 0] = self.epsilon * average_idf
+        idf[known] = values
+        return idf, average_idf
+
+    def score(
+        self,
+        tokens: Sequence[str],
+        rows: Optional[np.ndarray] = None,
+        term_cache: Optional[Dict[int, Tuple[np.ndarray, np.ndarray]]] = None,
+        include_deleted: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return ``(rows, scores)`` for docs matching at least one query token.
+
+        ``rows`` optionally restricts scoring to a sorted array of candidate rows.
+        ``term_cache`` shares per-term contributions across a batch of queries.
+        ``include_deleted`` also scores tombstoned rows, under all-version statistics.
+        """
+        if include_deleted:
+            term_cache = None  # cached contributions use live statistics
+        if self._stale:
+            self._refresh()
+        hit_rows: List[np.ndarray] = []
+        contribs: List[np.ndarray] = []
+        for token in tokens:
+            term = self.vocab.get(token)
+            if term is None:
+                continue
+            if term_cache is not None and term in term_cache:
+                docs, contrib = term_cache[term]
+            else:
+                docs, contrib = self._term_contributions(term, include_deleted)
+                if term_cache is not None:
+                    term_cache[term] = (docs, contrib)
+            if rows is not None:
+                keep = _isin_sorted(docs, rows)
+                docs, contrib = docs[keep], contrib[keep]
+            hit_rows.append(docs)
+            contribs.append(contrib)
+
+        if not hit_rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        matched, inverse = np.unique(np.concatenate(hit_rows), return_inverse=True)
+        scores = np.zeros(matched.shape[0], dtype=np.float64)
+        # add.at accumulates in query-token order, like BM25Okapi.get_scores.
+        np.add.at(scores, inverse, np.concatenate(contribs))
+        return matched, scores
+
+    def top_k(
+        self,
+        tokens: Sequence[str],
+        k: Optional[int] = None,
+        rows: Optional[np.ndarray] = None,
+        term_cache: Optional[Dict[int, Tuple[np.ndarray, np.ndarray]]] = None,
+        include_deleted: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Best ``k`` matches ordered by score desc, ties broken by row id."""
+        matched, scores = self.score(tokens, rows, term_cache, include_deleted)
+        if k is not None and k < matched.shape[0]:
+            if k <= 0:
+                return matched[:0], scores[:0]
+            part = np.argpartition(-scores, k - 1)[:k]
+            threshold = scores[part].min()
+            above = np.flatnonzero(scores > threshold)
+            ties = np.flatnonzero(scores == threshold)[: k - above.shape[0]]
+            keep = np.concatenate([above, ties])
+            matched, scores = matched[keep], scores[keep]
+        order = np.lexsort((matched, -scores))
+        return matched[order], scores[order]
+
+    def top_k_many(
+        self,
+        token_lists: Sequence[Sequence[str]],
+        k: Optional[int] = None,
+        rows: Optional[Sequence[Optional[np.ndarray]]] = None,
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """:meth:`top_k` for a batch; each distinct term's postings are scored once."""
+        term_cache: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        rows = rows or [None] * len(token_lists)
+        return [
+            self.top_k(tokens, k, candidate_rows, term_cache)
+            for tokens, candidate_rows in zip(token_lists, rows)
+        ]
+
+    def _term_contributions(self, term: int, include_deleted: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        docs, tf = self.postings.lookup(term)
+        if include_deleted:
+            idf, avgdl = self._history_stats()
+        else:
+            if self._n_deleted:
+                live = ~self.postings.deleted[docs]
+                docs, tf = docs[live], tf[live]
+            idf, avgdl = self.idf, self.avgdl
+        # Length normalisation for just these rows, in rank_bm25's operation order.
+        norm = self.k1 * (1 - self.b + self.b * self.doc_len[docs] / avgdl)
+        return docs, idf[term] * (tf * (self.k1 + 1) / (tf + norm))
+
+
+def _isin_sorted(values: np.ndarray, sorted_rows: np.ndarray) -> np.ndarray:
+    if not sorted_rows.size:
+        return np.zeros(values.shape[0], dtype=bool)
+    pos = np.searchsorted(sorted_rows, values)
+    pos[pos == sorted_rows.shape[0]] = 0
+    return sorted_rows[pos] == values
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import json
+import re
+import zlib
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from temporal_graph_rag.arrays import GrowableArray, load_array
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def hashing_embedder(dim: int = 256) -> Callable[[str], np.ndarray]:
+    """Dependency-free signed feature-hashing embedder.
+
+    Useful as a deterministic stand-in when no embedding model is available
+    (tests, benchmarks, air-gapped demos). Uses crc32 so vectors are stable
+    across processes, unlike ``hash()``.
+    """
+
+    def embed(text: str) -> np.ndarray:
+        vec = np.zeros(dim, dtype=np.float32)
+        for token in _TOKEN_RE.findall(text.lower()):
+            h = zlib.crc32(token.encode("utf-8"))
+            vec[h % dim] += 1.0 if (h >> 31) & 1 else -1.0
+        return vec
+
+    return embed
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _top_k_rows(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` largest scores, best first (ties by index)."""
+    if k < scores.shape[0]:
+        part = np.argpartition(-scores, k - 1)[:k]
+    else:
+        part = np.arange(scores.shape[0])
+    return part[np.lexsort((part, -scores[part]))]
+
+
+class DenseIndex:
+    """Cosine-similarity index over a contiguous float32 embedding matrix.
+
+    Brute force is one matmul plus ``argpartition``. ``train_ivf`` adds an
+    inverted-file layer (k-means coarse quantizer) so queries only scan the
+    ``nprobe`` closest clusters on corpora too large for brute force.
+
+    Row ids are stable: :meth:`delete` tombstones rows, and once more than
+    ``compact_ratio`` of the matrix is dead it is compacted behind an
+    id mapping, so callers never renumber.
+    """
+
+    def __init__(
+        self, matrix: np.ndarray, normalized: bool = False, compact_ratio: float = 0.25
+    ) -> None:
+        if matrix.ndim != 2:
+            raise ValueError("matrix must be 2-D (rows x dim)")
+        self.matrix = matrix if normalized else _normalize(matrix)
+        self.compact_ratio = compact_ratio
+        self.centroids: Optional[np.ndarray] = None
+        self.list_ptr: Optional[np.ndarray] = None
+        self.list_rows: Optional[np.ndarray] = None
+        # Rows below this are bucketed in the IVF lists; later appends are scanned.
+        self._ivf_rows = 0
+        # Over-allocated backing store for appends; ``matrix`` is a view of its prefix.
+        self._storage: Optional[np.ndarray] = None
+        # Physical matrix row -> row id, row id -> physical row (-1 once deleted),
+        # as growable columns so appends are amortized O(rows) too.
+        n = self.matrix.shape[0]
+        self._row_ids = GrowableArray(np.arange(n, dtype=np.int64))
+        self._physical = GrowableArray(np.arange(n, dtype=np.int64))
+        self._live = GrowableArray(np.ones(n, dtype=bool))
+        self._n_dead = 0
+
+    @classmethod
+    def from_texts(
+        cls, texts: Iterable[str], embedding_fn: Callable[[str], Iterable[float]]
+    ) -> "DenseIndex":
+        vectors = [np.asarray(list(embedding_fn(text)), dtype=np.float32) for text in texts]
+        if not vectors:
+            raise ValueError("cannot build a DenseIndex from an empty corpus")
+        return cls(np.vstack(vectors))
+
+    @property
+    def dim(self) -> int:
+        return int(self.matrix.shape[1])
+
+    def __len__(self) -> int:
+        """Row ids handed out so far, deleted ones included."""
+        return self._physical.size
+
+    def add(self, vectors: np.ndarray) -> range:
+        """Append rows and return their row ids (amortized O(rows) via capacity doubling).
+
+        Rows added after :meth:`train_ivf` are searched exhaustively on the IVF
+        path until the next ``train_ivf``.
+        """
+        new = _normalize(np.atleast_2d(np.asarray(vectors, dtype=np.float32)))
+        if new.shape[1] != self.dim:
+            raise ValueError(f"expected {self.dim}-d vectors, got {new.shape[1]}")
+        n = self.matrix.shape[0]
+        need = n + new.shape[0]
+        if self._storage is None or need > self._storage.shape[0]:
+            storage = np.empty((max(need, 2 * n, 64), self.dim), dtype=np.float32)
+            storage[:n] = self.matrix
+            self._storage = storage
+        self._storage[n:need] = new
+        self.matrix = self._storage[:need]
+
+        first = len(self)
+        ids = np.arange(first, first + new.shape[0], dtype=np.int64)
+        self._row_ids.extend(ids)
+        self._physical.extend(np.arange(n, need, dtype=np.int64))
+        self._live.extend(np.ones(new.shape[0], dtype=bool))
+        return range(first, len(self))
+
+    def delete(self, rows: Iterable[int]) -> None:
+        """Tombstone row ids; compacts once dead rows exceed ``compact_ratio``."""
+        rows = np.unique(np.asarray(list(rows), dtype=np.int64))
+        # Copy-on-write for id maps opened from a memory-mapped snapshot.
+        physical_of, live = self._physical.writable(), self._live.writable()
+        physical = physical_of[rows]
+        physical = physical[physical >= 0]
+        live[physical] = False
+        physical_of[rows] = -1
+        self._n_dead += int(physical.shape[0])
+        if self._n_dead > self.compact_ratio * self.matrix.shape[0]:
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop dead rows from the matrix (and IVF lists); row ids are unchanged."""
+        if not self._n_dead:
+            return
+        keep = self._live.values
+        new_position = np.cumsum(keep) - 1
+        if self.centroids is not None:
+            owner = np.repeat(np.arange(self.centroids.shape[0]), np.diff(self.list_ptr))
+            alive = keep[self.list_rows]
+            self.list_rows = new_position[self.list_rows[alive]]
+            self.list_ptr = np.zeros(self.centroids.shape[0] + 1, dtype=np.int64)
+            np.cumsum(
+                np.bincount(owner[alive], minlength=self.centroids.shape[0]), out=self.list_ptr[1:]
+            )
+            self._ivf_rows = int(keep[: self._ivf_rows].sum())
+        self.matrix = np.ascontiguousarray(self.matrix[keep])
+        self._storage = self.matrix
+        row_ids = self._row_ids.values[keep]
+        physical = np.full(self._physical.size, -1, dtype=np.int64)
+        physical[row_ids] = np.arange(row_ids.shape[0], dtype=np.int64)
+        self._row_ids = GrowableArray(row_ids)
+        self._physical = GrowableArray(physical)
+        self._live = GrowableArray(np.ones(row_ids.shape[0], dtype=bool))
+        self._n_dead = 0
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the normalized matrix as ``.npy`` so :meth:`load` can memory-map it."""
+        if self._n_dead or not np.array_equal(self._row_ids.values, self._physical.values):
+            raise ValueError("save() needs an index without deleted rows")
+        np.save(Path(path), self.matrix)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True) -> "DenseIndex":
+        matrix = np.load(Path(path), mmap_mode="r" if mmap else None)
+        return cls(matrix, normalized=True)
+
+    def save_snapshot(self, directory: Union[str, Path]) -> None:
+        """Write the matrix, id maps and IVF lists as ``.npy`` files; deletes are kept."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "matrix.npy", self.matrix)
+        np.save(directory / "row_ids.npy", self._row_ids.values)
+        np.save(directory / "physical.npy", self._physical.values)
+        np.save(directory / "live.npy", self._live.values)
+        if self.centroids is not None:
+            np.save(directory / "centroids.npy", self.centroids)
+            np.save(directory / "list_ptr.npy", self.list_ptr)
+            np.save(directory / "list_rows.npy", self.list_rows)
+        meta = {
+            "compact_ratio": self.compact_ratio,
+            "n_dead": self._n_dead,
+            "ivf_rows": self._ivf_rows,
+            "ivf": self.centroids is not None,
+        }
+        (directory / "meta.json").write_text(json.dumps(meta))
+
+    @classmethod
+    def open_snapshot(cls, directory: Union[str, Path], mmap: bool = True) -> "DenseIndex":
+        directory = Path(directory)
+        meta = json.loads((directory / "meta.json").read_text())
+        index = cls.__new__(cls)
+        index.matrix = load_array(directory / "matrix.npy", mmap)
+        index.compact_ratio = meta["compact_ratio"]
+        index._storage = None
+        index._row_ids = GrowableArray(load_array(directory / "row_ids.npy", mmap))
+        index._physical = GrowableArray(load_array(directory / "physical.npy", mmap))
+        index._live = GrowableArray(load_array(directory / "live.npy", mmap))
+        index._n_dead = meta["n_dead"]
+        index._ivf_rows = meta["ivf_rows"]
+        index.centroids = index.list_ptr = index.list_rows = None
+        if meta["ivf"]:
+            index.centroids = load_array(directory / "centroids.npy", mmap=False)
+            index.list_ptr = load_array(directory / "list_ptr.npy", mmap=False)
+            index.list_rows = load_array(directory / "list_rows.npy", mmap)
+        return index
+
+    def train_ivf(
+        self, nlist: int, iterations: int = 10, sample_size: int = 65_536, seed: int = 0
+    ) -> None:
+        """Fit ``nlist`` k-means centroids and bucket every row by nearest centroid."""
+        self.compact()
+        n = self.matrix.shape[0]
+        nlist = max(1, min(nlist, n))
+        rng = np.random.default_rng(seed)
+        sample_rows = rng.choice(n, size=min(n, max(sample_size, nlist)), replace=False)
+        sample = np.asarray(self.matrix[np.sort(sample_rows)])
+        centroids = sample[rng.choice(sample.shape[0], size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            counts = np.bincount(assign, minlength=nlist)
+            nonempty = counts > 0
+            centroids[nonempty] = _normalize(sums[nonempty])
+
+        assign = np.empty(n, dtype=np.int64)
+        for lo in range(0, n, 65_536):
+            block = np.asarray(self.matrix[lo : lo + 65_536])
+            assign[lo : lo + block.shape[0]] = np.argmax(block @ centroids.T, axis=1)
+        self.centroids = centroids
+        self._ivf_rows = n
+        self.list_rows = np.argsort(assign, kind="stable")
+        self.list_ptr = np.zeros(nlist + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assign, minlength=nlist), out=self.list_ptr[1:])
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: Optional[int] = None,
+        rows: Optional[np.ndarray] = None,
+        nprobe: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-``k`` ``(row ids, scores)`` for one query vector.
+
+        ``rows`` restricts the search to candidate row ids (brute force over them);
+        ``nprobe`` switches to the IVF path when :meth:`train_ivf` has run.
+        """
+        q = _normalize(np.asarray(query, dtype=np.float32).reshape(1, -1))[0]
+        candidates: Optional[np.ndarray] = None
+        if rows is not None:
+            candidates = self._physical.values[np.asarray(rows, dtype=np.int64)]
+            candidates = candidates[candidates >= 0]
+        elif nprobe and self.centroids is not None:
+            probes = _top_k_rows(self.centroids @ q, nprobe)
+            candidates = np.concatenate(
+                [self.list_rows[self.list_ptr[c] : self.list_ptr[c + 1]] for c in probes]
+                + [np.arange(self._ivf_rows, self.matrix.shape[0], dtype=np.int64)]
+            )
+            if self._n_dead:
+                candidates = candidates[self._live.values[candidates]]
+        elif self._n_dead:
+            candidates = np.flatnonzero(self._live.values)
+
+        scores = self.matrix @ q if candidates is None else self.matrix[candidates] @ q
+        k = scores.shape[0] if k is None else max(0, min(k, scores.shape[0]))
+        best = _top_k_rows(scores, k) if k else np.empty(0, dtype=np.int64)
+        physical = best if candidates is None else candidates[best]
+        return self._row_ids.values[physical], scores[best]
+
+    def search_batch(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Brute-force top-``k`` for a ``(q, dim)`` batch with one matmul."""
+        q = _normalize(np.asarray(queries, dtype=np.float32))
+        scores = q @ self.matrix.T
+        if self._n_dead:
+            scores[:, ~self._live.values] = -np.inf
+        k = min(k, self.matrix.shape[0] - self._n_dead)
+        best: List[np.ndarray] = [_top_k_rows(row, k) for row in scores]
+        physical = np.vstack(best) if best else np.empty((0, k), dtype=np.int64)
+        return self._row_ids.values[physical], np.take_along_axis(scores, physical, axis=1)
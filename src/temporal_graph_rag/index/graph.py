@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from temporal_graph_rag.index.segments import SegmentedPostings
+from temporal_graph_rag.temporal.epoch import OPEN_END, OPEN_START
+
+# Edge columns under each source node; ``rows`` comes first as the posting row.
+_COLUMNS = ("rows", "targets", "valid_from", "valid_to")
+
+
+class TemporalGraph:
+    """Entity graph whose edges carry validity intervals, in CSR form.
+
+    Nodes are entity names (matched case-insensitively). Each document row
+    links every pair of entities it mentions, in both directions, and each
+    entity to itself (the self-link records the mention). Every edge keeps
+    the row's ``[valid_from, valid_to]`` epoch window and the row id.
+    Out-edges of node ``n`` are one contiguous CSR slice of the edge
+    columns, so one hop from a frontier is a gather over those slices.
+
+    Storage, appends and row tombstones are a :class:`SegmentedPostings`
+    keyed by source node.
+    """
+
+    def __init__(self, max_entities: int = 32) -> None:
+        # Caps the per-row clique (max_entities ** 2 edges).
+        self.max_entities = max_entities
+        self.vocab: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.edges = SegmentedPostings(_COLUMNS)
+
+    def __len__(self) -> int:
+        """Number of edges, tombstoned ones included."""
+        return len(self.edges)
+
+    def node(self, name: str) -> Optional[int]:
+        return self.vocab.get(name.lower())
+
+    def add(
+        self,
+        rows: Sequence[int],
+        entities: Iterable[Sequence[str]],
+        valid_from: Sequence[int],
+        valid_to: Sequence[int],
+    ) -> int:
+        """Link the entities co-mentioned by each row; returns the number of edges added."""
+        flat: List[int] = []
+        sizes: List[int] = []
+        rows = np.asarray(rows, dtype=np.int64)
+        for names in entities:
+            nodes: Dict[int, None] = {}
+            for name in names:
+                key = name.lower()
+                node = self.vocab.get(key)
+                if node is None:
+                    node = self.vocab[key] = len(self.names)
+                    self.names.append(name)
+                nodes.setdefault(node, None)
+                if len(nodes) == self.max_entities:
+                    break
+            flat.extend(nodes)
+            sizes.append(len(nodes))
+        if not rows.size:
+            return 0
+
+        # Row r's k entities occupy flat[offset_r : offset_r + k]; each one is
+        # repeated k times as a source and paired with every entity of the row.
+        nodes = np.asarray(flat, dtype=np.int64)
+        k = np.asarray(sizes, dtype=np.int64)
+        per_entity = np.repeat(k, k)
+        edge_total = int(per_entity.sum())
+        first_edge = np.cumsum(per_entity) - per_entity
+        row_offset = np.repeat(np.cumsum(k) - k, k)
+        within = np.arange(edge_total, dtype=np.int64) - np.repeat(first_edge, per_entity)
+        counts = k * k
+        self.edges.append(
+            np.repeat(nodes, per_entity),
+            [
+                np.repeat(rows, counts),
+                nodes[np.repeat(row_offset, per_entity) + within],
+                np.repeat(np.asarray(valid_from, dtype=np.int64), counts),
+                np.repeat(np.asarray(valid_to, dtype=np.int64), counts),
+            ],
+            int(rows.max()) + 1,
+        )
+        return edge_total
+
+    def delete_rows(self, rows: Iterable[int]) -> None:
+        self.edges.delete(list(rows))
+
+    def purge_rows(self, rows: Iterable[int]) -> None:
+        """Drop deleted ``rows``' edges for good; ``expand(rows=...)`` stops following them."""
+        self.edges.purge(list(rows))
+
+    def expand(
+        self,
+        seeds: Sequence[int],
+        start: int = OPEN_START,
+        end: int = OPEN_END,
+        hops: int = 2,
+        max_frontier: Optional[int] = None,
+        rows: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Rows reachable from ``seeds`` in at most ``hops`` edges valid in ``[start, end]``.
+
+        Returns ``(rows, hop, paths)`` sorted by row: the first hop at which
+        each row was reached, and how many frontier entities reached it
+        there. Hop 1 rows mention a seed. Only edges overlapping the window
+        are followed, so expansion never passes through out-of-window facts.
+        ``max_frontier`` keeps the best-connected new entities per hop.
+        ``rows`` (sorted) follows only those rows' edges, tombstoned or not,
+        e.g. the versions believed at some past instant.
+        """
+        allowed = rows
+        frontier = np.unique(np.asarray(seeds, dtype=np.int64))
+        visited = frontier
+        found: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        for hop in range(1, hops + 1):
+            if not frontier.size:
+                break
+            sources, targets, rows = self._edges_from(frontier, start, end, allowed)
+            if not rows.size:
+                break
+            # Distinct (row, entity) pairs: how many frontier entities the row mentions.
+            pairs = np.unique(rows * len(self.names) + sources)
+            reached, paths = np.unique(pairs // len(self.names), return_counts=True)
+            found.append((reached, np.full(reached.shape[0], hop, dtype=np.int64), paths))
+
+            candidates, degree = np.unique(targets, return_counts=True)
+            new = ~np.isin(candidates, visited, assume_unique=True)
+            candidates, degree = candidates[new], degree[new]
+            if max_frontier is not None and candidates.shape[0] > max_frontier:
+                keep = np.lexsort((candidates, -degree))[:max_frontier]
+                candidates = np.sort(candidates[keep])
+            visited = np.union1d(visited, candidates)
+            frontier = candidates
+
+        if not found:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty
+        rows = np.concatenate([part[0] for part in found])
+        hop = np.concatenate([part[1] for part in found])
+        paths = np.concatenate([part[2] for part in found])
+        # Keep each row's first (lowest) hop.
+        order = np.lexsort((hop, rows))
+        rows, hop, paths = rows[order], hop[order], paths[order]
+        first = np.unique(rows, return_index=True)[1]
+        return rows[first], hop[first], paths[first]
+
+    def _edges_from(
+        self, nodes: np.ndarray, start: int, end: int, allowed: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """``(source, target, row)`` of live (or ``allowed``) edges out of ``nodes`` in the window."""
+        sources, rows, targets, valid_from, valid_to = self.edges.gather(nodes)
+        window = (valid_from <= end) & (valid_to >= start)
+        if allowed is None:
+            keep = window & ~self.edges.deleted[rows]
+        else:
+            keep = window & np.isin(rows, allowed)
+        return sources[keep], targets[keep], rows[keep]
+
+    def _merge_segments(self) -> None:
+        self.edges.merge()
+
+    def save_snapshot(self, directory: Union[str, Path]) -> None:
+        directory = Path(directory)
+        self.edges.save(directory)
+        meta = {"max_entities": self.max_entities, "names": self.names}
+        (directory / "meta.json").write_text(json.dumps(meta))
+
+    @classmethod
+    def open_snapshot(cls, directory: Union[str, Path], mmap: bool = True) -> "TemporalGraph":
+        directory = Path(directory)
+        meta = json.loads((directory / "meta.json").read_text())
+        graph = cls(max_entities=meta["max_entities"])
+        graph.names = meta["names"]
+        graph.vocab = {name.lower(): node for node, name in enumerate(graph.names)}
+        graph.edges = SegmentedPostings.open(directory, _COLUMNS, mmap)
+        return graph
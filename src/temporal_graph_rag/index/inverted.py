@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from temporal_graph_rag.index.segments import SegmentedPostings
+
+
+class InvertedIndex:
+    """Token -> rows posting lists in CSR form, for match-count scoring.
+
+    A query unions the posting lists of its distinct tokens and counts how
+    many of them each row contains, touching only those postings rather
+    than every document. Storage, appends and tombstones are a
+    :class:`SegmentedPostings` keyed by term. Row ids never change.
+    """
+
+    def __init__(self, corpus: Iterable[Sequence[str]] = ()) -> None:
+        self.vocab: Dict[str, int] = {}
+        self.postings = SegmentedPostings(("indices",))
+        self.add(corpus)
+
+    def __len__(self) -> int:
+        return self.postings.n_rows
+
+    def add(self, corpus: Iterable[Sequence[str]]) -> range:
+        """Append documents (token lists) and return their row ids."""
+        vocab = self.vocab
+        first_row = len(self)
+        count = 0
+        term_ids: List[int] = []
+        doc_ids: List[int] = []
+        for row, tokens in enumerate(corpus, start=first_row):
+            terms = {vocab.setdefault(token, len(vocab)) for token in tokens}
+            term_ids.extend(terms)
+            doc_ids.extend([row] * len(terms))
+            count += 1
+        if not count:
+            return range(first_row, first_row)
+        self.postings.append(
+            np.asarray(term_ids, dtype=np.int64), [np.asarray(doc_ids, dtype=np.int64)], first_row + count
+        )
+        return range(first_row, len(self))
+
+    def delete(self, rows: Iterable[int]) -> None:
+        self.postings.delete(list(rows))
+
+    def purge(self, rows: Iterable[int]) -> None:
+        """Drop deleted ``rows`` from history too; ``include_deleted`` stops matching them."""
+        self.postings.purge(list(rows))
+
+    def match_counts(
+        self, tokens: Sequence[str], rows: Optional[np.ndarray] = None, include_deleted: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """``(rows, counts)``: live rows containing any token, and how many distinct tokens.
+
+        ``rows`` optionally restricts matches to a set of candidate rows;
+        ``include_deleted`` also matches tombstoned rows (past versions).
+        """
+        postings: List[np.ndarray] = []
+        for token in dict.fromkeys(tokens):
+            term = self.vocab.get(token)
+            if term is not None:
+                postings.append(self.postings.lookup(term)[0])
+        if not postings:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        hits = np.concatenate(postings)
+        if not include_deleted:
+            hits = hits[~self.postings.deleted[hits]]
+        if rows is not None:
+            hits = hits[np.isin(hits, rows)]
+        if 16 * hits.shape[0] < len(self):
+            return np.unique(hits, return_counts=True)
+        # Dense hits: counting into a row-sized array beats sorting them.
+        counts = np.bincount(hits, minlength=len(self))
+        matched = np.flatnonzero(counts)
+        return matched, counts[matched]
+
+    def top_k(
+        self,
+        tokens: Sequence[str],
+        k: Optional[int] = None,
+        rows: Optional[np.ndarray] = None,
+        include_deleted: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Best ``k`` rows by match count, ties broken by row id."""
+        matched, counts = self.match_counts(tokens, rows, include_deleted)
+        if not matched.size:
+            return matched, counts
+        # One unique int64 key per row orders by count desc, then row asc.
+        key = (counts.max() - counts) * (int(matched[-1]) + 1) + matched
+        if k is not None and k < key.shape[0]:
+            if k <= 0:
+                return matched[:0], counts[:0]
+            part = np.argpartition(key, k - 1)[:k]
+            order = part[np.argsort(key[part])]
+        else:
+            order = np.argsort(key)
+        return matched[order], counts[order]
+
+    def _merge_segments(self) -> None:
+        self.postings.merge()
+
+    def save_snapshot(self, directory: Union[str, Path]) -> None:
+        directory = Path(directory)
+        self.postings.save(directory)
+        (directory / "vocab.json").write_text(json.dumps(list(self.vocab)))
+
+    @classmethod
+    def open_snapshot(cls, directory: Union[str, Path], mmap: bool = True) -> "InvertedIndex":
+        directory = Path(directory)
+        index = cls.__new__(cls)
+        terms = json.loads((directory / "vocab.json").read_text())
+        index.vocab = dict(zip(terms, range(len(terms))))
+        index.postings = SegmentedPostings.open(directory, ("indices",), mmap)
+        return index
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from temporal_graph_rag.arrays import GrowableArray, load_array
+
+# One appended batch: keys sorted ascending, plus the posting columns in that order.
+_Segment = Tuple[np.ndarray, Tuple[np.ndarray, ...]]
+
+
+class SegmentedPostings:
+    """Key -> posting lists in CSR form, with delta segments and row tombstones.
+
+    Shared by the inverted, BM25 and graph indexes. Each posting is one
+    int64 value per name in ``columns``; the first column is the document
+    row. The base is ``indptr`` plus one array per column, grouped by key.
+    :meth:`append` adds a batch as a key-sorted delta segment that lookups
+    binary-search directly. Segments merge geometrically: the newest folds
+    into the one before while it is at least half that size, so there are
+    O(log delta) of them and each posting is re-sorted O(log delta) times.
+    They are merged into the base once they outgrow an eighth of it, which
+    keeps single-document appends amortized O(1) per posting.
+    :meth:`delete` tombstones rows in the ``deleted`` mask. Their postings
+    are kept, so superseded versions stay searchable for ``as_of`` queries;
+    callers filter on the mask for current-only answers. :meth:`purge`
+    drops tombstoned rows' postings for good once no supported ``as_of``
+    can see them, so history does not grow without bound. Row ids never change.
+    """
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        self.columns = tuple(columns)
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.base: Dict[str, np.ndarray] = {name: np.zeros(0, dtype=np.int64) for name in self.columns}
+        self._deleted = GrowableArray(np.zeros(0, dtype=bool))
+        self._purged = GrowableArray(np.zeros(0, dtype=bool))
+        self._segments: List[_Segment] = []
+
+    def __len__(self) -> int:
+        """Number of postings, tombstoned ones included."""
+        return int(self.base[self.columns[0]].shape[0]) + sum(keys.shape[0] for keys, _ in self._segments)
+
+    @property
+    def n_rows(self) -> int:
+        return self._deleted.size
+
+    @property
+    def deleted(self) -> np.ndarray:
+        return self._deleted.values
+
+    @property
+    def purged(self) -> np.ndarray:
+        return self._purged.values
+
+    def append(self, keys: np.ndarray, values: Sequence[np.ndarray], n_rows: int) -> None:
+        """Add postings ``(keys[i], values[0][i], ...)`` and track rows up to ``n_rows``."""
+        if n_rows > self._deleted.size:
+            self._purged.extend(np.zeros(n_rows - self._deleted.size, dtype=bool))
+            self._deleted.extend(np.zeros(n_rows - self._deleted.size, dtype=bool))
+        if not keys.shape[0]:
+            return
+        order = np.argsort(keys, kind="stable")
+        segments = self._segments
+        segments.append((keys[order], tuple(np.asarray(column)[order] for column in values)))
+        while len(segments) > 1 and 2 * segments[-1][0].shape[0] >= segments[-2][0].shape[0]:
+            segments[-2:] = [_merge_pair(*segments[-2:])]
+        delta = sum(segment_keys.shape[0] for segment_keys, _ in segments)
+        if 8 * delta > self.base[self.columns[0]].shape[0]:
+            self.merge()
+
+    def delete(self, rows: Sequence[int]) -> None:
+        rows = [row for row in rows if row < self._deleted.size]
+        if rows:
+            self._deleted.writable()[rows] = True
+
+    def purge(self, rows: Sequence[int]) -> np.ndarray:
+        """Drop the postings of tombstoned ``rows`` for good; returns the rows newly purged.
+
+        Rewrites the base (O(postings)), so callers batch it, e.g. per
+        history compaction. Live and already purged rows are skipped.
+        """
+        rows = np.unique(np.asarray(rows, dtype=np.int64))
+        rows = rows[rows < self.n_rows]
+        rows = rows[self.deleted[rows] & ~self.purged[rows]]
+        if not rows.size:
+            return rows
+        self._purged.writable()[rows] = True
+        self.merge()
+        keep = ~self.purged[self.base[self.columns[0]]]
+        num_keys = self.indptr.shape[0] - 1
+        key = np.repeat(np.arange(num_keys), np.diff(self.indptr))[keep]
+        for name in self.columns:
+            self.base[name] = self.base[name][keep]
+        self.indptr = np.zeros(num_keys + 1, dtype=np.int64)
+        np.cumsum(np.bincount(key, minlength=num_keys), out=self.indptr[1:])
+        return rows
+
+    def lookup(self, key: int) -> Tuple[np.ndarray, ...]:
+        """Columns of ``key``'s postings, base first then each segment (tombstones included)."""
+        parts: List[Tuple[np.ndarray, ...]] = []
+        if key + 1 < self.indptr.shape[0]:
+            lo, hi = self.indptr[key], self.indptr[key + 1]
+            if hi > lo:
+                parts.append(tuple(self.base[name][lo:hi] for name in self.columns))
+        for keys, values in self._segments:
+            lo, hi = np.searchsorted(keys, (key, key + 1))
+            if hi > lo:
+                parts.append(tuple(column[lo:hi] for column in values))
+        if len(parts) == 1:
+            return parts[0]
+        if not parts:
+            return tuple(np.zeros(0, dtype=np.int64) for _ in self.columns)
+        return tuple(np.concatenate(column) for column in zip(*parts))
+
+    def key_counts(self) -> np.ndarray:
+        """Postings per key (tombstoned ones included), over every key seen so far."""
+        counts = np.diff(self.indptr)
+        for keys, _ in self._segments:
+            extra = np.bincount(keys)
+            if extra.shape[0] > counts.shape[0]:
+                counts = np.concatenate([counts, np.zeros(extra.shape[0] - counts.shape[0], dtype=np.int64)])
+            counts[: extra.shape[0]] += extra
+        return counts
+
+    def gather(self, keys: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """``(key, *columns)`` of every posting under sorted ``keys``, tombstones included."""
+        base = keys[keys < self.indptr.shape[0] - 1]
+        lo, hi = self.indptr[base], self.indptr[base + 1]
+        lengths = hi - lo
+        # Gather the CSR slices without a Python loop: position i of slice j is lo[j] + i.
+        starts = np.repeat(lo - np.cumsum(lengths) + lengths, lengths)
+        picked = starts + np.arange(starts.shape[0], dtype=np.int64)
+        parts = [(np.repeat(base, lengths),) + tuple(self.base[name][picked] for name in self.columns)]
+        for segment_keys, values in self._segments:
+            keep = np.isin(segment_keys, keys)
+            parts.append((segment_keys[keep],) + tuple(column[keep] for column in values))
+        return tuple(np.concatenate(column) for column in zip(*parts))
+
+    def merge(self) -> None:
+        """Fold the segments into the base CSR (tombstoned postings included)."""
+        keys = [np.repeat(np.arange(self.indptr.shape[0] - 1), np.diff(self.indptr))]
+        columns = [[self.base[name]] for name in self.columns]
+        for segment_keys, values in self._segments:
+            keys.append(segment_keys)
+            for column, part in zip(columns, values):
+                column.append(part)
+        key = np.concatenate(keys)
+        # Segments hold increasing row ranges, so a stable sort by key keeps
+        # each posting list in row order.
+        order = np.argsort(key, kind="stable")
+        for name, column in zip(self.columns, columns):
+            self.base[name] = np.concatenate(column)[order]
+        num_keys = max(self.indptr.shape[0] - 1, int(key.max()) + 1 if key.size else 0)
+        self.indptr = np.zeros(num_keys + 1, dtype=np.int64)
+        np.cumsum(np.bincount(key, minlength=num_keys), out=self.indptr[1:])
+        self._segments = []
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """Merge, then write ``indptr.npy``, one ``.npy`` per column and the row masks."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.merge()
+        np.save(directory / "indptr.npy", self.indptr)
+        for name in self.columns:
+            np.save(directory / f"{name}.npy", self.base[name])
+        np.save(directory / "deleted.npy", self.deleted)
+        np.save(directory / "purged.npy", self.purged)
+
+    @classmethod
+    def open(cls, directory: Union[str, Path], columns: Sequence[str], mmap: bool = True) -> "SegmentedPostings":
+        directory = Path(directory)
+        postings = cls(columns)
+        postings.indptr = load_array(directory / "indptr.npy", mmap)
+        for name in postings.columns:
+            postings.base[name] = load_array(directory / f"{name}.npy", mmap)
+        # Updated in place by delete, so read into memory.
+        postings._deleted = GrowableArray(load_array(directory / "deleted.npy", mmap=False))
+        postings._purged = GrowableArray(load_array(directory / "purged.npy", mmap=False))
+        return postings
+
+
+def _merge_pair(older: _Segment, newer: _Segment) -> _Segment:
+    """One key-sorted segment; ``older``'s postings stay ahead within a key (row order)."""
+    keys = np.concatenate([older[0], newer[0]])
+    order = np.argsort(keys, kind="stable")
+    return keys[order], tuple(np.concatenate(pair)[order] for pair in zip(older[1], newer[1]))
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import FrozenSet, List
+
+
+# Function words that match almost every document and carry no topic.
+ENGLISH_STOPWORDS = frozenset(
+    "a an and are as at be by did do does for from had has have how in is it its of on or that "
+    "the their this to was were what when where which who whom why will with".split()
+)
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+
+
+@dataclass(frozen=True)
+class Tokenizer:
+    """Text normalization shared by the lexical retrievers (graph and BM25).
+
+    The default lowercases and splits on whitespace, which is what
+    ``rank_bm25`` parity is defined against. ``strip_punctuation`` drops
+    non-word characters first (so ``Orion?`` matches ``orion``), and
+    ``stopwords`` are removed after lowercasing. Index and query text must
+    go through the same instance.
+    """
+
+    stopwords: FrozenSet[str] = frozenset()
+    strip_punctuation: bool = False
+
+    def __call__(self, text: str) -> List[str]:
+        text = text.lower()
+        if self.strip_punctuation:
+            text = _PUNCTUATION_RE.sub(" ", text)
+        tokens = text.split()
+        if self.stopwords:
+            return [token for token in tokens if token not in self.stopwords]
+        return tokens
+
+    @classmethod
+    def from_config(cls, config: dict) -> "Tokenizer":
+        return cls(frozenset(config.get("stopwords", ())), bool(config.get("strip_punctuation")))
+
+    def to_config(self) -> dict:
+        return {"stopwords": sorted(self.stopwords), "strip_punctuation": self.strip_punctuation}
+
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import gzip
+import json
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Protocol, Sequence, Union
+
+from temporal_graph_rag.ingestion.temporal_indexer import TemporalIndexer
+
+
+class DocumentSink(Protocol):
+    """Anything that accepts document batches: ``TemporalGraphRAG`` or a writable retriever."""
+
+    def add_documents(self, docs: Sequence[dict]) -> object:
+        ...
+
+
+def read_jsonl(path: Union[str, Path]) -> Iterator[dict]:
+    """Yield one record per non-blank line; ``.gz`` files are decompressed on the fly."""
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_parquet(
+    path: Union[str, Path], batch_size: int = 65_536, columns: Optional[List[str]] = None
+) -> Iterator[dict]:
+    """Yield records from a Parquet file one row group batch at a time (requires pyarrow)."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "Parquet ingestion requires pyarrow: pip install 'temporal-graph-rag[parquet]'"
+        ) from None
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size, columns=columns):
+        yield from batch.to_pylist()
+
+
+def chunked(records: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+@dataclass
+class IngestStats:
+    documents: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def docs_per_s(self) -> float:
+        return self.documents / self.seconds if self.seconds else 0.0
+
+
+_DONE = object()
+
+
+class IngestionPipeline:
+    """Stream records into a :class:`DocumentSink` in fixed-size chunks.
+
+    The calling thread reads and normalizes chunks (bulk timestamp parsing,
+    entity extraction); one writer thread hands them to ``sink.add_documents``.
+    The two meet at a queue of ``max_pending_chunks``, so a slow backend
+    blocks the reader instead of letting parsed chunks pile up: memory stays
+    bounded at roughly ``(max_pending_chunks + 2) * chunk_size`` documents.
+    """
+
+    def __init__(
+        self,
+        sink: DocumentSink,
+        indexer: Optional[TemporalIndexer] = None,
+        chunk_size: int = 1000,
+        max_pending_chunks: int = 4,
+    ) -> None:
+        if chunk_size < 1 or max_pending_chunks < 1:
+            raise ValueError("chunk_size and max_pending_chunks must be >= 1")
+        self.sink = sink
+        self.indexer = indexer or TemporalIndexer()
+        self.chunk_size = chunk_size
+        self.max_pending_chunks = max_pending_chunks
+
+    def run(self, records: Iterable[dict]) -> IngestStats:
+        stats = IngestStats()
+        pending: queue.Queue = queue.Queue(maxsize=self.max_pending_chunks)
+        errors: List[BaseException] = []
+
+        def write() -> None:
+            while (docs := pending.get()) is not _DONE:
+                if errors:
+                    continue  # drain so the reader never blocks on a dead writer
+                try:
+                    self.sink.add_documents(docs)
+                    stats.documents += len(docs)
+                    stats.chunks += 1
+                except BaseException as exc:
+                    errors.append(exc)
+
+        started = time.perf_counter()
+        writer = threading.Thread(target=write, name="tgrag-ingest", daemon=True)
+        writer.start()
+        try:
+            for chunk in chunked(records, self.chunk_size):
+                if errors:
+                    break
+                pending.put(self.indexer.index_batch(chunk))
+        finally:
+            pending.put(_DONE)
+            writer.join()
+        stats.seconds = time.perf_counter() - started
+        if errors:
+            raise RuntimeError(
+                f"ingestion stopped after {stats.documents} documents"
+            ) from errors[0]
+        return stats
@@ -1,9 +1,72 @@
-from datetime import datetime
-from typing import Optional
+from __future__ import annotations
+
+import hashlib
+import re
+import warnings
+from datetime import datetime, timezone
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+_ENTITY_RE = re.compile(r"\b[A-Z][\w&-]*(?:\s+[A-Z][\w&-]*)*")
+# Capitalised words that start sentences or name dates rather than entities.
+_NOT_ENTITIES = frozenset(
+    "A An The This That These Those In On At By For From To Of And Or But After Before During "
+    "Since Until Between When Who What Where Which Why How Q1 Q2 Q3 Q4 "
+    "January February March April May June July August September October November December "
+    "Jan Feb Mar Apr Jun Jul Aug Sep Sept Oct Nov Dec".split()
+)
+
+
+def extract_entities(text: str) -> List[str]:
+    """Capitalised phrases (``Project Orion``, ``Platform Ops``), deduplicated in order."""
+    entities: dict[str, None] = {}
+    for match in _ENTITY_RE.finditer(text):
+        words = match.group().split()
+        while words and words[0] in _NOT_ENTITIES:
+            words.pop(0)
+        while words and words[-1] in _NOT_ENTITIES:
+            words.pop()
+        if words:
+            entities.setdefault(" ".join(words), None)
+    return list(entities)
+
+
+def parse_timestamps(values: Sequence[object]) -> List[Optional[datetime]]:
+    """Parse a column of ISO strings / datetimes / ``None`` into naive-UTC datetimes.
+
+    All strings go through one NumPy ``datetime64`` conversion; if NumPy
+    rejects any of them (UTC offsets, ``Z`` suffixes) the column falls back
+    to ``datetime.fromisoformat``.
+    """
+    parsed: List[Optional[datetime]] = [v if isinstance(v, datetime) else None for v in values]
+    positions = [i for i, v in enumerate(values) if isinstance(v, str) and v]
+    if not positions:
+        return parsed
+    strings = [values[i] for i in positions]
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            converted = np.array(strings, dtype="datetime64[us]").tolist()
+    except (ValueError, UserWarning, DeprecationWarning):
+        converted = [_parse_iso(text) for text in strings]
+    for i, value in zip(positions, converted):
+        parsed[i] = value
+    return parsed
+
+
+def _parse_iso(text: str) -> datetime:
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    value = datetime.fromisoformat(text)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
 
 
 class TemporalIndexer:
-    """Stub indexer for temporal payloads."""
+    """Normalizes raw records into engine documents."""
 
     def index_document(
         self,
@@ -19,3 +82,32 @@ class TemporalIndexer:
             "entities": entities,
             "ingestion_time": datetime.utcnow().isoformat(),
         }
+
+    def index_batch(self, records: Sequence[dict]) -> List[dict]:
+        """Turn raw records (``id``, ``content``/``text``, ``valid_from``, ``valid_to``,
+        optional ``entities``) into engine documents.
+
+        Timestamps are parsed per column for the whole batch; records without
+        an ``id`` get a content hash so re-ingesting a file is idempotent.
+        """
+        valid_from = parse_timestamps([record.get("valid_from") for record in records])
+        valid_to = parse_timestamps([record.get("valid_to") for record in records])
+        ingestion_time = datetime.utcnow()
+        docs: List[dict] = []
+        for record, start, end in zip(records, valid_from, valid_to):
+            content = str(record.get("content") or record.get("text") or "")
+            doc_id = record.get("id")
+            if doc_id is None:
+                doc_id = hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+            entities = record.get("entities")
+            docs.append(
+                {
+                    "id": str(doc_id),
+                    "content": content,
+                    "valid_from": start,
+                    "valid_to": end,
+                    "entities": list(entities) if entities is not None else extract_entities(content),
+                    "ingestion_time": ingestion_time,
+                }
+            )
+        return docs
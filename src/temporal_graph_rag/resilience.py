@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Deque, Optional, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a backend whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker: ``closed`` -> ``open`` -> ``half_open`` -> ...
+
+    After ``failure_threshold`` failed attempts in a row the circuit opens
+    and calls fail fast for ``reset_timeout_s``. Then one probe is let
+    through (``half_open``): success closes the circuit, failure reopens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_s: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout_s:
+                return HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout_s:
+                    return False
+                self._state = HALF_OPEN
+            # Half open: a single probe at a time.
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+@dataclass
+class ResiliencePolicy:
+    """Retries, circuit breaking and hedging for one backend.
+
+    Share one policy between retrievers that talk to the same backend so
+    they trip and recover together. Attempts are retried with full-jitter
+    exponential backoff (``uniform(0, min(backoff_max_s, backoff_base_s *
+    2**attempt))``). Reads may be hedged: once ``hedge_min_samples``
+    latencies are known, a second identical request is sent if the first
+    has not answered within the recent ``hedge_quantile`` latency, and the
+    first answer wins. Exhausted retries raise ``RuntimeError``; an open
+    circuit raises :class:`CircuitOpenError` without calling the backend.
+    """
+
+    name: str = "backend"
+    max_retries: int = 2
+    backoff_base_s: float = 0.05
+    backoff_max_s: float = 2.0
+    failure_threshold: int = 5
+    reset_timeout_s: float = 30.0
+    hedge: bool = True
+    hedge_quantile: float = 0.95
+    hedge_min_samples: int = 20
+    hedge_min_delay_s: float = 0.005
+    latency_window: int = 256
+    breaker: CircuitBreaker = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout_s)
+        self._latencies: Deque[float] = deque(maxlen=self.latency_window)
+        self._counts = {"attempts": 0, "failures": 0, "rejected": 0, "hedges": 0, "hedge_wins": 0}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._rng = random.Random()
+
+    def backoff(self, attempt: int) -> float:
+        return self._rng.uniform(0.0, min(self.backoff_max_s, self.backoff_base_s * 2**attempt))
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or ``None`` while too few latencies are known."""
+        with self._lock:
+            if not self.hedge or len(self._latencies) < self.hedge_min_samples:
+                return None
+            latencies = np.fromiter(self._latencies, dtype=np.float64)
+        return max(self.hedge_min_delay_s, float(np.quantile(latencies, self.hedge_quantile)))
+
+    def call(self, fn: Callable[[], T], hedge: bool = False) -> T:
+        """Run ``fn`` under the policy; ``hedge`` only for idempotent reads."""
+        last_exc: Optional[Exception] = None
+        for attempt in range(self.max_retries + 1):
+            self._admit()
+            try:
+                result = self._hedged(fn) if hedge else self._timed(fn)
+            except Exception as exc:
+                last_exc = exc
+                self._failed()
+                if attempt >= self.max_retries:
+                    break
+                time.sleep(self.backoff(attempt))
+            else:
+                self.breaker.record_success()
+                return result
+        raise RuntimeError(f"{self.name} request failed after retries") from last_exc
+
+    async def acall(self, make: Callable[[], Awaitable[T]], hedge: bool = False) -> T:
+        """Async :meth:`call`; ``make`` returns a fresh awaitable per attempt."""
+        last_exc: Optional[Exception] = None
+        for attempt in range(self.max_retries + 1):
+            self._admit()
+            try:
+                result = await (self._ahedged(make) if hedge else self._atimed(make))
+            except Exception as exc:
+                last_exc = exc
+                self._failed()
+                if attempt >= self.max_retries:
+                    break
+                await asyncio.sleep(self.backoff(attempt))
+            else:
+                self.breaker.record_success()
+                return result
+        raise RuntimeError(f"{self.name} request failed after retries") from last_exc
+
+    def stats(self) -> dict:
+        delay = self.hedge_delay()
+        with self._lock:
+            return {
+                "state": self.breaker.state,
+                **self._counts,
+                "hedge_delay_s": delay,
+            }
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _admit(self) -> None:
+        with self._lock:
+            self._counts["attempts"] += 1
+        if not self.breaker.allow():
+            with self._lock:
+                self._counts["rejected"] += 1
+            raise CircuitOpenError(f"{self.name} circuit is open")
+
+    def _failed(self) -> None:
+        self.breaker.record_failure()
+        with self._lock:
+            self._counts["failures"] += 1
+
+    def _observe(self, seconds: float, hedged: bool = False) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+            if hedged:
+                self._counts["hedge_wins"] += 1
+
+    def _timed(self, fn: Callable[[], T]) -> T:
+        started = time.monotonic()
+        result = fn()
+        self._observe(time.monotonic() - started)
+        return result
+
+    def _hedged(self, fn: Callable[[], T]) -> T:
+        delay = self.hedge_delay()
+        if delay is None:
+            return self._timed(fn)
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(thread_name_prefix=f"tgrag-hedge-{self.name}")
+        started = {self._executor.submit(fn): time.monotonic()}
+        done, _ = wait(started, timeout=delay)
+        if not done:
+            with self._lock:
+                self._counts["hedges"] += 1
+            started[self._executor.submit(fn)] = time.monotonic()
+        return self._first_result(started, hedged=not done)
+
+    def _first_result(self, started: dict, hedged: bool) -> T:
+        pending = set(started)
+        primary = next(iter(started))
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            future = _winner(done, pending)
+            if future is not None:
+                # A running thread cannot be interrupted; its result is discarded.
+                for loser in pending:
+                    loser.cancel()
+                self._observe(time.monotonic() - started[future], hedged and future is not primary)
+                return future.result()
+
+    async def _atimed(self, make: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        result = await make()
+        self._observe(time.monotonic() - started)
+        return result
+
+    async def _ahedged(self, make: Callable[[], Awaitable[T]]) -> T:
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._atimed(make)
+        primary = asyncio.ensure_future(make())
+        started = {primary: time.monotonic()}
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if not done:
+            with self._lock:
+                self._counts["hedges"] += 1
+            started[asyncio.ensure_future(make())] = time.monotonic()
+        pending = set(started)
+        try:
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                task = _winner(done, pending)
+                if task is not None:
+                    self._observe(time.monotonic() - started[task], task is not primary)
+                    return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+def _winner(done: set, pending: set) -> Optional[object]:
+    """A successful future from ``done``; a failed one only once none is ``pending``."""
+    for future in done:
+        if future.exception() is None:
+            return future
+    return None if pending else next(iter(done))
@@ -1,80 +1,627 @@
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
-import time
-from typing import Callable, Iterable, List, Optional, Protocol
+from datetime import datetime, timedelta
+import asyncio
+import re
+import threading
+import uuid
+from typing import Callable, Iterable, List, Optional, Protocol, Sequence, Tuple
 
+import numpy as np
+
+from temporal_graph_rag.cache import EmbeddingCache
+from temporal_graph_rag.index.bm25 import BM25Index
+from temporal_graph_rag.index.dense import DenseIndex
+from temporal_graph_rag.index.graph import TemporalGraph
+from temporal_graph_rag.index.inverted import InvertedIndex
+from temporal_graph_rag.index.tokenize import Tokenizer
+from temporal_graph_rag.ingestion.temporal_indexer import extract_entities
+from temporal_graph_rag.resilience import ResiliencePolicy
+from temporal_graph_rag.store import DocumentStore
+from temporal_graph_rag.temporal.epoch import OPEN_END, OPEN_START, from_epoch, to_epoch
+from temporal_graph_rag.temporal.interval_index import IntervalIndex
 from temporal_graph_rag.types import RetrievalResult, TemporalContext
 
 
 class Retriever(Protocol):
     name: str
 
-    def retrieve(self, query: str, ctx: TemporalContext) -> List[RetrievalResult]:
+    def retrieve(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> List[RetrievalResult]:
+        """Return at most ``top_k`` results (all candidates when ``None``), best first."""
         ...
 
 
-def _wrap(doc: dict, source: str, score: float) -> RetrievalResult:
+class BatchRetriever(Retriever, Protocol):
+    """Retriever that resolves many queries in one call (shared work, one round trip)."""
+
+    def retrieve_many(
+        self,
+        queries: Sequence[str],
+        ctxs: Sequence[TemporalContext],
+        top_k: Optional[int] = None,
+    ) -> List[List[RetrievalResult]]:
+        ...
+
+
+class AsyncRetriever(Retriever, Protocol):
+    """Retriever with a native coroutine path; others run in a worker thread."""
+
+    async def aretrieve(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> List[RetrievalResult]:
+        ...
+
+
+class WritableRetriever(Retriever, Protocol):
+    """Retriever that takes writes without rebuilding its index.
+
+    ``add_documents`` upserts by id. In-process retrievers append rows in the
+    order given and tombstone replaced or deleted rows, so row ids stay
+    stable; callers keep any shared :class:`IntervalIndex` in step
+    (``TemporalGraphRAG`` does).
+    """
+
+    def add_documents(self, docs: Sequence[dict]) -> None:
+        ...
+
+    def update_document(self, doc: dict) -> None:
+        ...
+
+    def delete_document(self, doc_id: str) -> None:
+        ...
+
+
+@dataclass
+class RowHits:
+    """One in-process retriever's scored rows of a shared :class:`DocumentStore`.
+
+    The engine fuses these by integer row and materializes content only for
+    the final top-k; :meth:`_DocumentRows.retrieve` wraps them for callers.
+    """
+
+    source: str
+    rows: np.ndarray
+    scores: np.ndarray
+
+
+class _DocumentRows(ABC):
+    """Row bookkeeping shared by the in-process retrievers.
+
+    ``docs`` is a :class:`DocumentStore`; a list of dicts is packed into a
+    new one. Pass one store to several retrievers (and ``TemporalGraphRAG``)
+    to keep a single copy: the engine then writes it once and calls
+    :meth:`index_rows` on each retriever. Subclasses implement
+    :meth:`retrieve_rows` and extend :meth:`_append` / :meth:`_remove_rows`
+    for their index. Those whose index keeps removed rows also implement
+    ``retrieve_versions(query, ctx, rows, top_k)``, which scores only
+    ``rows`` (e.g. the versions believed at an ``as_of`` instant) whether or
+    not they are still current; with an ``interval_index`` they also keep
+    only versions overlapping the query window, as :meth:`retrieve_rows`
+    does. :meth:`purge_rows` drops closed versions for good.
+    """
+
+    docs: DocumentStore
+
+    def _init_rows(self) -> None:
+        if not isinstance(self.docs, DocumentStore):
+            self.docs = DocumentStore.from_docs(self.docs)
+
+    def add_documents(self, docs: Sequence[dict]) -> None:
+        self.index_rows(*self.docs.upsert(docs))
+
+    def update_document(self, doc: dict) -> None:
+        self.add_documents([doc])
+
+    def delete_document(self, doc_id: str) -> None:
+        self.index_rows(range(0), self.docs.delete([doc_id]))
+
+    def index_rows(self, added: range, removed: Sequence[int]) -> None:
+        """Bring the index in step with rows already written to ``docs``."""
+        if removed:
+            self._remove_rows(list(removed))
+        if len(added):
+            self._append(added)
+
+    def purge_rows(self, rows: Sequence[int]) -> None:
+        """Drop removed ``rows`` from the index, so no ``as_of`` query sees them."""
+        self._purge_rows(list(rows))
+
+    def _append(self, rows: range) -> None:
+        pass
+
+    def _remove_rows(self, rows: List[int]) -> None:
+        pass
+
+    def _purge_rows(self, rows: List[int]) -> None:
+        pass
+
+    @abstractmethod
+    def retrieve_rows(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> RowHits:
+        """Score rows of ``docs`` for ``query``, best first."""
+
+    def retrieve(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> List[RetrievalResult]:
+        return self._wrap_hits(self.retrieve_rows(query, ctx, top_k))
+
+    def _wrap_hits(self, hits: RowHits) -> List[RetrievalResult]:
+        return [
+            _wrap(self.docs, row, hits.source, score)
+            for row, score in zip(hits.rows.tolist(), hits.scores.tolist())
+        ]
+
+
+def _wrap(docs: DocumentStore, row: int, source: str, score: float) -> RetrievalResult:
     return RetrievalResult(
-        doc_id=doc["id"],
-        content=doc["content"],
+        doc_id=docs.doc_id(row),
+        content=docs.content(row),
         source=source,
         score=score,
-        valid_from=doc["valid_from"],
-        valid_to=doc["valid_to"],
+        valid_from=from_epoch(int(docs.valid_from[row])),
+        valid_to=from_epoch(int(docs.valid_to[row])),
+        transaction_from=from_epoch(int(docs.transaction_from[row])),
+        transaction_to=from_epoch(int(docs.transaction_to[row])),
+    )
+
+
+def _hits(source: str, rows: Sequence[int], scores: Sequence[float]) -> RowHits:
+    return RowHits(source, np.asarray(rows, dtype=np.int64), np.asarray(scores, dtype=np.float64))
+
+
+def _candidate_rows(
+    docs: DocumentStore, index: Optional[IntervalIndex], ctx: TemporalContext
+) -> Iterable[int]:
+    """Live rows to score: all docs, or only those overlapping the query window."""
+    if index is None or not (ctx.time_start and ctx.time_end):
+        return np.flatnonzero(docs.live).tolist()
+    return index.overlapping(ctx.time_start, ctx.time_end).tolist()
+
+
+def _window_rows(index: Optional[IntervalIndex], ctx: TemporalContext) -> Optional[np.ndarray]:
+    if index is None or not (ctx.time_start and ctx.time_end):
+        return None
+    return index.overlapping(ctx.time_start, ctx.time_end)
+
+
+def _window_versions(
+    docs: DocumentStore, index: Optional[IntervalIndex], ctx: TemporalContext, rows: np.ndarray
+) -> np.ndarray:
+    """``rows`` overlapping the query window when ``index`` prefilters, else all of them.
+
+    The interval index only covers current rows, so versions are checked
+    against the store's own validity columns.
+    """
+    if index is None or not (ctx.time_start and ctx.time_end):
+        return rows
+    keep = (docs.valid_from[rows] <= to_epoch(ctx.time_end)) & (
+        docs.valid_to[rows] >= to_epoch(ctx.time_start)
     )
+    return rows[keep]
 
 
 @dataclass
-class InMemoryGraphRetriever:
-    docs: List[dict]
+class InMemoryGraphRetriever(_DocumentRows):
+    """Lexical stand-in for a graph store, over an :class:`InvertedIndex`.
+
+    Candidates are the union of the query tokens' posting lists; a row
+    scores the number of distinct query tokens it contains. Pass ``index``
+    to reuse postings that align with ``docs``.
+    """
+
+    docs: Sequence[dict]
     name: str = "graph"
+    interval_index: Optional[IntervalIndex] = None
+    tokenizer: Tokenizer = field(default_factory=Tokenizer)
+    index: Optional[InvertedIndex] = None
+
+    def __post_init__(self) -> None:
+        self._init_rows()
+        if self.index is None:
+            self.index = InvertedIndex(self._tokens(row) for row in range(len(self.docs)))
+            self.index.delete(np.flatnonzero(~self.docs.live).tolist())
+        elif len(self.index) != len(self.docs):
+            raise ValueError("inverted index rows must align with docs")
+
+    def _tokens(self, row: int) -> List[str]:
+        return self.tokenizer(self.docs.content(row))
+
+    def _append(self, rows: range) -> None:
+        self.index.add(self._tokens(row) for row in rows)
+
+    def _remove_rows(self, rows: List[int]) -> None:
+        self.index.delete(rows)
+
+    def _purge_rows(self, rows: List[int]) -> None:
+        self.index.purge(rows)
+
+    def retrieve_rows(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> RowHits:
+        rows, counts = self.index.top_k(
+            self.tokenizer(query), top_k, _window_rows(self.interval_index, ctx)
+        )
+        return RowHits(self.name, rows, counts.astype(np.float64))
+
+    def retrieve_versions(
+        self, query: str, ctx: TemporalContext, rows: np.ndarray, top_k: Optional[int] = None
+    ) -> RowHits:
+        rows = _window_versions(self.docs, self.interval_index, ctx, rows)
+        matched, counts = self.index.top_k(self.tokenizer(query), top_k, rows, include_deleted=True)
+        return RowHits(self.name, matched, counts.astype(np.float64))
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+@dataclass
+class TemporalGraphRetriever(_DocumentRows):
+    """Multi-hop retriever over a :class:`TemporalGraph` of co-mentioned entities.
+
+    Entities named in the query seed the traversal. Each hop follows only
+    edges whose validity overlaps the query window, up to ``hops`` edges
+    away. A row scores ``paths / hop``: the frontier entities it mentions,
+    discounted by distance. Rows without stored ``entities`` are linked
+    through ``entity_fn`` over their content. Pass ``index`` to reuse
+    adjacency that aligns with ``docs``.
+    """
+
+    docs: Sequence[dict]
+    name: str = "graph"
+    hops: int = 2
+    max_frontier: Optional[int] = 1000
+    entity_fn: Callable[[str], List[str]] = extract_entities
+    index: Optional[TemporalGraph] = None
+
+    def __post_init__(self) -> None:
+        self._init_rows()
+        if self.index is None:
+            self.index = TemporalGraph()
+            self._append(range(len(self.docs)))
+            self.index.delete_rows(np.flatnonzero(~self.docs.live).tolist())
+
+    def _entities(self, row: int) -> List[str]:
+        return self.docs.entities(row) or self.entity_fn(self.docs.content(row))
+
+    def _append(self, rows: range) -> None:
+        self.index.add(
+            rows,
+            (self._entities(row) for row in rows),
+            self.docs.valid_from[rows.start : rows.stop],
+            self.docs.valid_to[rows.start : rows.stop],
+        )
+
+    def _remove_rows(self, rows: List[int]) -> None:
+        self.index.delete_rows(rows)
 
-    def retrieve(self, query: str, ctx: TemporalContext) -> List[RetrievalResult]:
-        tokens = set(query.lower().split())
-        results: List[RetrievalResult] = []
-        for doc in self.docs:
-            if tokens & set(doc["content"].lower().split()):
-                results.append(_wrap(doc, self.name, 0.9))
-        return results
+    def _purge_rows(self, rows: List[int]) -> None:
+        self.index.purge_rows(rows)
+
+    def seeds(self, query: str) -> List[int]:
+        """Graph nodes named in ``query`` (extracted entities and single words)."""
+        names = self.entity_fn(query) + _WORD_RE.findall(query)
+        nodes = (self.index.node(name) for name in names)
+        return sorted({node for node in nodes if node is not None})
+
+    def retrieve_rows(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> RowHits:
+        return self._expand(query, ctx, top_k)
+
+    def retrieve_versions(
+        self, query: str, ctx: TemporalContext, rows: np.ndarray, top_k: Optional[int] = None
+    ) -> RowHits:
+        return self._expand(query, ctx, top_k, rows)
+
+    def _expand(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int], allowed: Optional[np.ndarray] = None
+    ) -> RowHits:
+        seeds = self.seeds(query)
+        if not seeds or (top_k is not None and top_k <= 0):
+            return _hits(self.name, [], [])
+        windowed = ctx.time_start and ctx.time_end
+        rows, hop, paths = self.index.expand(
+            seeds,
+            to_epoch(ctx.time_start) if windowed else OPEN_START,
+            to_epoch(ctx.time_end) if windowed else OPEN_END,
+            hops=self.hops,
+            max_frontier=self.max_frontier,
+            rows=allowed,
+        )
+        scores = paths / hop
+        order = np.lexsort((rows, -scores))[:top_k]
+        return RowHits(self.name, rows[order], scores[order])
 
 
 @dataclass
-class InMemoryDenseRetriever:
-    docs: List[dict]
+class InMemoryDenseRetriever(_DocumentRows):
+    """Position-scored placeholder; use :class:`LocalDenseRetriever` for real embeddings."""
+
+    docs: Sequence[dict]
     name: str = "dense"
+    interval_index: Optional[IntervalIndex] = None
+
+    def __post_init__(self) -> None:
+        self._init_rows()
+
+    def retrieve_rows(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> RowHits:
+        live = self.docs.live
+        rows = [row for row in _candidate_rows(self.docs, self.interval_index, ctx) if live[row]]
+        # Scores fall with row position, so a prefix is already the top k.
+        if top_k is not None:
+            rows = rows[: max(top_k, 0)]
+        return _hits(self.name, rows, [0.6 - (row * 0.05) for row in rows])
+
+    def retrieve_versions(
+        self, query: str, ctx: TemporalContext, rows: np.ndarray, top_k: Optional[int] = None
+    ) -> RowHits:
+        rows = _window_versions(self.docs, self.interval_index, ctx, rows).tolist()
+        if top_k is not None:
+            rows = rows[: max(top_k, 0)]
+        return _hits(self.name, rows, [0.6 - (row * 0.05) for row in rows])
+
+
+@dataclass
+class LocalDenseRetriever(_DocumentRows):
+    """In-process dense retriever over a :class:`DenseIndex`.
+
+    Pass ``index`` to reuse precomputed (e.g. memory-mapped) embeddings that
+    align with ``docs``; otherwise docs are embedded with ``embedding_fn``.
+    Compaction drops removed rows' vectors, so it cannot rank past versions
+    and ``as_of`` queries leave it out.
+    """
+
+    docs: Sequence[dict]
+    embedding_fn: Callable[[str], Iterable[float]]
+    name: str = "dense"
+    index: Optional[DenseIndex] = None
+    interval_index: Optional[IntervalIndex] = None
+    limit: Optional[int] = None
+    nprobe: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        self._init_rows()
+        if self.index is None and len(self.docs):
+            self.index = DenseIndex(self._embed(range(len(self.docs))))
+            dead = np.flatnonzero(~self.docs.live)
+            if dead.size:
+                self.index.delete(dead)
+        if (len(self.index) if self.index is not None else 0) != len(self.docs):
+            raise ValueError("dense index rows must align with docs")
+
+    def _embed(self, rows: Iterable[int]) -> np.ndarray:
+        return np.vstack(
+            [
+                np.asarray(list(self.embedding_fn(self.docs.content(row))), dtype=np.float32)
+                for row in rows
+            ]
+        )
+
+    def _append(self, rows: range) -> None:
+        if self.index is None:
+            self.index = DenseIndex(self._embed(rows))
+        else:
+            self.index.add(self._embed(rows))
+
+    def _remove_rows(self, rows: List[int]) -> None:
+        self.index.delete(rows)
+
+    def retrieve_rows(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> RowHits:
+        if self.index is None:
+            return _hits(self.name, [], [])
+        rows = _window_rows(self.interval_index, ctx)
+        limit = top_k if top_k is not None else self.limit
+        query_vector = np.asarray(list(self.embedding_fn(query)), dtype=np.float32)
+        return RowHits(self.name, *self.index.search(query_vector, limit, rows=rows, nprobe=self.nprobe))
+
+    def retrieve_rows_many(
+        self,
+        queries: Sequence[str],
+        ctxs: Sequence[TemporalContext],
+        top_k: Optional[int] = None,
+    ) -> List[RowHits]:
+        limit = top_k if top_k is not None else self.limit
+        windows = [_window_rows(self.interval_index, ctx) for ctx in ctxs]
+        if self.index is None:
+            return [_hits(self.name, [], []) for _ in queries]
+        if self.nprobe or limit is None or any(rows is not None for rows in windows):
+            return [self.retrieve_rows(q, ctx, top_k) for q, ctx in zip(queries, ctxs)]
+        # Unfiltered brute force: embed once into a matrix, score with one matmul.
+        matrix = np.vstack(
+            [np.asarray(list(self.embedding_fn(q)), dtype=np.float32) for q in queries]
+        )
+        rows, scores = self.index.search_batch(matrix, limit)
+        return [RowHits(self.name, r, s) for r, s in zip(rows, scores)]
 
-    def retrieve(self, query: str, ctx: TemporalContext) -> List[RetrievalResult]:
-        results: List[RetrievalResult] = []
-        for i, doc in enumerate(self.docs):
-            score = 0.6 - (i * 0.05)
-            results.append(_wrap(doc, self.name, score))
-        return results
+    def retrieve_many(
+        self,
+        queries: Sequence[str],
+        ctxs: Sequence[TemporalContext],
+        top_k: Optional[int] = None,
+    ) -> List[List[RetrievalResult]]:
+        return [self._wrap_hits(hits) for hits in self.retrieve_rows_many(queries, ctxs, top_k)]
 
 
 @dataclass
-class BM25Retriever:
-    docs: List[dict]
+class BM25Retriever(_DocumentRows):
+    """Sparse retriever; pass ``index`` to reuse postings that align with ``docs``."""
+
+    docs: Sequence[dict]
     name: str = "sparse"
+    interval_index: Optional[IntervalIndex] = None
+    limit: Optional[int] = None
+    index: Optional[BM25Index] = None
+    tokenizer: Tokenizer = field(default_factory=Tokenizer)
 
     def __post_init__(self) -> None:
-        from rank_bm25 import BM25Okapi
-        self._tokenized = [doc["content"].lower().split() for doc in self.docs]
-        self._bm25 = BM25Okapi(self._tokenized)
+        self._init_rows()
+        if self.index is None:
+            self.index = BM25Index(self._tokens(row) for row in range(len(self.docs)))
+            for row in np.flatnonzero(~self.docs.live).tolist():
+                self.index.delete(row, self._tokens(row))
+        elif len(self.index.doc_len) != len(self.docs):
+            raise ValueError("BM25 index rows must align with docs")
+
+    def _tokens(self, row: int) -> List[str]:
+        return self.tokenizer(self.docs.content(row))
+
+    def _append(self, rows: range) -> None:
+        self.index.add(self._tokens(row) for row in rows)
+
+    def _remove_rows(self, rows: List[int]) -> None:
+        for row in rows:
+            self.index.delete(row, self._tokens(row))
+
+    def _purge_rows(self, rows: List[int]) -> None:
+        self.index.purge(rows)
+
+    def retrieve_rows(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> RowHits:
+        tokens = self.tokenizer(query)
+        rows = _window_rows(self.interval_index, ctx)
+        limit = top_k if top_k is not None else self.limit
+        return RowHits(self.name, *self.index.top_k(tokens, limit, rows))
+
+    def retrieve_versions(
+        self, query: str, ctx: TemporalContext, rows: np.ndarray, top_k: Optional[int] = None
+    ) -> RowHits:
+        limit = top_k if top_k is not None else self.limit
+        tokens = self.tokenizer(query)
+        rows = _window_versions(self.docs, self.interval_index, ctx, rows)
+        return RowHits(self.name, *self.index.top_k(tokens, limit, rows, include_deleted=True))
+
+    def retrieve_rows_many(
+        self,
+        queries: Sequence[str],
+        ctxs: Sequence[TemporalContext],
+        top_k: Optional[int] = None,
+    ) -> List[RowHits]:
+        limit = top_k if top_k is not None else self.limit
+        hits = self.index.top_k_many(
+            [self.tokenizer(query) for query in queries],
+            limit,
+            [_window_rows(self.interval_index, ctx) for ctx in ctxs],
+        )
+        return [RowHits(self.name, rows, scores) for rows, scores in hits]
+
+    def retrieve_many(
+        self,
+        queries: Sequence[str],
+        ctxs: Sequence[TemporalContext],
+        top_k: Optional[int] = None,
+    ) -> List[List[RetrievalResult]]:
+        return [self._wrap_hits(hits) for hits in self.retrieve_rows_many(queries, ctxs, top_k)]
+
+
+# ``pushdown`` filters candidates to the (slack-widened) query window on the
+# server; ``soft`` sends every match and leaves time to the engine's boost.
+_TEMPORAL_MODES = ("pushdown", "soft")
+
+
+def _pushdown_window(
+    ctx: TemporalContext, mode: str, slack: timedelta
+) -> Optional[Tuple[datetime, datetime]]:
+    """Window a remote retriever should filter on, or ``None`` to send all matches."""
+    if mode == "soft" or not (ctx.time_start and ctx.time_end):
+        return None
+    return ctx.time_start - slack, ctx.time_end + slack
+
+
+def _check_temporal_mode(mode: str) -> None:
+    if mode not in _TEMPORAL_MODES:
+        raise ValueError(f"temporal_mode must be one of {_TEMPORAL_MODES}, got {mode!r}")
+
+
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+
+def _lucene_query(query: str) -> str:
+    """Any-term Lucene query for a fulltext index, with syntax characters escaped."""
+    return " OR ".join(_LUCENE_SPECIAL.sub(r"\\\1", term) for term in query.lower().split())
+
+
+def _neo4j_search_cypher(fulltext: bool, windowed: bool, batch: bool = False) -> str:
+    """Search Cypher for one query (``$search``/``$terms``/``$start``/``$end``) or a batch.
+
+    Candidates come from the fulltext index (Lucene score) or, without one,
+    from a label scan on any query term. Window predicates run on the
+    range-indexed epoch properties before ``LIMIT``, so out-of-window nodes
+    never leave the server. A batch is one ``UNWIND $queries`` round trip
+    with a LIMITed subquery per query.
+    """
+    p = "q." if batch else "$"
+    window = f"d.valid_from_epoch <= {p}end AND d.valid_to_epoch >= {p}start" if windowed else "true"
+    if fulltext:
+        match = f"CALL db.index.fulltext.queryNodes($index, {p}search) YIELD node AS d, score WHERE {window} "
+    else:
+        match = (
+            f"MATCH (d:Document) WHERE {window} "
+            f"AND any(term IN {p}terms WHERE toLower(d.content) CONTAINS term) "
+            "WITH d, 0.9 AS score "
+        )
+    fields = (
+        "d.id AS id, d.content AS content, d.valid_from AS valid_from, "
+        "d.valid_to AS valid_to, score"
+    )
+    if not batch:
+        return f"{match}RETURN {fields} ORDER BY score DESC LIMIT $limit"
+    return (
+        "UNWIND $queries AS q "
+        f"CALL {{ WITH q {match}RETURN d, score ORDER BY score DESC LIMIT $limit }} "
+        f"RETURN q.idx AS idx, {fields}"
+    )
+
 
-    def retrieve(self, query: str, ctx: TemporalContext) -> List[RetrievalResult]:
-        tokens = query.lower().split()
-        scores = self._bm25.get_scores(tokens)
-        results: List[RetrievalResult] = []
-        for doc, score in zip(self.docs, scores):
-            results.append(_wrap(doc, self.name, float(score)))
-        results.sort(key=lambda item: item.score, reverse=True)
-        return results
+# Idempotent bulk upsert: one MERGE per document, one round trip per batch.
+# Epoch copies of the window back the range indexes used by pushdown.
+_NEO4J_UPSERT_CYPHER = (
+    "UNWIND $docs AS doc "
+    "MERGE (d:Document {id: doc.id}) "
+    "SET d.content = doc.content, d.valid_from = doc.valid_from, "
+    "d.valid_to = doc.valid_to, d.valid_from_epoch = doc.valid_from_epoch, "
+    "d.valid_to_epoch = doc.valid_to_epoch, d.entities = doc.entities"
+)
+
+_NEO4J_SCHEMA_CYPHER = (
+    "CREATE FULLTEXT INDEX `{fulltext}` IF NOT EXISTS FOR (d:Document) ON EACH [d.content]",
+    "CREATE RANGE INDEX document_valid_from IF NOT EXISTS FOR (d:Document) ON (d.valid_from_epoch)",
+    "CREATE RANGE INDEX document_valid_to IF NOT EXISTS FOR (d:Document) ON (d.valid_to_epoch)",
+)
+
+_NEO4J_DELETE_CYPHER = "MATCH (d:Document {id: $id}) DETACH DELETE d"
 
 
 @dataclass
 class Neo4jGraphRetriever:
+    """Graph retriever over ``Document`` nodes in Neo4j.
+
+    Matches come from the ``fulltext_index`` (``None`` falls back to a label
+    scan). With ``temporal_mode="pushdown"`` the query window, widened by
+    ``window_slack``, is applied server-side on range-indexed epoch
+    properties; ``"soft"`` returns matches from any time. Run
+    :meth:`ensure_indexes` once per database.
+
+    Queries run as managed read transactions, so a ``neo4j://`` URI routes
+    them to cluster readers (writes go to the leader). Each thread reuses
+    one session, which also keeps its bookmarks for read-your-writes; the
+    driver's pool is sized by the ``max_connection_*`` settings.
+
+    Calls go through ``resilience`` (by default a policy built from
+    ``max_retries``/``retry_backoff_s``): jittered exponential backoff, a
+    circuit breaker and hedged reads. Pass one policy to every retriever
+    on the same backend to share its breaker.
+    """
+
     uri: str
     user: str
     password: str
@@ -84,59 +631,234 @@ class Neo4jGraphRetriever:
     query_timeout_s: float = 5.0
     max_retries: int = 2
     retry_backoff_s: float = 0.2
+    write_batch_size: int = 1000
+    fulltext_index: Optional[str] = "document_content"
+    temporal_mode: str = "pushdown"
+    window_slack: timedelta = timedelta(0)
+    max_connection_pool_size: int = 100
+    max_connection_lifetime_s: float = 3600.0
+    connection_acquisition_timeout_s: float = 60.0
+    resilience: Optional[ResiliencePolicy] = None
     _driver: Optional[object] = field(init=False, default=None, repr=False)
+    _async_driver: Optional[object] = field(init=False, default=None, repr=False)
 
     def __post_init__(self) -> None:
         from neo4j import GraphDatabase
-        self._driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
-
-    def retrieve(self, query: str, ctx: TemporalContext) -> List[RetrievalResult]:
-        cypher = (
-            "MATCH (d:Document) "
-            "WHERE toLower(d.content) CONTAINS toLower($term) "
-            "RETURN d.id AS id, d.content AS content, d.valid_from AS valid_from, "
-            "d.valid_to AS valid_to "
-            "LIMIT $limit"
-        )
-        last_exc: Optional[Exception] = None
-        for attempt in range(self.max_retries + 1):
-            try:
-                results: List[RetrievalResult] = []
-                with self._driver.session(database=self.database) as session:
-                    rows = session.run(
-                        cypher,
-                        term=query,
-                        limit=self.limit,
-                        timeout=self.query_timeout_s,
-                    )
-                    for row in rows:
-                        valid_from = _parse_dt(row.get("valid_from"))
-                        valid_to = _parse_dt(row.get("valid_to"))
-                        results.append(
-                            RetrievalResult(
-                                doc_id=row["id"],
-                                content=row["content"],
-                                source=self.name,
-                                score=0.9,
-                                valid_from=valid_from,
-                                valid_to=valid_to,
-                            )
-                        )
-                return results
-            except Exception as exc:  # pragma: no cover - network dependent
-                last_exc = exc
-                if attempt >= self.max_retries:
-                    break
-                time.sleep(self.retry_backoff_s * (attempt + 1))
-        raise RuntimeError("Neo4j query failed after retries") from last_exc
+        _check_temporal_mode(self.temporal_mode)
+        if self.resilience is None:
+            self.resilience = ResiliencePolicy(
+                "neo4j", max_retries=self.max_retries, backoff_base_s=self.retry_backoff_s
+            )
+        self._driver = GraphDatabase.driver(
+            self.uri, auth=(self.user, self.password), **self._pool_settings()
+        )
+        self._local = threading.local()
+        self._sessions: List[object] = []
+        self._sessions_lock = threading.Lock()
+
+    def ensure_indexes(self) -> None:
+        """Create the fulltext and epoch range indexes the search Cypher relies on."""
+        for statement in _NEO4J_SCHEMA_CYPHER:
+            if "FULLTEXT" in statement and self.fulltext_index is None:
+                continue
+            self._run(statement.format(fulltext=self.fulltext_index), write=True)
+
+    def retrieve(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> List[RetrievalResult]:
+        params = self._search_params(query, ctx)
+        if not params["terms"]:
+            return []
+        cypher = _neo4j_search_cypher(self.fulltext_index is not None, params["windowed"])
+        limit = top_k if top_k is not None else self.limit
+        rows = self._run(cypher, index=self.fulltext_index, limit=limit, **params)
+        return [self._to_result(row) for row in rows]
+
+    def retrieve_many(
+        self,
+        queries: Sequence[str],
+        ctxs: Sequence[TemporalContext],
+        top_k: Optional[int] = None,
+    ) -> List[List[RetrievalResult]]:
+        limit = top_k if top_k is not None else self.limit
+        grouped: List[List[RetrievalResult]] = [[] for _ in queries]
+        batch = [
+            dict(self._search_params(query, ctx), idx=idx)
+            for idx, (query, ctx) in enumerate(zip(queries, ctxs))
+        ]
+        batch = [params for params in batch if params["terms"]]
+        if not batch:
+            return grouped
+        windowed = any(params["windowed"] for params in batch)
+        cypher = _neo4j_search_cypher(self.fulltext_index is not None, windowed, batch=True)
+        for row in self._run(cypher, queries=batch, index=self.fulltext_index, limit=limit):
+            grouped[row["idx"]].append(self._to_result(row))
+        return grouped
+
+    def _search_params(self, query: str, ctx: TemporalContext) -> dict:
+        window = _pushdown_window(ctx, self.temporal_mode, self.window_slack)
+        return {
+            "search": _lucene_query(query),
+            "terms": query.lower().split(),
+            "windowed": window is not None,
+            "start": to_epoch(window[0]) if window else OPEN_START,
+            "end": to_epoch(window[1]) if window else OPEN_END,
+        }
+
+    def add_documents(self, docs: Sequence[dict]) -> None:
+        for lo in range(0, len(docs), self.write_batch_size):
+            batch = [
+                {
+                    "id": doc["id"],
+                    "content": doc["content"],
+                    "valid_from": _iso(doc.get("valid_from")),
+                    "valid_to": _iso(doc.get("valid_to")),
+                    "valid_from_epoch": to_epoch(_parse_dt(doc.get("valid_from")), OPEN_START),
+                    "valid_to_epoch": to_epoch(_parse_dt(doc.get("valid_to")), OPEN_END),
+                    "entities": list(doc.get("entities") or []),
+                }
+                for doc in docs[lo : lo + self.write_batch_size]
+            ]
+            self._run(_NEO4J_UPSERT_CYPHER, write=True, docs=batch)
+
+    def update_document(self, doc: dict) -> None:
+        self.add_documents([doc])
+
+    def delete_document(self, doc_id: str) -> None:
+        self._run(_NEO4J_DELETE_CYPHER, write=True, id=doc_id)
+
+    async def aretrieve(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> List[RetrievalResult]:
+        params = self._search_params(query, ctx)
+        if not params["terms"]:
+            return []
+        from neo4j import unit_of_work
+        cypher = _neo4j_search_cypher(self.fulltext_index is not None, params["windowed"])
+        limit = top_k if top_k is not None else self.limit
+
+        @unit_of_work(timeout=self.query_timeout_s)
+        async def work(tx: object) -> List[RetrievalResult]:
+            rows = await tx.run(cypher, index=self.fulltext_index, limit=limit, **params)
+            return [self._to_result(row) async for row in rows]
+
+        async def attempt() -> List[RetrievalResult]:
+            # A session per attempt: async sessions cannot be shared by a
+            # concurrent hedge. Each borrows a pooled connection.
+            async with self._get_async_driver().session(**self._session_settings()) as session:
+                return await session.execute_read(work)
+
+        return await self.resilience.acall(attempt, hedge=True)
 
     def close(self) -> None:
+        self.resilience.close()
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
         if self._driver is not None:
             self._driver.close()
 
+    async def aclose(self) -> None:
+        if self._async_driver is not None:
+            await self._async_driver.close()
+            self._async_driver = None
+
+    def _pool_settings(self) -> dict:
+        return {
+            "max_connection_pool_size": self.max_connection_pool_size,
+            "max_connection_lifetime": self.max_connection_lifetime_s,
+            "connection_acquisition_timeout": self.connection_acquisition_timeout_s,
+        }
+
+    def _session_settings(self) -> dict:
+        # Retries are the resilience policy's; the driver's own transaction
+        # retry loop would otherwise run for up to 30 s first.
+        return {"database": self.database, "max_transaction_retry_time": 0}
+
+    def _session(self) -> object:
+        """This thread's session, opened on first use (sessions are not thread-safe)."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._driver.session(**self._session_settings())
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def _discard_session(self, session: object) -> None:
+        self._local.session = None
+        with self._sessions_lock:
+            if session in self._sessions:
+                self._sessions.remove(session)
+        try:
+            session.close()
+        except Exception:  # pragma: no cover - network dependent
+            pass
+
+    def _run(self, text: str, write: bool = False, **params: object) -> List[object]:
+        from neo4j import unit_of_work
+
+        @unit_of_work(timeout=self.query_timeout_s)
+        def work(tx: object) -> List[object]:
+            return list(tx.run(text, **params))
+
+        def attempt() -> List[object]:
+            session = self._session()
+            try:
+                if write:
+                    return session.execute_write(work)
+                return session.execute_read(work)
+            except Exception:
+                self._discard_session(session)
+                raise
+
+        return self.resilience.call(attempt, hedge=not write)
+
+    def _get_async_driver(self) -> object:
+        # Created lazily so the driver binds to the event loop that uses it.
+        if self._async_driver is None:
+            from neo4j import AsyncGraphDatabase
+            self._async_driver = AsyncGraphDatabase.driver(
+                self.uri, auth=(self.user, self.password), **self._pool_settings()
+            )
+        return self._async_driver
+
+    def _to_result(self, row: object) -> RetrievalResult:
+        return RetrievalResult(
+            doc_id=row["id"],
+            content=row["content"],
+            source=self.name,
+            score=float(row.get("score", 0.9)),
+            valid_from=_parse_dt(row.get("valid_from")),
+            valid_to=_parse_dt(row.get("valid_to")),
+        )
+
+
+_QDRANT_EPOCH_FIELDS = ("valid_from_epoch", "valid_to_epoch")
+# Payload fields a search brings back (skips ISO timestamps and entities).
+_QDRANT_PAYLOAD_FIELDS = ["doc_id", "content", *_QDRANT_EPOCH_FIELDS]
+
 
 @dataclass
 class QdrantDenseRetriever:
+    """Dense retriever over a Qdrant collection.
+
+    Points carry their validity window as integer epoch payloads
+    (``valid_from_epoch``/``valid_to_epoch``, open bounds as the
+    ``OPEN_START``/``OPEN_END`` sentinels). With ``temporal_mode="pushdown"``
+    the query window, widened by ``window_slack``, is sent as a numeric
+    ``range`` filter on them, so only overlapping points are scored and
+    returned; ``"soft"`` sends no filter. :meth:`ensure_indexes` creates the
+    payload indexes that keep the filter cheap. Searches fetch only the
+    payload fields results need.
+
+    Query embeddings are memoized in an LRU keyed by whitespace-normalized
+    text (``embedding_cache_size=0`` disables it). ``prefer_grpc`` talks to
+    Qdrant over gRPC on ``grpc_port``. Requests go through ``resilience``
+    as for :class:`Neo4jGraphRetriever`.
+    """
+
     url: str
     collection: str
     embedding_fn: Callable[[str], Iterable[float]]
@@ -146,42 +868,215 @@ class QdrantDenseRetriever:
     timeout_s: float = 5.0
     max_retries: int = 2
     retry_backoff_s: float = 0.2
+    write_batch_size: int = 256
+    temporal_mode: str = "pushdown"
+    window_slack: timedelta = timedelta(0)
+    embedding_cache_size: int = 4096
+    prefer_grpc: bool = False
+    grpc_port: int = 6334
+    resilience: Optional[ResiliencePolicy] = None
     _client: Optional[object] = field(init=False, default=None, repr=False)
+    _async_client: Optional[object] = field(init=False, default=None, repr=False)
 
     def __post_init__(self) -> None:
         from qdrant_client import QdrantClient
-        self._client = QdrantClient(url=self.url, api_key=self.api_key, timeout=self.timeout_s)
+        _check_temporal_mode(self.temporal_mode)
+        if self.resilience is None:
+            self.resilience = ResiliencePolicy(
+                "qdrant", max_retries=self.max_retries, backoff_base_s=self.retry_backoff_s
+            )
+        self._client = QdrantClient(**self._client_settings())
+        self.embedding_cache = EmbeddingCache(self.embedding_cache_size)
 
-    def retrieve(self, query: str, ctx: TemporalContext) -> List[RetrievalResult]:
-        query_vector = list(self.embedding_fn(query))
-        last_exc: Optional[Exception] = None
-        for attempt in range(self.max_retries + 1):
-            try:
-                hits = self._client.search(
+    def ensure_indexes(self) -> None:
+        """Index the epoch payloads as integers (range only) for the pushdown filter."""
+        from qdrant_client import models
+
+        schema = models.IntegerIndexParams(
+            type=models.IntegerIndexType.INTEGER, lookup=False, range=True
+        )
+        for field_name in _QDRANT_EPOCH_FIELDS:
+            self._with_retries(
+                lambda: self._client.create_payload_index(
                     collection_name=self.collection,
-                    query_vector=query_vector,
-                    limit=self.limit,
+                    field_name=field_name,
+                    field_schema=schema,
+                )
+            )
+
+    def embed_query(self, query: str) -> List[float]:
+        return self.embedding_cache.get_or_compute(query, self.embedding_fn)
+
+    def retrieve(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> List[RetrievalResult]:
+        query_vector = self.embed_query(query)
+        limit = top_k if top_k is not None else self.limit
+        query_filter = self._query_filter(ctx)
+        response = self._with_retries(
+            lambda: self._client.query_points(
+                collection_name=self.collection,
+                query=query_vector,
+                query_filter=query_filter,
+                limit=limit,
+                with_payload=_QDRANT_PAYLOAD_FIELDS,
+            ),
+            hedge=True,
+        )
+        return [self._to_result(hit) for hit in response.points]
+
+    def retrieve_many(
+        self,
+        queries: Sequence[str],
+        ctxs: Sequence[TemporalContext],
+        top_k: Optional[int] = None,
+    ) -> List[List[RetrievalResult]]:
+        from qdrant_client import models
+
+        limit = top_k if top_k is not None else self.limit
+        requests = [
+            models.QueryRequest(
+                query=self.embed_query(q),
+                filter=self._query_filter(ctx),
+                limit=limit,
+                with_payload=_QDRANT_PAYLOAD_FIELDS,
+            )
+            for q, ctx in zip(queries, ctxs)
+        ]
+        if not requests:
+            return []
+        responses = self._with_retries(
+            lambda: self._client.query_batch_points(
+                collection_name=self.collection, requests=requests
+            ),
+            hedge=True,
+        )
+        return [[self._to_result(hit) for hit in response.points] for response in responses]
+
+    def add_documents(self, docs: Sequence[dict]) -> None:
+        from qdrant_client import models
+
+        for lo in range(0, len(docs), self.write_batch_size):
+            points = [
+                models.PointStruct(
+                    id=_point_id(doc["id"]),
+                    vector=[float(x) for x in self.embedding_fn(doc["content"])],
+                    payload={
+                        "doc_id": doc["id"],
+                        "content": doc["content"],
+                        "valid_from": _iso(doc.get("valid_from")),
+                        "valid_to": _iso(doc.get("valid_to")),
+                        "valid_from_epoch": to_epoch(_parse_dt(doc.get("valid_from")), OPEN_START),
+                        "valid_to_epoch": to_epoch(_parse_dt(doc.get("valid_to")), OPEN_END),
+                        "entities": list(doc.get("entities") or []),
+                    },
                 )
-                results: List[RetrievalResult] = []
-                for hit in hits:
-                    payload = hit.payload or {}
-                    results.append(
-                        RetrievalResult(
-                            doc_id=str(hit.id),
-                            content=str(payload.get("content", "")),
-                            source=self.name,
-                            score=float(hit.score),
-                            valid_from=_parse_dt(payload.get("valid_from")),
-                            valid_to=_parse_dt(payload.get("valid_to")),
-                        )
-                    )
-                return results
-            except Exception as exc:  # pragma: no cover - network dependent
-                last_exc = exc
-                if attempt >= self.max_retries:
-                    break
-                time.sleep(self.retry_backoff_s * (attempt + 1))
-        raise RuntimeError("Qdrant search failed after retries") from last_exc
+                for doc in docs[lo : lo + self.write_batch_size]
+            ]
+            self._with_retries(
+                lambda: self._client.upsert(collection_name=self.collection, points=points, wait=True)
+            )
+
+    def update_document(self, doc: dict) -> None:
+        self.add_documents([doc])
+
+    def delete_document(self, doc_id: str) -> None:
+        from qdrant_client import models
+
+        selector = models.PointIdsList(points=[_point_id(doc_id)])
+        self._with_retries(
+            lambda: self._client.delete(
+                collection_name=self.collection, points_selector=selector, wait=True
+            )
+        )
+
+    async def aretrieve(
+        self, query: str, ctx: TemporalContext, top_k: Optional[int] = None
+    ) -> List[RetrievalResult]:
+        client = self._get_async_client()
+        limit = top_k if top_k is not None else self.limit
+        query_vector = self.embedding_cache.get(query)
+        if query_vector is None:
+            # embedding_fn is user-supplied and may block (model or HTTP call).
+            embedded = await asyncio.to_thread(self.embedding_fn, query)
+            query_vector = self.embedding_cache.set(query, embedded)
+        query_filter = self._query_filter(ctx)
+        response = await self.resilience.acall(
+            lambda: client.query_points(
+                collection_name=self.collection,
+                query=query_vector,
+                query_filter=query_filter,
+                limit=limit,
+                with_payload=_QDRANT_PAYLOAD_FIELDS,
+            ),
+            hedge=True,
+        )
+        return [self._to_result(hit) for hit in response.points]
+
+    def close(self) -> None:
+        self.resilience.close()
+        if self._client is not None:
+            self._client.close()
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def _query_filter(self, ctx: TemporalContext) -> Optional[object]:
+        window = _pushdown_window(ctx, self.temporal_mode, self.window_slack)
+        if window is None:
+            return None
+        from qdrant_client import models
+
+        start, end = window
+        # Open bounds are stored as sentinels, so plain ranges suffice.
+        return models.Filter(
+            must=[
+                models.FieldCondition(key="valid_from_epoch", range=models.Range(lte=to_epoch(end))),
+                models.FieldCondition(key="valid_to_epoch", range=models.Range(gte=to_epoch(start))),
+            ]
+        )
+
+    def _with_retries(self, call: Callable[[], object], hedge: bool = False) -> object:
+        return self.resilience.call(call, hedge=hedge)
+
+    def _get_async_client(self) -> object:
+        if self._async_client is None:
+            from qdrant_client import AsyncQdrantClient
+            self._async_client = AsyncQdrantClient(**self._client_settings())
+        return self._async_client
+
+    def _client_settings(self) -> dict:
+        return {
+            "url": self.url,
+            "api_key": self.api_key,
+            "timeout": self.timeout_s,
+            "prefer_grpc": self.prefer_grpc,
+            "grpc_port": self.grpc_port,
+        }
+
+    def _to_result(self, hit: object) -> RetrievalResult:
+        payload = hit.payload or {}
+        return RetrievalResult(
+            doc_id=str(payload.get("doc_id", hit.id)),
+            content=str(payload.get("content", "")),
+            source=self.name,
+            score=float(hit.score),
+            valid_from=from_epoch(payload.get("valid_from_epoch", OPEN_START)),
+            valid_to=from_epoch(payload.get("valid_to_epoch", OPEN_END)),
+        )
+
+
+def _point_id(doc_id: str) -> str:
+    # Qdrant ids must be integers or UUIDs; derive a stable UUID from the doc id.
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"temporal-graph-rag:{doc_id}"))
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
 
 
 def _parse_dt(value: Optional[str]) -> Optional[datetime]:
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Union
+
+from temporal_graph_rag.fusion import FusionConfig
+from temporal_graph_rag.index.bm25 import BM25Index
+from temporal_graph_rag.index.dense import DenseIndex
+from temporal_graph_rag.index.graph import TemporalGraph
+from temporal_graph_rag.index.inverted import InvertedIndex
+from temporal_graph_rag.index.tokenize import Tokenizer
+from temporal_graph_rag.retrievers import (
+    BM25Retriever,
+    InMemoryDenseRetriever,
+    InMemoryGraphRetriever,
+    LocalDenseRetriever,
+    Retriever,
+    TemporalGraphRetriever,
+)
+from temporal_graph_rag.store import DocumentStore
+from temporal_graph_rag.temporal.bitemporal import BitemporalIndex
+from temporal_graph_rag.temporal.interval_index import IntervalIndex
+
+if TYPE_CHECKING:
+    from temporal_graph_rag.engine import TemporalGraphRAG
+
+
+SNAPSHOT_VERSION = 5
+_KINDS = {
+    InMemoryGraphRetriever: "graph",
+    InMemoryDenseRetriever: "positional",
+    BM25Retriever: "bm25",
+    LocalDenseRetriever: "local_dense",
+    TemporalGraphRetriever: "temporal_graph",
+}
+
+
+def save_snapshot(engine: "TemporalGraphRAG", path: Union[str, Path]) -> None:
+    """Write ``engine``'s docs, interval indexes and in-process retriever indexes.
+
+    Layout: ``manifest.json``, ``docs/``, ``intervals/`` (valid time),
+    ``transactions/`` (transaction time) and one
+    ``retrievers/<position>-<kind>/`` directory per retriever, all plain
+    ``.npy`` arrays plus small JSON metadata. The snapshot is assembled in a
+    sibling temp directory and renamed over ``path`` once complete.
+    Remote retrievers (Neo4j, Qdrant) own their data and cannot be snapshotted.
+    """
+    path = Path(path)
+    docs = engine._docs
+    horizon = engine.history_horizon
+    entries = []
+    for retriever in engine._retrievers:
+        kind = _KINDS.get(type(retriever))
+        if kind is None:
+            raise TypeError(f"cannot snapshot retriever {retriever.name!r} ({type(retriever).__name__})")
+        if retriever.docs is not docs:
+            raise ValueError(f"retriever {retriever.name!r} does not share the engine's DocumentStore")
+        own_index = getattr(retriever, "interval_index", None)
+        prefilter = own_index is engine._interval_index
+        if own_index is not None and not prefilter:
+            raise ValueError(f"retriever {retriever.name!r} has its own interval index")
+        entry = {"kind": kind, "name": retriever.name, "prefilter": prefilter}
+        for option in ("limit", "nprobe", "hops", "max_frontier"):
+            if hasattr(retriever, option):
+                entry[option] = getattr(retriever, option)
+        if hasattr(retriever, "tokenizer"):
+            entry["tokenizer"] = retriever.tokenizer.to_config()
+        entries.append(entry)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{path.name}.", dir=path.parent))
+    try:
+        docs.save_snapshot(staging / "docs")
+        engine._interval_index.save_snapshot(staging / "intervals", include_ids=False)
+        engine._history.save_snapshot(staging / "transactions")
+        for position, (retriever, entry) in enumerate(zip(engine._retrievers, entries)):
+            index = getattr(retriever, "index", None)
+            if index is not None:
+                index.save_snapshot(staging / "retrievers" / f"{position}-{entry['kind']}")
+        manifest = {
+            "version": SNAPSHOT_VERSION,
+            "documents": len(docs),
+            "retrievers": entries,
+            "fusion": engine.fusion.to_dict(),
+            "history_horizon": horizon.isoformat() if horizon is not None else None,
+        }
+        (staging / "manifest.json").write_text(json.dumps(manifest, indent=2))
+        if path.exists():
+            shutil.rmtree(path)
+        staging.rename(path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def needs_embedding_fn(path: Union[str, Path]) -> bool:
+    """Whether :func:`load_snapshot` needs ``embedding_fn`` (a dense retriever embeds queries)."""
+    manifest = json.loads((Path(path) / "manifest.json").read_text())
+    return any(entry["kind"] == "local_dense" for entry in manifest["retrievers"])
+
+
+def load_snapshot(
+    path: Union[str, Path],
+    embedding_fn: Optional[Callable[[str], Iterable[float]]] = None,
+    mmap: bool = True,
+    **engine_kwargs,
+) -> "TemporalGraphRAG":
+    """Rebuild an engine from :func:`save_snapshot` output without re-indexing.
+
+    With ``mmap`` every large array is memory-mapped read-only, so startup
+    cost is independent of corpus size and forked workers share pages.
+    ``embedding_fn`` embeds queries (and later writes) for a dense retriever;
+    it must be the function the snapshot was built with.
+    """
+    from temporal_graph_rag.engine import TemporalGraphRAG
+
+    path = Path(path)
+    manifest = json.loads((path / "manifest.json").read_text())
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported snapshot version {manifest.get('version')!r}")
+    store = DocumentStore.open_snapshot(path / "docs", mmap=mmap)
+    intervals = IntervalIndex.open_snapshot(path / "intervals", mmap=mmap)
+    history = BitemporalIndex.open_snapshot(path / "transactions", mmap=mmap)
+
+    retrievers: List[Retriever] = []
+    for position, entry in enumerate(manifest["retrievers"]):
+        kind = entry["kind"]
+        directory = path / "retrievers" / f"{position}-{kind}"
+        shared = intervals if entry["prefilter"] else None
+        tokenizer = Tokenizer.from_config(entry.get("tokenizer", {}))
+        if kind == "graph":
+            retriever = InMemoryGraphRetriever(
+                store,
+                name=entry["name"],
+                interval_index=shared,
+                tokenizer=tokenizer,
+                index=InvertedIndex.open_snapshot(directory, mmap=mmap),
+            )
+        elif kind == "positional":
+            retriever = InMemoryDenseRetriever(store, name=entry["name"], interval_index=shared)
+        elif kind == "bm25":
+            retriever = BM25Retriever(
+                store,
+                name=entry["name"],
+                interval_index=shared,
+                limit=entry.get("limit"),
+                index=BM25Index.open_snapshot(directory, mmap=mmap),
+                tokenizer=tokenizer,
+            )
+        elif kind == "local_dense":
+            if embedding_fn is None:
+                raise ValueError("snapshot has a dense retriever; pass embedding_fn")
+            retriever = LocalDenseRetriever(
+                store,
+                embedding_fn,
+                name=entry["name"],
+                index=DenseIndex.open_snapshot(directory, mmap=mmap) if directory.exists() else None,
+                interval_index=shared,
+                limit=entry.get("limit"),
+                nprobe=entry.get("nprobe"),
+            )
+        elif kind == "temporal_graph":
+            retriever = TemporalGraphRetriever(
+                store,
+                name=entry["name"],
+                hops=entry["hops"],
+                max_frontier=entry["max_frontier"],
+                index=TemporalGraph.open_snapshot(directory, mmap=mmap),
+            )
+        else:
+            raise ValueError(f"unknown retriever kind {kind!r} in snapshot")
+        retrievers.append(retriever)
+    if "fusion" in manifest:
+        engine_kwargs.setdefault("fusion", FusionConfig.from_dict(manifest["fusion"]))
+    if manifest.get("history_horizon"):
+        engine_kwargs.setdefault("history_horizon", datetime.fromisoformat(manifest["history_horizon"]))
+    return TemporalGraphRAG(
+        store,
+        retrievers=retrievers,
+        interval_index=intervals,
+        history_index=history,
+        **engine_kwargs,
+    )
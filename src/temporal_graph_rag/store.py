@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+from collections.abc import Sequence as SequenceABC
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from temporal_graph_rag.arrays import GrowableArray, load_array
+from temporal_graph_rag.temporal.epoch import OPEN_END, OPEN_START, from_epoch, to_epoch
+
+
+_ARRAYS = (
+    "id_data",
+    "id_offsets",
+    "content_data",
+    "content_offsets",
+    "valid_from",
+    "valid_to",
+    "live",
+    "transaction_from",
+    "transaction_to",
+    "entity_data",
+    "entity_offsets",
+)
+
+# Joins a row's entity names inside the packed entity column.
+_ENTITY_SEP = "\x1f"
+
+
+def _pack(texts: Iterable[str], start: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """UTF-8 buffer plus ``len + 1`` offsets (the first being ``start``)."""
+    encoded = [text.encode("utf-8") for text in texts]
+    offsets = np.full(len(encoded) + 1, start, dtype=np.int64)
+    offsets[1:] += np.cumsum([len(chunk) for chunk in encoded], dtype=np.int64)
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _epochs(docs: Sequence[Optional[dict]], key: str, default: int) -> np.ndarray:
+    return np.asarray(
+        [to_epoch(doc.get(key), default) if doc else default for doc in docs], dtype=np.int64
+    )
+
+
+def _entity_text(doc: Optional[dict]) -> str:
+    return _ENTITY_SEP.join(doc.get("entities") or []) if doc else ""
+
+
+def _recorded_at(docs: Sequence[dict], default: datetime) -> np.ndarray:
+    """Transaction start per doc: ``transaction_from``, else ``ingestion_time``, else ``default``."""
+    epochs = []
+    for doc in docs:
+        value = doc.get("transaction_from") or doc.get("ingestion_time") or default
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        epochs.append(to_epoch(value))
+    return np.asarray(epochs, dtype=np.int64)
+
+
+class DocumentStore(SequenceABC):
+    """Columnar document table shared by the engine and in-process retrievers.
+
+    Ids and content live in offset-indexed UTF-8 buffers and validity windows
+    in int64 epoch arrays (``OPEN_START``/``OPEN_END`` for open bounds), so
+    the store holds no per-document Python objects. Retrieval works on
+    integer row ids; ids are interned to rows by a map built on first lookup,
+    and rows are materialized as dicts only when indexed. Writes append rows
+    and tombstone replaced or deleted ones (read back as ``None``), so row
+    ids are stable.
+
+    The store is bitemporal: each row is a fact version recorded over
+    ``[transaction_from, transaction_to)`` (epoch seconds; ``OPEN_END`` while
+    current). A doc's ``transaction_from`` or ``ingestion_time`` field sets
+    its start, defaulting to the write time; replacing or deleting a version
+    closes its interval instead of discarding it. Timestamps are kept at
+    one-second resolution. Fields other than ``id``, ``content``,
+    ``entities``, the validity window and the transaction start are dropped.
+    """
+
+    def __init__(
+        self,
+        id_data: np.ndarray,
+        id_offsets: np.ndarray,
+        content_data: np.ndarray,
+        content_offsets: np.ndarray,
+        valid_from: np.ndarray,
+        valid_to: np.ndarray,
+        live: np.ndarray,
+        transaction_from: np.ndarray,
+        transaction_to: np.ndarray,
+        entity_data: np.ndarray,
+        entity_offsets: np.ndarray,
+    ) -> None:
+        arrays = (
+            id_data,
+            id_offsets,
+            content_data,
+            content_offsets,
+            valid_from,
+            valid_to,
+            live,
+            transaction_from,
+            transaction_to,
+            entity_data,
+            entity_offsets,
+        )
+        self._columns: Dict[str, GrowableArray] = {
+            name: GrowableArray(array) for name, array in zip(_ARRAYS, arrays)
+        }
+        self._row_of: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_docs(
+        cls, docs: Iterable[Optional[dict]], at: Optional[datetime] = None
+    ) -> "DocumentStore":
+        """Pack ``docs``; ``None`` entries become rows that were never believed."""
+        docs = list(docs)
+        live = np.asarray([doc is not None for doc in docs], dtype=bool)
+        recorded = _recorded_at([doc for doc in docs if doc], at or datetime.utcnow())
+        transaction_from = np.full(len(docs), OPEN_START, dtype=np.int64)
+        transaction_from[live] = recorded
+        id_data, id_offsets = _pack(doc["id"] if doc else "" for doc in docs)
+        content_data, content_offsets = _pack(doc["content"] if doc else "" for doc in docs)
+        return cls(
+            id_data,
+            id_offsets,
+            content_data,
+            content_offsets,
+            _epochs(docs, "valid_from", OPEN_START),
+            _epochs(docs, "valid_to", OPEN_END),
+            live,
+            transaction_from,
+            np.where(live, OPEN_END, OPEN_START),
+            *_pack(_entity_text(doc) for doc in docs),
+        )
+
+    @property
+    def valid_from(self) -> np.ndarray:
+        return self._columns["valid_from"].values
+
+    @property
+    def valid_to(self) -> np.ndarray:
+        return self._columns["valid_to"].values
+
+    @property
+    def live(self) -> np.ndarray:
+        return self._columns["live"].values
+
+    @property
+    def transaction_from(self) -> np.ndarray:
+        return self._columns["transaction_from"].values
+
+    @property
+    def transaction_to(self) -> np.ndarray:
+        return self._columns["transaction_to"].values
+
+    def __len__(self) -> int:
+        return self._columns["live"].size
+
+    def __getitem__(self, row: int) -> Optional[dict]:
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not self.live[row]:
+            return None
+        return {
+            "id": self.doc_id(row),
+            "content": self.content(row),
+            "valid_from": from_epoch(int(self.valid_from[row])),
+            "valid_to": from_epoch(int(self.valid_to[row])),
+        }
+
+    def doc_id(self, row: int) -> str:
+        return self._text("id", row)
+
+    def content(self, row: int) -> str:
+        """Content of ``row``; still readable after the row is deleted."""
+        return self._text("content", row)
+
+    def entities(self, row: int) -> List[str]:
+        """Entity names stored with ``row`` (empty when the doc listed none)."""
+        text = self._text("entity", row)
+        return text.split(_ENTITY_SEP) if text else []
+
+    def _text(self, column: str, row: int) -> str:
+        offsets = self._columns[f"{column}_offsets"].values
+        data = self._columns[f"{column}_data"].values
+        return bytes(data[offsets[row] : offsets[row + 1]]).decode("utf-8")
+
+    @property
+    def ids(self) -> "_IdColumn":
+        """Lazy ``Sequence[str]`` of doc ids (deleted rows included)."""
+        return _IdColumn(self)
+
+    def row_of(self, doc_id: str) -> Optional[int]:
+        """Live row holding ``doc_id``, if any."""
+        return self._rows().get(doc_id)
+
+    def _rows(self) -> Dict[str, int]:
+        if self._row_of is None:
+            live = self.live
+            self._row_of = {
+                doc_id: row for row, doc_id in enumerate(self.ids.to_list()) if live[row]
+            }
+        return self._row_of
+
+    def upsert(
+        self, docs: Iterable[dict], at: Optional[datetime] = None
+    ) -> Tuple[range, List[int]]:
+        """Append ``docs`` and close the versions they replace (same id).
+
+        Within one batch the last document per id wins. A replaced version's
+        transaction interval ends where its successor's begins. Returns the
+        appended rows and the replaced ones.
+        """
+        docs = list({doc["id"]: doc for doc in docs}.values())
+        recorded = _recorded_at(docs, at or datetime.utcnow())
+        rows = self._rows()
+        replaced, closed_at = [], []
+        for doc, start in zip(docs, recorded.tolist()):
+            row = rows.pop(doc["id"], None)
+            if row is not None:
+                replaced.append(row)
+                closed_at.append(start)
+        self._tombstone(replaced, closed_at)
+        first = len(self)
+        texts = {
+            "id": [doc["id"] for doc in docs],
+            "content": [doc["content"] for doc in docs],
+            "entity": [_entity_text(doc) for doc in docs],
+        }
+        for column, values in texts.items():
+            offsets = self._columns[f"{column}_offsets"]
+            data, new_offsets = _pack(values, int(offsets.values[-1]))
+            self._columns[f"{column}_data"].extend(data)
+            offsets.extend(new_offsets[1:])
+        self._columns["valid_from"].extend(_epochs(docs, "valid_from", OPEN_START))
+        self._columns["valid_to"].extend(_epochs(docs, "valid_to", OPEN_END))
+        self._columns["live"].extend(np.ones(len(docs), dtype=bool))
+        self._columns["transaction_from"].extend(recorded)
+        self._columns["transaction_to"].extend(np.full(len(docs), OPEN_END, dtype=np.int64))
+        for row, doc in enumerate(docs, start=first):
+            rows[doc["id"]] = row
+        return range(first, len(self)), replaced
+
+    def delete(self, doc_ids: Iterable[str], at: Optional[datetime] = None) -> List[int]:
+        """Close the current versions of ``doc_ids`` at ``at`` (default now); returns their rows."""
+        rows = self._rows()
+        removed = [rows.pop(doc_id) for doc_id in doc_ids if doc_id in rows]
+        self._tombstone(removed, [to_epoch(at or datetime.utcnow())] * len(removed))
+        return removed
+
+    def _tombstone(self, rows: List[int], closed_at: List[int]) -> None:
+        if rows:
+            self._columns["live"].writable()[rows] = False
+            # Never end a version before it began (e.g. a backfilled ingestion_time).
+            opened = self.transaction_from[rows]
+            self._columns["transaction_to"].writable()[rows] = np.maximum(opened, closed_at)
+
+    def save_snapshot(self, directory: Union[str, Path]) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in _ARRAYS:
+            np.save(directory / f"{name}.npy", self._columns[name].values)
+
+    @classmethod
+    def open_snapshot(cls, directory: Union[str, Path], mmap: bool = True) -> "DocumentStore":
+        directory = Path(directory)
+        return cls(*(load_array(directory / f"{name}.npy", mmap) for name in _ARRAYS))
+
+
+class _IdColumn(SequenceABC):
+    def __init__(self, store: DocumentStore) -> None:
+        self._store = store
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __getitem__(self, row: int) -> str:
+        if isinstance(row, slice):
+            return [self._store.doc_id(i) for i in range(*row.indices(len(self)))]
+        return self._store.doc_id(row)
+
+    def to_list(self) -> List[str]:
+        columns = self._store._columns
+        data = bytes(columns["id_data"].values)
+        offsets = columns["id_offsets"].values.tolist()
+        return [data[lo:hi].decode("utf-8") for lo, hi in zip(offsets, offsets[1:])]
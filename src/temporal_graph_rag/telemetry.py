@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Iterator, Optional, Tuple
+
+from opentelemetry import trace
+
+
+STAGE_HISTOGRAM = "tgrag_stage_duration_seconds"
+# Sub-millisecond buckets: in-memory stages run in microseconds.
+_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+_NOOP = nullcontext()
+
+_tracer: Optional[trace.Tracer] = None
+_histogram = None
+_registry = None
+
+
+def configure(
+    metrics: Optional[bool] = None,
+    tracing: Optional[bool] = None,
+    registry: object = None,
+) -> None:
+    """Enable per-stage spans and/or Prometheus histograms.
+
+    ``metrics=None`` records histograms only if ``prometheus_client`` is
+    installed; ``True`` requires it. ``tracing=None`` emits spans only when an
+    OpenTelemetry SDK tracer provider is installed (call after setting it up).
+    ``registry`` defaults to a private ``CollectorRegistry``.
+    """
+    global _tracer, _histogram, _registry
+    if tracing is None:
+        provider = trace.get_tracer_provider()
+        tracing = not isinstance(provider, (trace.ProxyTracerProvider, trace.NoOpTracerProvider))
+    _tracer = trace.get_tracer("temporal_graph_rag") if tracing else None
+
+    _histogram = _registry = None
+    if metrics is False:
+        return
+    try:
+        from prometheus_client import CollectorRegistry, Histogram
+    except ImportError:
+        if metrics:
+            raise ImportError(
+                "metrics require prometheus_client: pip install 'temporal-graph-rag[metrics]'"
+            ) from None
+        return
+    _registry = registry if registry is not None else CollectorRegistry()
+    _histogram = Histogram(
+        STAGE_HISTOGRAM,
+        "Latency of one query pipeline stage.",
+        ("stage", "retriever"),
+        registry=_registry,
+        buckets=_BUCKETS,
+    )
+
+
+def disable() -> None:
+    global _tracer, _histogram, _registry
+    _tracer = _histogram = _registry = None
+
+
+def enabled() -> bool:
+    return _tracer is not None or _histogram is not None
+
+
+def stage(name: str, retriever: str = "") -> ContextManager[None]:
+    """Span + histogram observation around one stage; a shared no-op when disabled."""
+    if _tracer is None and _histogram is None:
+        return _NOOP
+    return _record(name, retriever)
+
+
+@contextmanager
+def _record(name: str, retriever: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        if _tracer is None:
+            yield
+        else:
+            attributes = {"tgrag.retriever": retriever} if retriever else None
+            with _tracer.start_as_current_span(f"tgrag.{name}", attributes=attributes):
+                yield
+    finally:
+        if _histogram is not None:
+            _histogram.labels(name, retriever).observe(time.perf_counter() - start)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Prometheus exposition payload and content type for ``/metrics``."""
+    if _registry is None:
+        raise RuntimeError("metrics are not enabled; call telemetry.configure()")
+    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+    return generate_latest(_registry), CONTENT_TYPE_LATEST
@@ -2,21 +2,46 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Literal
+from typing import List, Literal, Optional, Tuple
+
+import numpy as np
 
 
 AllenRelation = Literal[
     "before",
-    "after",
     "meets",
-    "met_by",
     "overlaps",
-    "during",
     "starts",
+    "during",
     "finishes",
     "equals",
+    "finished_by",
+    "contains",
+    "started_by",
+    "overlapped_by",
+    "met_by",
+    "after",
 ]
 
+# Relation codes for the array API: ``RELATIONS[code]``. The order makes the
+# inverse of code ``c`` (the relation of b to a) ``12 - c``.
+RELATIONS: Tuple[str, ...] = (
+    "before",
+    "meets",
+    "overlaps",
+    "starts",
+    "during",
+    "finishes",
+    "equals",
+    "finished_by",
+    "contains",
+    "started_by",
+    "overlapped_by",
+    "met_by",
+    "after",
+)
+CODES = {name: code for code, name in enumerate(RELATIONS)}
+
 
 @dataclass(frozen=True)
 class Interval:
@@ -47,4 +72,156 @@ def relate(a: Interval, b: Interval) -> AllenRelation:
         if a.end == b.end:
             return "finishes"
         return "during"
-    return "overlaps"
+    if b.start < a.start:
+        return "overlapped_by"
+    if a.start == b.start:
+        return "started_by"
+    if a.end == b.end:
+        return "finished_by"
+    return "contains"
+
+
+def relation_codes(
+    a_start: np.ndarray, a_end: np.ndarray, b_start: np.ndarray, b_end: np.ndarray
+) -> np.ndarray:
+    """Relation code of each ``a`` to each ``b``, with NumPy broadcasting.
+
+    Endpoints are int64 (e.g. epoch seconds with ``OPEN_START``/``OPEN_END``
+    sentinels). The checks mirror :func:`relate` case for case, so
+    ``RELATIONS[code]`` always equals the scalar answer.
+    """
+    a_start, a_end, b_start, b_end = np.broadcast_arrays(a_start, a_end, b_start, b_end)
+    same_start, same_end = a_start == b_start, a_end == b_end
+    within = (b_start <= a_start) & (a_end <= b_end)
+    conditions = [
+        same_start & same_end,
+        a_end < b_start,
+        a_start > b_end,
+        a_end == b_start,
+        a_start == b_end,
+        (a_start < b_start) & (b_start < a_end) & (a_end < b_end),
+        within & same_start,
+        within & same_end,
+        within,
+        b_start < a_start,
+        same_start,
+        same_end,
+    ]
+    choices = [
+        CODES[name]
+        for name in (
+            "equals",
+            "before",
+            "after",
+            "meets",
+            "met_by",
+            "overlaps",
+            "starts",
+            "finishes",
+            "during",
+            "overlapped_by",
+            "started_by",
+            "finished_by",
+        )
+    ]
+    return np.select(conditions, choices, default=CODES["contains"]).astype(np.int8)
+
+
+def pairwise_relations(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """``(n, n)`` codes: entry ``[i, j]`` relates interval ``i`` to interval ``j``."""
+    start, end = np.asarray(start), np.asarray(end)
+    return relation_codes(start[:, None], end[:, None], start[None, :], end[None, :])
+
+
+def neighbor_relations(start: np.ndarray, end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Timeline order and the relation of each interval to the next one in it.
+
+    Returns ``(order, codes)``: ``order`` sorts by ``(start, end)`` and
+    ``codes[i]`` relates ``order[i]`` to ``order[i + 1]``.
+    """
+    start, end = np.asarray(start), np.asarray(end)
+    order = np.lexsort((end, start))
+    s, e = start[order], end[order]
+    return order, relation_codes(s[:-1], e[:-1], s[1:], e[1:])
+
+
+def _composition_table() -> np.ndarray:
+    """``table[r1, r2]``: bitmask of relations ``a r b`` and ``b r2 c`` allow between a and c.
+
+    Derived by enumerating every configuration of three proper intervals
+    over six points, which realizes every ordering of their endpoints.
+    """
+    points = np.arange(6)
+    starts, ends = np.meshgrid(points, points, indexing="ij")
+    proper = starts < ends
+    s, e = starts[proper], ends[proper]
+    i, j, k = (axis.ravel() for axis in np.meshgrid(*[np.arange(s.shape[0])] * 3, indexing="ij"))
+    ab = relation_codes(s[i], e[i], s[j], e[j]).astype(np.int64)
+    bc = relation_codes(s[j], e[j], s[k], e[k]).astype(np.int64)
+    ac = relation_codes(s[i], e[i], s[k], e[k]).astype(np.int64)
+    table = np.zeros((len(RELATIONS), len(RELATIONS)), dtype=np.uint16)
+    np.bitwise_or.at(table, (ab, bc), (1 << ac).astype(np.uint16))
+    return table
+
+
+COMPOSITION = _composition_table()
+
+
+def compose(r1: np.ndarray, r2: np.ndarray) -> np.ndarray:
+    """Bitmask of possible ``a``-to-``c`` relations given ``a r1 b`` and ``b r2 c`` (codes)."""
+    return COMPOSITION[np.asarray(r1, dtype=np.intp), np.asarray(r2, dtype=np.intp)]
+
+
+def composition_allows(r1: np.ndarray, r2: np.ndarray, r3: np.ndarray) -> np.ndarray:
+    """Whether ``a r3 c`` is consistent with ``a r1 b`` and ``b r2 c`` (element-wise)."""
+    return (compose(r1, r2) >> np.asarray(r3, dtype=np.uint16)) & 1 == 1
+
+
+def relation_names(mask: int) -> List[str]:
+    """Names of the relations set in a composition bitmask."""
+    return [name for code, name in enumerate(RELATIONS) if mask >> code & 1]
+
+
+def overlapping_pairs(
+    start: np.ndarray,
+    end: np.ndarray,
+    groups: Optional[np.ndarray] = None,
+    touching: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """All pairs ``(i, j)``, ``i < j``, of intervals that share time, in O(n log n + k).
+
+    A sweep over intervals sorted by start: each interval pairs with the
+    later-starting ones that begin before it ends, found by one binary
+    search, and the ``k`` pairs are emitted in one vectorized pass.
+    Intervals are closed, so ``touching`` intervals (one ends where the
+    other starts) overlap; ``touching=False`` drops the pairs that
+    :func:`relation_codes` calls ``meets``/``met_by``. ``groups`` restricts
+    pairs to intervals with the same group label (e.g. one subject's
+    mutually exclusive states).
+    """
+    start, end = np.asarray(start, dtype=np.int64), np.asarray(end, dtype=np.int64)
+    n = start.shape[0]
+    if groups is None:
+        order = np.argsort(start, kind="stable")
+        limit = np.searchsorted(start[order], end[order], side="right")
+    else:
+        group_codes = np.unique(np.asarray(groups), return_inverse=True)[1].astype(np.int64)
+        order = np.lexsort((start, group_codes))
+        # Dense start ranks keep (group, start) in one int64 key.
+        values, ranks = np.unique(start, return_inverse=True)
+        stride = values.shape[0] + 1
+        keys = group_codes[order] * stride + ranks[order]
+        end_rank = np.searchsorted(values, end[order], side="right")
+        limit = np.searchsorted(keys, group_codes[order] * stride + end_rank, side="left")
+    first = np.arange(1, n + 1, dtype=np.int64)
+    counts = np.maximum(limit - first, 0)
+    total = int(counts.sum())
+    left = np.repeat(np.arange(n, dtype=np.int64), counts)
+    offsets = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+    right = np.repeat(first, counts) + offsets
+    i, j = order[left], order[right]
+    if not touching:
+        codes = relation_codes(start[i], end[i], start[j], end[j])
+        keep = (codes != CODES["meets"]) & (codes != CODES["met_by"])
+        i, j = i[keep], j[keep]
+    return np.minimum(i, j), np.maximum(i, j)
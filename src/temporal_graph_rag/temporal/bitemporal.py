@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Sequence, Union
+
+import numpy as np
+
+from temporal_graph_rag.temporal.epoch import OPEN_END, to_epoch
+from temporal_graph_rag.temporal.interval_index import IntervalIndex
+
+
+class BitemporalIndex:
+    """Transaction-time index: which fact versions were believed at an instant.
+
+    Every store row is a version recorded over ``[transaction_from,
+    transaction_to)``; writes only append versions and close the ones they
+    supersede. The half-open intervals are kept in an :class:`IntervalIndex`
+    (as closed ``[from, to - 1]`` second ranges), so :meth:`believed_at` is a
+    pruned stabbing query rather than a scan of version history (see
+    :class:`IntervalIndex` for its cost).
+    Row ids align with the ``DocumentStore``.
+    """
+
+    def __init__(self, transaction_from: Sequence[int], transaction_to: Sequence[int]) -> None:
+        self._index = IntervalIndex(transaction_from, _closed(transaction_to))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def append(self, transaction_from: Sequence[int], transaction_to: Sequence[int]) -> range:
+        return self._index.insert(transaction_from, _closed(transaction_to))
+
+    def close(self, rows: Sequence[int], transaction_to: Sequence[int]) -> None:
+        """Record that ``rows`` stopped being believed at ``transaction_to``."""
+        self._index.set_ends(rows, _closed(transaction_to).tolist())
+
+    def believed_at(self, as_of: datetime) -> np.ndarray:
+        """Sorted rows whose transaction interval contains ``as_of``."""
+        instant = to_epoch(as_of)
+        return self._index.overlapping_epochs(instant, instant)
+
+    def save_snapshot(self, directory: Union[str, Path]) -> None:
+        self._index.save_snapshot(directory, include_ids=False)
+
+    @classmethod
+    def open_snapshot(cls, directory: Union[str, Path], mmap: bool = True) -> "BitemporalIndex":
+        index = cls.__new__(cls)
+        index._index = IntervalIndex.open_snapshot(directory, mmap=mmap)
+        return index
+
+
+def _closed(transaction_to: Sequence[int]) -> np.ndarray:
+    ends = np.asarray(transaction_to, dtype=np.int64)
+    return np.where(ends >= OPEN_END, ends, ends - 1)
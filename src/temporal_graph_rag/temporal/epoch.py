@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import calendar
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+
+# Sentinels for unbounded interval endpoints. Open-ended rows (valid_to=None)
+# use OPEN_END so "still valid" intervals compare greater than any real date.
+OPEN_START = -(2**62)
+OPEN_END = 2**62
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(value: Optional[datetime], default: int = OPEN_END) -> int:
+    """Convert a datetime to integer epoch seconds (naive values are UTC)."""
+    if value is None:
+        return default
+    if value.tzinfo is not None:
+        return calendar.timegm(value.utctimetuple())
+    return (value - _EPOCH) // timedelta(seconds=1)
+
+
+def from_epoch(value: int) -> Optional[datetime]:
+    """Inverse of :func:`to_epoch`; sentinels map back to ``None``."""
+    if value >= OPEN_END or value <= OPEN_START:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc).replace(tzinfo=None)
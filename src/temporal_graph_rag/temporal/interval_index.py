@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from temporal_graph_rag.arrays import load_array
+from temporal_graph_rag.temporal.epoch import OPEN_END, OPEN_START, to_epoch
+
+# End value of a removed row: below every query bound, so it never overlaps.
+_REMOVED = OPEN_START - 1
+
+
+class IntervalIndex:
+    """Augmented interval index over ``[valid_from, valid_to]`` windows.
+
+    Rows are kept sorted by start. A pyramid of per-block max/min end values
+    sits on top, so an overlap query prunes (or accepts) whole subtrees
+    instead of scanning every row. Ends are unsorted within a block, so each
+    leaf block that holds both hits and misses is scanned in O(leaf_size):
+    a query costs O(log n + k) plus O(leaf_size) per such mixed block, which
+    approaches a scan when short and long windows interleave. Open-ended
+    rows (``valid_to=None``) carry the ``OPEN_END`` sentinel.
+
+    :meth:`insert` appends rows to a small unsorted buffer that queries scan
+    directly; the sorted arrays are rebuilt once it outgrows ``n / 8``.
+    :meth:`remove` tombstones rows in place; row ids are never reused.
+    """
+
+    def __init__(
+        self,
+        starts: Sequence[int],
+        ends: Sequence[int],
+        ids: Optional[Sequence[str]] = None,
+        leaf_size: int = 64,
+    ) -> None:
+        starts_arr = np.asarray(starts, dtype=np.int64)
+        ends_arr = np.asarray(ends, dtype=np.int64)
+        if starts_arr.shape != ends_arr.shape:
+            raise ValueError("starts and ends must have the same length")
+        if ids is not None and len(ids) != len(starts_arr):
+            raise ValueError("ids must align with starts/ends")
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be >= 1")
+
+        self._ids = list(ids) if ids is not None else None
+        self._leaf_size = leaf_size
+        self._max_levels: List[np.ndarray] = []
+        self._min_levels: List[np.ndarray] = []
+        self._build(starts_arr, ends_arr)
+
+    def _build(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        self._order = np.argsort(starts, kind="stable")
+        self._rank = np.empty_like(self._order)
+        self._rank[self._order] = np.arange(self._order.shape[0])
+        self._starts = starts[self._order]
+        self._ends = ends[self._order]
+        self._buf_starts = np.zeros(0, dtype=np.int64)
+        self._buf_ends = np.zeros(0, dtype=np.int64)
+        self._build_pyramid()
+
+    @classmethod
+    def from_docs(cls, docs: Sequence[dict], leaf_size: int = 64) -> "IntervalIndex":
+        starts = [to_epoch(doc.get("valid_from"), OPEN_START) for doc in docs]
+        ends = [to_epoch(doc.get("valid_to"), OPEN_END) for doc in docs]
+        return cls(starts, ends, ids=[doc["id"] for doc in docs], leaf_size=leaf_size)
+
+    def __len__(self) -> int:
+        return int(self._starts.shape[0] + self._buf_starts.shape[0])
+
+    def save_snapshot(self, directory: Union[str, Path], include_ids: bool = True) -> None:
+        """Write the sorted arrays; the pyramid is cheap to rebuild on open."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in ("starts", "ends", "order", "buf_starts", "buf_ends"):
+            np.save(directory / f"{name}.npy", getattr(self, f"_{name}"))
+        meta = {"leaf_size": self._leaf_size, "has_ids": self._ids is not None}
+        (directory / "meta.json").write_text(json.dumps(meta))
+        if include_ids and self._ids is not None:
+            (directory / "ids.json").write_text(json.dumps(list(self._ids)))
+
+    @classmethod
+    def open_snapshot(
+        cls, directory: Union[str, Path], ids: Optional[Sequence[str]] = None, mmap: bool = True
+    ) -> "IntervalIndex":
+        """Open a snapshot; ``ids`` (e.g. ``DocumentStore.ids``) overrides a saved ``ids.json``."""
+        directory = Path(directory)
+        meta = json.loads((directory / "meta.json").read_text())
+        index = cls.__new__(cls)
+        index._leaf_size = meta["leaf_size"]
+        index._starts = load_array(directory / "starts.npy", mmap)
+        index._ends = load_array(directory / "ends.npy", mmap)
+        index._order = load_array(directory / "order.npy", mmap)
+        index._buf_starts = load_array(directory / "buf_starts.npy", mmap=False)
+        index._buf_ends = load_array(directory / "buf_ends.npy", mmap=False)
+        index._rank = np.empty(index._order.shape[0], dtype=np.int64)
+        index._rank[index._order] = np.arange(index._order.shape[0])
+        if ids is None and meta["has_ids"]:
+            ids = json.loads((directory / "ids.json").read_text())
+        if ids is not None and len(ids) != len(index):
+            raise ValueError("ids must align with the snapshot rows")
+        index._ids = ids
+        index._build_pyramid()
+        return index
+
+    def insert(
+        self, starts: Sequence[int], ends: Sequence[int], ids: Optional[Sequence[str]] = None
+    ) -> range:
+        """Append rows (epoch bounds) and return their row ids."""
+        starts_arr = np.asarray(starts, dtype=np.int64)
+        ends_arr = np.asarray(ends, dtype=np.int64)
+        if starts_arr.shape != ends_arr.shape:
+            raise ValueError("starts and ends must have the same length")
+        if (ids is None) != (self._ids is None) or (ids is not None and len(ids) != len(starts_arr)):
+            raise ValueError("ids must be given (and align) iff the index was built with ids")
+        first = len(self)
+        if ids is not None:
+            if not isinstance(self._ids, list):
+                self._ids = list(self._ids)  # lazy id column from a snapshot
+            self._ids.extend(ids)
+        self._buf_starts = np.concatenate([self._buf_starts, starts_arr])
+        self._buf_ends = np.concatenate([self._buf_ends, ends_arr])
+        if self._buf_starts.shape[0] > max(4 * self._leaf_size, self._starts.shape[0] // 8):
+            base_starts = np.empty_like(self._starts)
+            base_ends = np.empty_like(self._ends)
+            base_starts[self._order] = self._starts
+            base_ends[self._order] = self._ends
+            self._build(
+                np.concatenate([base_starts, self._buf_starts]),
+                np.concatenate([base_ends, self._buf_ends]),
+            )
+        return range(first, len(self))
+
+    def remove(self, rows: Iterable[int]) -> None:
+        """Tombstone ``rows``: O(leaf_size + log n) each, no re-sort."""
+        rows = list(rows)
+        self.set_ends(rows, [_REMOVED] * len(rows))
+
+    def set_ends(self, rows: Sequence[int], ends: Sequence[int]) -> None:
+        """Move the end of each row (e.g. to close an open interval) in place."""
+        base = self._starts.shape[0]
+        if not self._ends.flags.writeable:
+            self._ends = np.array(self._ends)  # copy-on-write for a memory-mapped snapshot
+        for row, end in zip(rows, ends):
+            if row >= base:
+                self._buf_ends[row - base] = end
+                continue
+            pos = int(self._rank[row])
+            self._ends[pos] = end
+            self._repair(pos // self._leaf_size)
+
+    def _repair(self, block: int) -> None:
+        leaf = self._leaf_size
+        ends = self._ends[block * leaf : (block + 1) * leaf]
+        self._max_levels[0][block] = ends.max()
+        self._min_levels[0][block] = ends.min()
+        node = block
+        for level in range(1, len(self._max_levels)):
+            node //= 2
+            below_max, below_min = self._max_levels[level - 1], self._min_levels[level - 1]
+            children = slice(2 * node, min(2 * node + 2, below_max.shape[0]))
+            self._max_levels[level][node] = below_max[children].max()
+            self._min_levels[level][node] = below_min[children].min()
+
+    def insert_docs(self, docs: Sequence[dict]) -> range:
+        return self.insert(
+            [to_epoch(doc.get("valid_from"), OPEN_START) for doc in docs],
+            [to_epoch(doc.get("valid_to"), OPEN_END) for doc in docs],
+            ids=[doc["id"] for doc in docs] if self._ids is not None else None,
+        )
+
+    def overlapping(self, start: Optional[datetime], end: Optional[datetime]) -> np.ndarray:
+        """Row ids whose window overlaps ``[start, end]`` (``None`` = unbounded)."""
+        return self.overlapping_epochs(to_epoch(start, OPEN_START), to_epoch(end, OPEN_END))
+
+    def overlapping_ids(self, start: Optional[datetime], end: Optional[datetime]) -> List[str]:
+        if self._ids is None:
+            raise ValueError("IntervalIndex was built without ids")
+        return [self._ids[row] for row in self.overlapping(start, end)]
+
+    def overlapping_epochs(self, lo: int, hi: int) -> np.ndarray:
+        base = self._overlapping_base(lo, hi)
+        if not self._buf_starts.size or hi < lo:
+            return base
+        # Buffered rows come after every base row, so appending keeps the order.
+        hits = np.flatnonzero((self._buf_starts <= hi) & (self._buf_ends >= lo))
+        return np.concatenate([base, hits + self._starts.shape[0]])
+
+    def _overlapping_base(self, lo: int, hi: int) -> np.ndarray:
+        n = self._starts.shape[0]
+        if n == 0 or hi < lo:
+            return np.empty(0, dtype=np.int64)
+        # Only rows starting at or before ``hi`` can overlap; they form a prefix.
+        limit = int(np.searchsorted(self._starts, hi, side="right"))
+        if limit == 0:
+            return np.empty(0, dtype=np.int64)
+
+        leaf = self._leaf_size
+        chunks: List[np.ndarray] = []
+        stack = [(len(self._max_levels) - 1, 0)]
+        while stack:
+            level, node = stack.pop()
+            span = leaf << level
+            pos_start = node * span
+            if pos_start >= limit or self._max_levels[level][node] < lo:
+                continue
+            pos_end = min(pos_start + span, n)
+            if pos_end <= limit and self._min_levels[level][node] >= lo:
+                chunks.append(np.arange(pos_start, pos_end, dtype=np.int64))
+            elif level == 0:
+                stop = min(pos_end, limit)
+                hits = np.flatnonzero(self._ends[pos_start:stop] >= lo)
+                if hits.size:
+                    chunks.append(hits + pos_start)
+            else:
+                stack.append((level - 1, 2 * node + 1))
+                stack.append((level - 1, 2 * node))
+
+        if not chunks:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(self._order[np.concatenate(chunks)])
+
+    def _build_pyramid(self) -> None:
+        n = self._starts.shape[0]
+        leaf = self._leaf_size
+        blocks = max(1, -(-n // leaf))
+        pad = blocks * leaf - n
+        max_level = np.concatenate([self._ends, np.full(pad, OPEN_START, dtype=np.int64)])
+        min_level = np.concatenate([self._ends, np.full(pad, OPEN_END, dtype=np.int64)])
+        max_level = max_level.reshape(blocks, leaf).max(axis=1)
+        min_level = min_level.reshape(blocks, leaf).min(axis=1)
+        self._max_levels = [max_level]
+        self._min_levels = [min_level]
+        while max_level.shape[0] > 1:
+            if max_level.shape[0] % 2:
+                max_level = np.append(max_level, OPEN_START)
+                min_level = np.append(min_level, OPEN_END)
+            max_level = max_level.reshape(-1, 2).max(axis=1)
+            min_level = min_level.reshape(-1, 2).min(axis=1)
+            self._max_levels.append(max_level)
+            self._min_levels.append(min_level)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import calendar
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+
+from temporal_graph_rag.types import TemporalContext
+
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_ORDINAL_QUARTERS = {"first": 1, "second": 2, "third": 3, "fourth": 4, "1st": 1, "2nd": 2, "3rd": 3, "4th": 4}
+_OPERATORS = {
+    "before": "BEFORE",
+    "prior to": "BEFORE",
+    "until": "BEFORE",
+    "after": "AFTER",
+    "since": "AFTER",
+    "during": "DURING",
+    "between": "BETWEEN",
+}
+# Canonical output order, independent of where operators appear in the query.
+_OPERATOR_ORDER = ("BEFORE", "AFTER", "DURING", "BETWEEN")
+_GRANULARITY_RANK = {"year": 0, "quarter": 1, "month": 2, "week": 3, "day": 4}
+
+_YEAR = r"(?:19|20)\d{2}"
+# One alternation, most specific first, scanned once with finditer.
+_TOKEN_RE = re.compile(
+    rf"""
+    (?P<iso>\b(?P<iso_y>{_YEAR})-(?P<iso_m>0[1-9]|1[0-2])(?:-(?P<iso_d>0[1-9]|[12]\d|3[01]))?\b)
+  | (?P<quarter>\bq(?P<q_n>[1-4])\s*(?:of\s+)?(?P<q_y>{_YEAR})\b
+        | \b(?P<q_y2>{_YEAR})\s*q(?P<q_n2>[1-4])\b
+        | \b(?P<q_word>first|second|third|fourth|1st|2nd|3rd|4th)\s+quarter\s+(?:of\s+)?(?P<q_y3>{_YEAR})\b)
+  | (?P<month>\b(?P<m_name>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?,?\s+(?P<m_y>{_YEAR})\b)
+  | (?P<lastn>\b(?:last|past|previous)\s+(?P<n>\d{{1,3}})\s+(?P<n_unit>day|week|month|year)s?\b)
+  | (?P<rel>\b(?P<rel_dir>last|this|next|previous|current)\s+(?P<rel_unit>year|quarter|month|week)\b)
+  | (?P<ytd>\b(?:ytd|year[\s-]to[\s-]date)\b)
+  | (?P<day>\b(?:today|yesterday)\b)
+  | (?P<year>\b{_YEAR}\b)
+  | (?P<op>\b(?:before|prior\s+to|until|after|since|during|between)\b)
+    """,
+    re.VERBOSE,
+)
+_RANGE_SEP_RE = re.compile(r"(?:and|to|through|thru|until|till|-|–)")
+
+
+class Token(NamedTuple):
+    """A scanned temporal expression; ``kind`` selects how ``args`` resolve."""
+
+    kind: str
+    args: Tuple
+    start: int
+    end: int
+
+
+class Window(NamedTuple):
+    start: datetime
+    end: datetime
+    granularity: str
+
+
+@lru_cache(maxsize=4096)
+def scan(text: str) -> Tuple[Token, ...]:
+    """Tokenize a query in one pass. Memoized: independent of reference time."""
+    tokens: List[Token] = []
+    for match in _TOKEN_RE.finditer(text.lower()):
+        g = match.group
+        if g("iso"):
+            day = g("iso_d")
+            args = (int(g("iso_y")), int(g("iso_m")), int(day) if day else None)
+            tokens.append(Token("iso", args, match.start(), match.end()))
+        elif g("quarter"):
+            if g("q_n"):
+                args = (int(g("q_y")), int(g("q_n")))
+            elif g("q_n2"):
+                args = (int(g("q_y2")), int(g("q_n2")))
+            else:
+                args = (int(g("q_y3")), _ORDINAL_QUARTERS[g("q_word")])
+            tokens.append(Token("quarter", args, match.start(), match.end()))
+        elif g("month"):
+            args = (int(g("m_y")), _MONTHS[g("m_name")])
+            tokens.append(Token("month", args, match.start(), match.end()))
+        elif g("lastn"):
+            tokens.append(Token("lastn", (int(g("n")), g("n_unit")), match.start(), match.end()))
+        elif g("rel"):
+            direction = {"previous": "last", "current": "this"}.get(g("rel_dir"), g("rel_dir"))
+            tokens.append(Token("rel", (direction, g("rel_unit")), match.start(), match.end()))
+        elif g("ytd"):
+            tokens.append(Token("ytd", (), match.start(), match.end()))
+        elif g("day"):
+            tokens.append(Token("day", (g("day"),), match.start(), match.end()))
+        elif g("year"):
+            tokens.append(Token("year", (int(g("year")),), match.start(), match.end()))
+        elif g("op"):
+            op = " ".join(g("op").split())
+            tokens.append(Token("op", (_OPERATORS[op],), match.start(), match.end()))
+    return tuple(tokens)
+
+
+def parse_temporal_context(query: str, reference_time: datetime) -> TemporalContext:
+    """Extract operators and the query window, resolving relative phrases against ``reference_time``."""
+    tokens = scan(query)
+    operators = {token.args[0] for token in tokens if token.kind == "op"}
+    expressions = [token for token in tokens if token.kind != "op"]
+    windows = [_resolve(token, reference_time) for token in expressions]
+
+    time_start: Optional[datetime] = None
+    time_end: Optional[datetime] = None
+    granularity = "day"
+    if windows:
+        if len(windows) >= 2 and ("BETWEEN" in operators or _is_range(query, expressions)):
+            operators.add("BETWEEN")
+            first, last = windows[0], windows[-1]
+            time_start, time_end = min(first.start, last.start), max(first.end, last.end)
+            granularity = first.granularity
+        else:
+            # The most specific expression wins ("March 2024" over "2024").
+            best = max(windows, key=lambda w: _GRANULARITY_RANK[w.granularity])
+            time_start, time_end, granularity = best
+
+    return TemporalContext(
+        reference_time=reference_time,
+        operators=[op for op in _OPERATOR_ORDER if op in operators],
+        time_start=time_start,
+        time_end=time_end,
+        granularity=granularity,
+    )
+
+
+def _is_range(query: str, expressions: List[Token]) -> bool:
+    first, second = expressions[0], expressions[1]
+    between = query[first.end : second.start].strip().lower()
+    return bool(_RANGE_SEP_RE.fullmatch(between))
+
+
+def _resolve(token: Token, ref: datetime) -> Window:
+    kind, args = token.kind, token.args
+    if kind == "year":
+        return _year(args[0])
+    if kind == "month":
+        return _month(*args)
+    if kind == "quarter":
+        return _quarter(*args)
+    if kind == "iso":
+        year, month, day = args
+        if day is None:
+            return _month(year, month)
+        day = min(day, calendar.monthrange(year, month)[1])
+        moment = datetime(year, month, day)
+        return Window(moment, moment, "day")
+    if kind == "ytd":
+        return Window(datetime(ref.year, 1, 1), _midnight(ref), "day")
+    if kind == "day":
+        moment = _midnight(ref) - timedelta(days=1 if args[0] == "yesterday" else 0)
+        return Window(moment, moment, "day")
+    if kind == "lastn":
+        count, unit = args
+        end = _midnight(ref)
+        return Window(_shift(end, unit, -count), end, "day")
+
+    direction, unit = args
+    offset = {"last": -1, "this": 0, "next": 1}[direction]
+    if unit == "year":
+        return _year(ref.year + offset)
+    if unit == "quarter":
+        index = ref.year * 4 + (ref.month - 1) // 3 + offset
+        return _quarter(index // 4, index % 4 + 1)
+    if unit == "month":
+        index = ref.year * 12 + ref.month - 1 + offset
+        return _month(index // 12, index % 12 + 1)
+    monday = _midnight(ref) - timedelta(days=ref.weekday()) + timedelta(weeks=offset)
+    return Window(monday, monday + timedelta(days=6), "week")
+
+
+def _midnight(value: datetime) -> datetime:
+    return datetime.combine(value.date(), datetime.min.time())
+
+
+def _year(year: int) -> Window:
+    return Window(datetime(year, 1, 1), datetime(year, 12, 31), "year")
+
+
+def _month(year: int, month: int) -> Window:
+    return Window(
+        datetime(year, month, 1),
+        datetime(year, month, calendar.monthrange(year, month)[1]),
+        "month",
+    )
+
+
+def _quarter(year: int, quarter: int) -> Window:
+    first = 3 * (quarter - 1) + 1
+    last = first + 2
+    return Window(
+        datetime(year, first, 1),
+        datetime(year, last, calendar.monthrange(year, last)[1]),
+        "quarter",
+    )
+
+
+def _shift(value: datetime, unit: str, count: int) -> datetime:
+    if unit == "day":
+        return value + timedelta(days=count)
+    if unit == "week":
+        return value + timedelta(weeks=count)
+    months = count * (12 if unit == "year" else 1)
+    index = value.year * 12 + value.month - 1 + months
+    year, month = index // 12, index % 12 + 1
+    day = min(value.day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
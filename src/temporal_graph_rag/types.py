@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -22,6 +22,9 @@ class RetrievalResult:
     score: float
     valid_from: Optional[datetime]
     valid_to: Optional[datetime]
+    # Transaction time: when this version was recorded and superseded (None = still believed).
+    transaction_from: Optional[datetime] = None
+    transaction_to: Optional[datetime] = None
 
 
 @dataclass
@@ -33,6 +36,8 @@ class FusedRetrievalResult:
     source_scores: dict[str, float]
     valid_from: Optional[datetime]
     valid_to: Optional[datetime]
+    transaction_from: Optional[datetime] = None
+    transaction_to: Optional[datetime] = None
 
 
 @dataclass
@@ -40,3 +45,11 @@ class QueryResponse:
     answer: str
     sources: List[FusedRetrievalResult]
     temporal_context: TemporalContext
+    # Retrievers that failed or missed their deadline; fusion ran without them.
+    degraded_sources: List[str] = field(default_factory=list)
+    # Why each degraded retriever is missing: "error", "timeout", "circuit_open",
+    # or "no_history" when it cannot rank the versions of an ``as_of`` query.
+    degraded_reasons: Dict[str, str] = field(default_factory=dict)
+    # Retrievers a cascade skipped because they could not change the top k; the
+    # fused scores leave them out, so they are partial sums when this is non-empty.
+    skipped_sources: List[str] = field(default_factory=list)
@@ -0,0 +1,80 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from temporal_graph_rag.api.main import app
+from temporal_graph_rag.engine import TemporalGraphRAG
+from temporal_graph_rag.index.dense import hashing_embedder
+from temporal_graph_rag.retrievers import BM25Retriever, LocalDenseRetriever
+from temporal_graph_rag.store import DocumentStore
+
+
+def test_query_endpoint_returns_sources():
+    with TestClient(app) as client:
+        resp = client.post(
+            "/query",
+            json={"query": "Who led Project Orion before 2024?", "reference_time": "2024-06-01T00:00:00"},
+        )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert "doc-1" in [s["doc_id"] for s in body["sources"]]
+    assert body["temporal_context"]["granularity"] == "year"
+    assert body["degraded_sources"] == []
+
+
+def test_query_before_history_horizon_is_rejected():
+    with TestClient(app) as client:
+        app.state.engine.compact_history(datetime(2025, 1, 1))
+        resp = client.post("/query", json={"query": "Who led Project Orion?", "as_of": "2024-03-01T00:00:00Z"})
+    assert resp.status_code == 422
+    assert "history horizon" in resp.json()["detail"]
+
+
+def test_batch_endpoint_answers_each_query():
+    with TestClient(app) as client:
+        resp = client.post(
+            "/query/batch",
+            json={
+                "queries": [
+                    {"query": "Who led Project Orion before 2024?"},
+                    {"query": "What changed during March 2024?", "reference_time": "2024-06-01T00:00:00"},
+                ],
+                "top_k": 2,
+            },
+        )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert len(body) == 2
+    assert body[1]["temporal_context"]["granularity"] == "month"
+    assert all(len(item["sources"]) <= 2 for item in body)
+
+
+def test_snapshot_with_dense_retriever_needs_embedding_fn(tmp_path, monkeypatch):
+    docs = [
+        {"id": f"d{i}", "content": f"Team {i} shipped release {i}", "valid_from": datetime(2024, 1, 1)}
+        for i in range(10)
+    ]
+    store = DocumentStore.from_docs(docs)
+    retrievers = [BM25Retriever(store), LocalDenseRetriever(store, hashing_embedder(64))]
+    TemporalGraphRAG(store, retrievers=retrievers).save_snapshot(tmp_path / "snap")
+    monkeypatch.setenv("TGRAG_SNAPSHOT", str(tmp_path / "snap"))
+    with pytest.raises(RuntimeError, match="TGRAG_EMBEDDING_FN"):
+        with TestClient(app):
+            pass
+
+    monkeypatch.setenv("TGRAG_EMBEDDING_FN", "hashing:64")
+    with TestClient(app) as client:
+        resp = client.post("/query", json={"query": "release 3", "top_k": 3})
+    assert resp.status_code == 200
+    assert resp.json()["sources"][0]["doc_id"] == "d3"
+
+
+def test_metrics_endpoint_reports_stage_histograms():
+    pytest.importorskip("prometheus_client")
+    with TestClient(app) as client:
+        client.post("/query", json={"query": "Who led Project Orion before 2024?"})
+        resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert 'tgrag_stage_duration_seconds_count{retriever="sparse",stage="retrieve"}' in resp.text
+    assert 'stage="fusion"' in resp.text
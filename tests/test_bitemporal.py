@@ -0,0 +1,133 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from temporal_graph_rag import TemporalGraphRAG
+from temporal_graph_rag.retrievers import BM25Retriever, TemporalGraphRetriever
+from temporal_graph_rag.store import DocumentStore
+from temporal_graph_rag.temporal.bitemporal import BitemporalIndex
+from temporal_graph_rag.temporal.epoch import OPEN_END, to_epoch
+
+
+def _doc(doc_id, content, recorded, start=datetime(2023, 1, 1), end=None):
+    return {
+        "id": doc_id,
+        "content": content,
+        "valid_from": start,
+        "valid_to": end,
+        "transaction_from": recorded,
+    }
+
+
+def test_bitemporal_index_stabs_transaction_intervals():
+    index = BitemporalIndex([10, 20, 30], [20, OPEN_END, 40])
+    assert index.believed_at(datetime(1970, 1, 1, 0, 0, 15)).tolist() == [0]
+    assert index.believed_at(datetime(1970, 1, 1, 0, 0, 20)).tolist() == [1]  # half-open end
+    assert index.append([35], [OPEN_END]) == range(3, 4)
+    index.close([1], [33])
+    assert index.believed_at(datetime(1970, 1, 1, 0, 0, 36)).tolist() == [2, 3]
+
+
+def test_store_closes_superseded_versions():
+    store = DocumentStore.from_docs([_doc("a", "Alice leads Orion", datetime(2024, 1, 1))])
+    added, replaced = store.upsert([_doc("a", "Bob leads Orion", datetime(2024, 6, 1))])
+    assert replaced == [0] and store.transaction_to[0] == to_epoch(datetime(2024, 6, 1))
+    assert store.transaction_to[added[0]] == OPEN_END
+
+    store.delete(["a"], at=datetime(2024, 9, 1))
+    assert store.transaction_to[1] == to_epoch(datetime(2024, 9, 1))
+
+
+def test_query_as_of_answers_from_past_beliefs(tmp_path):
+    engine = TemporalGraphRAG([_doc("lead", "Alice leads Project Orion", datetime(2024, 1, 1))])
+    engine.add_documents([_doc("lead", "Bob leads Project Orion", datetime(2024, 6, 1))])
+
+    now = engine.query("Who leads Orion")
+    assert [s.content for s in now.sources] == ["Bob leads Project Orion"]
+    past = engine.query("Who leads Orion", as_of=datetime(2024, 3, 1))
+    assert [s.content for s in past.sources] == ["Alice leads Project Orion"]
+    assert past.sources[0].transaction_to == datetime(2024, 6, 1)
+    assert engine.query("Who leads Orion", as_of=datetime(2023, 1, 1)).sources == []
+
+    engine.save_snapshot(tmp_path / "snap")
+    reopened = TemporalGraphRAG.from_snapshot(tmp_path / "snap")
+    again = reopened.query("Who leads Orion", as_of=datetime(2024, 3, 1))
+    assert [s.content for s in again.sources] == ["Alice leads Project Orion"]
+
+
+def test_query_as_of_reads_tombstones_in_the_persistent_indexes():
+    store = DocumentStore.from_docs([_doc("lead", "Alice leads Project Orion", datetime(2024, 1, 1))])
+    sparse, graph = BM25Retriever(store), TemporalGraphRetriever(store)
+    engine = TemporalGraphRAG(store, retrievers=[sparse, graph])
+    engine.add_documents([_doc("lead", "Bob leads Project Orion", datetime(2024, 6, 1))])
+    engine.delete_document("lead")
+
+    assert engine.query("Who leads Project Orion").sources == []
+    past = engine.query("Who leads Project Orion", as_of=datetime(2024, 3, 1))
+    assert [s.content for s in past.sources] == ["Alice leads Project Orion"]
+    assert sorted(past.sources[0].sources) == ["graph", "sparse"]
+    later = engine.query("Who leads Project Orion", as_of=datetime(2024, 7, 1))
+    assert [s.content for s in later.sources] == ["Bob leads Project Orion"]
+    # Answered from the retrievers' own indexes, so nothing is degraded.
+    assert past.degraded_sources == []
+
+
+def test_query_as_of_now_matches_a_plain_query():
+    engine = TemporalGraphRAG()
+    query, ref = "Who took over infrastructure in 2023?", datetime(2025, 1, 1)
+    plain = engine.query(query, reference_time=ref)
+    now = engine.query(query, reference_time=ref, as_of=datetime.utcnow())
+    assert [s.doc_id for s in now.sources] == [s.doc_id for s in plain.sources]
+    assert len(now.sources) == 3
+
+    # The window only filters versions when prefiltering is asked for.
+    filtered = TemporalGraphRAG(temporal_prefilter=True)
+    assert [s.doc_id for s in filtered.query(query, reference_time=ref, as_of=datetime.utcnow()).sources] == [
+        s.doc_id for s in filtered.query(query, reference_time=ref).sources
+    ] == ["doc-1"]
+
+
+class _Remote:
+    name = "remote"
+
+    def retrieve(self, query, ctx, top_k=None):
+        return []
+
+
+def test_query_as_of_reports_retrievers_without_history():
+    engine = TemporalGraphRAG(retrievers=[_Remote()])
+    response = engine.query("Who leads Orion", as_of=datetime.utcnow())
+    assert response.sources == []
+    assert response.degraded_reasons == {"remote": "no_history"}
+
+
+def test_compact_history_purges_old_versions(tmp_path):
+    store = DocumentStore.from_docs([_doc("lead", "Alice leads Project Orion", datetime(2024, 1, 1))])
+    sparse, graph = BM25Retriever(store), TemporalGraphRetriever(store)
+    engine = TemporalGraphRAG(store, retrievers=[sparse, graph])
+    engine.add_documents([_doc("lead", "Bob leads Project Orion", datetime(2024, 6, 1))])
+    edges = len(graph.index)
+
+    assert engine.compact_history(datetime(2024, 7, 1)) == 1
+    assert engine.history_horizon == datetime(2024, 7, 1)
+    assert len(graph.index) < edges and sparse.index.postings.purged.tolist() == [True, False]
+    with pytest.raises(ValueError, match="history horizon"):
+        engine.query("Who leads Project Orion", as_of=datetime(2024, 3, 1))
+    later = engine.query("Who leads Project Orion", as_of=datetime(2024, 7, 1))
+    assert [s.content for s in later.sources] == ["Bob leads Project Orion"]
+
+    engine.save_snapshot(tmp_path / "snap")
+    reopened = TemporalGraphRAG.from_snapshot(tmp_path / "snap")
+    assert reopened.history_horizon == datetime(2024, 7, 1)
+    with pytest.raises(ValueError):
+        reopened.query("Who leads Project Orion", as_of=datetime(2024, 3, 1))
+
+
+def test_history_retention_compacts_on_write():
+    engine = TemporalGraphRAG(
+        [_doc("lead", "Alice leads Project Orion", datetime(2024, 1, 1))], history_retention=timedelta(days=30)
+    )
+    engine.add_documents([_doc("lead", "Bob leads Project Orion", datetime(2024, 6, 1))])
+    assert engine.history_horizon is not None and engine.history_horizon > datetime(2024, 6, 1)
+    with pytest.raises(ValueError):
+        engine.query("Who leads Orion", as_of=datetime(2024, 3, 1))
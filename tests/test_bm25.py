@@ -0,0 +1,87 @@
+import random
+
+import numpy as np
+from rank_bm25 import BM25Okapi
+
+from temporal_graph_rag.index.bm25 import BM25Index
+
+
+def _corpus(n, seed=11):
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(60)]
+    # Skewed draw so some terms hit more than half the docs (negative idf floor).
+    return [[words[int(rng.paretovariate(1.2)) % 60] for _ in range(rng.randint(1, 12))] for _ in range(n)]
+
+
+def test_scores_are_bit_identical_to_rank_bm25():
+    corpus = _corpus(400)
+    reference = BM25Okapi(corpus)
+    index = BM25Index(corpus)
+    for query in (["w1", "w3", "w1"], ["w0", "w59", "missing"], ["w2"]):
+        expected = reference.get_scores(query)
+        rows, scores = index.score(query)
+        assert np.array_equal(scores, expected[rows])
+        untouched = np.setdiff1d(np.arange(len(corpus)), rows)
+        assert not expected[untouched].any()
+
+
+def test_top_k_matches_stable_full_sort():
+    corpus = _corpus(300, seed=5)
+    index = BM25Index(corpus)
+    rows, scores = index.score(["w1", "w4"])
+    full = sorted(zip(rows.tolist(), scores.tolist()), key=lambda item: item[1], reverse=True)
+    top_rows, top_scores = index.top_k(["w1", "w4"], k=10)
+    assert top_rows.tolist() == [row for row, _ in full[:10]]
+    assert top_scores.tolist() == [score for _, score in full[:10]]
+
+
+def test_appended_documents_score_like_a_full_rebuild():
+    corpus = _corpus(500, seed=3)
+    index = BM25Index(corpus[:200])
+    for lo in range(200, 500, 10):
+        rows = index.add(corpus[lo : lo + 10])
+        assert list(rows) == list(range(lo, lo + 10))
+    reference = BM25Okapi(corpus)
+    for query in (["w1", "w7"], ["w0", "w42", "w1"]):
+        expected = reference.get_scores(query)
+        rows, scores = index.score(query)
+        assert np.array_equal(scores, expected[rows])
+        assert np.count_nonzero(expected) == rows.shape[0]
+
+
+def test_deleted_rows_drop_out_of_scores_and_statistics():
+    corpus = _corpus(300, seed=8)
+    index = BM25Index(corpus)
+    deleted = set(range(0, 300, 7))
+    for row in deleted:
+        index.delete(row, corpus[row])
+    index.add(corpus[:20])  # merged postings keep tombstoned rows; scoring masks them
+
+    live = [row for row in range(320) if row not in deleted]
+    full = corpus + corpus[:20]
+    reference = BM25Okapi([full[row] for row in live])
+    for query in (["w1", "w5"], ["w0", "w33"]):
+        expected = reference.get_scores(query)
+        rows, scores = index.score(query)
+        assert not deleted & set(rows.tolist())
+        positions = np.searchsorted(live, rows)
+        np.testing.assert_allclose(scores, expected[positions], rtol=1e-12)
+        assert np.count_nonzero(expected) == rows.shape[0]
+
+
+def test_single_document_writes_keep_scores_bit_identical(tmp_path):
+    corpus = _corpus(260, seed=4)
+    index = BM25Index(corpus[:100])
+    for row in range(100, 260):
+        index.add([corpus[row]])
+        if row % 20 == 0:
+            rows, scores = index.score(["w1", "w2"])
+            assert np.array_equal(scores, BM25Okapi(corpus[: row + 1]).get_scores(["w1", "w2"])[rows])
+    assert len(index.postings._segments) < 8  # geometric merging keeps few segments
+
+    index.save_snapshot(tmp_path / "bm25")
+    reopened = BM25Index.open_snapshot(tmp_path / "bm25")
+    reopened.add([["w1", "w9"]])
+    expected = BM25Okapi(corpus + [["w1", "w9"]]).get_scores(["w1", "w9"])
+    rows, scores = reopened.score(["w1", "w9"])
+    assert np.array_equal(scores, expected[rows])
@@ -0,0 +1,106 @@
+import time
+from datetime import datetime
+
+from temporal_graph_rag.cache import LRUQueryCache, RedisQueryCache, cache_key
+from temporal_graph_rag.engine import TemporalGraphRAG
+
+
+def test_key_buckets_reference_time_by_granularity():
+    engine = TemporalGraphRAG()
+    morning = engine._parse_temporal_context("Who led Orion?", datetime(2024, 5, 2, 8, 15))
+    evening = engine._parse_temporal_context("  who led ORION ", datetime(2024, 5, 2, 21, 40))
+    next_day = engine._parse_temporal_context("Who led Orion?", datetime(2024, 5, 3, 8, 15))
+    assert cache_key("Who led Orion?", morning, 5) == cache_key("  who led ORION ", evening, 5)
+    assert cache_key("Who led Orion?", morning, 5) != cache_key("Who led Orion?", next_day, 5)
+
+    year_a = engine._parse_temporal_context("Who led Orion in 2023?", datetime(2024, 1, 5))
+    year_b = engine._parse_temporal_context("Who led Orion in 2023?", datetime(2024, 11, 30))
+    assert cache_key("Who led Orion in 2023?", year_a, 5) == cache_key("Who led Orion in 2023?", year_b, 5)
+
+
+def test_engine_serves_hits_and_invalidates_per_document():
+    cache = LRUQueryCache()
+    engine = TemporalGraphRAG(cache=cache)
+    first = engine.query("Who led Project Orion?", datetime(2024, 6, 1, 9))
+    second = engine.query("who led project orion", datetime(2024, 6, 1, 17))
+    assert [s.doc_id for s in second.sources] == [s.doc_id for s in first.sources]
+    assert second.temporal_context.reference_time == datetime(2024, 6, 1, 17)
+    assert cache.stats()["hits"] == 1
+
+    assert engine.invalidate_documents(["doc-1"]) == 1
+    engine.query("Who led Project Orion?", datetime(2024, 6, 1, 9))
+    assert cache.stats()["misses"] == 2
+
+
+def test_lru_eviction_and_ttl():
+    cache = LRUQueryCache(max_entries=2, ttl_s=0.05)
+    engine = TemporalGraphRAG()
+    res = engine.query("Who led Orion?", datetime(2024, 1, 1))
+    cache.set("a", res, ["doc-1"])
+    cache.set("b", res, [])
+    cache.get("a")
+    cache.set("c", res, [])
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+class _FakeRedis:
+    """Just the commands ``RedisQueryCache`` uses, with TTLs recorded instead of enforced."""
+
+    def __init__(self):
+        self.values, self.sets, self.ttls = {}, {}, {}
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, px=None):
+        if px is not None and px <= 0:
+            raise ValueError("invalid expire time in 'set' command")
+        self.values[key] = value
+        self.ttls[key] = px
+
+    def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    def pexpire(self, key, ttl_ms):
+        if ttl_ms <= 0:
+            raise ValueError("invalid expire time in 'pexpire' command")
+        self.ttls[key] = ttl_ms
+
+    def smembers(self, key):
+        return self.sets.get(key, set())
+
+    def delete(self, *keys):
+        return sum(self.values.pop(k, None) is not None or self.sets.pop(k, None) is not None for k in keys)
+
+
+def test_redis_cache_stores_json_and_expires_doc_tags():
+    client = _FakeRedis()
+    cache = RedisQueryCache(client, ttl_s=60)
+    res = TemporalGraphRAG().query("Who led Orion?", datetime(2024, 1, 1))
+    cache.set("k", res, [s.doc_id for s in res.sources])
+    payload = client.values["tgrag:q:k"]
+    assert payload.startswith(b"{")
+    assert cache.get("k") == res
+    tags = [key for key in client.sets if key.startswith("tgrag:q:doc:")]
+    assert tags and all(client.ttls[tag] == 60_000 for tag in tags)
+    assert cache.invalidate_documents([res.sources[0].doc_id]) == 1
+    assert cache.get("k") is None
+
+
+def test_redis_cache_keeps_sub_second_ttls():
+    client = _FakeRedis()
+    cache = RedisQueryCache(client, ttl_s=0.25)
+    res = TemporalGraphRAG().query("Who led Orion?", datetime(2024, 1, 1))
+    cache.set("k", res, [s.doc_id for s in res.sources])
+    assert client.ttls["tgrag:q:k"] == 250
+    assert all(client.ttls[tag] == 250 for tag in client.sets)
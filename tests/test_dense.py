@@ -0,0 +1,85 @@
+from datetime import datetime
+
+import numpy as np
+
+from temporal_graph_rag.engine import TemporalGraphRAG
+from temporal_graph_rag.index.dense import DenseIndex, hashing_embedder
+from temporal_graph_rag.retrievers import LocalDenseRetriever
+
+
+def _vectors(n=500, dim=32, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+
+
+def test_brute_force_matches_exact_cosine_ranking():
+    vectors = _vectors()
+    index = DenseIndex(vectors)
+    query = vectors[17] + 0.1
+    rows, scores = index.search(query, k=5)
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = np.argsort(-(unit @ (query / np.linalg.norm(query))))[:5]
+    assert rows.tolist() == expected.tolist()
+    assert np.all(np.diff(scores) <= 0)
+
+    batch_rows, _ = index.search_batch(np.vstack([query, vectors[3]]), k=5)
+    assert batch_rows[0].tolist() == rows.tolist()
+    assert batch_rows[1][0] == 3
+
+
+def test_memmap_roundtrip_and_full_probe_ivf(tmp_path):
+    index = DenseIndex(_vectors())
+    index.save(tmp_path / "dense.npy")
+    loaded = DenseIndex.load(tmp_path / "dense.npy")
+    assert isinstance(loaded.matrix, np.memmap)
+
+    loaded.train_ivf(nlist=8, seed=1)
+    query = _vectors(1, seed=9)[0]
+    exact_rows, _ = loaded.search(query, k=10)
+    ivf_rows, _ = loaded.search(query, k=10, nprobe=8)
+    assert ivf_rows.tolist() == exact_rows.tolist()
+
+
+def test_local_dense_retriever_in_engine():
+    docs = [
+        {"id": "a", "content": "Alice led Project Orion", "valid_from": datetime(2023, 1, 1), "valid_to": None},
+        {"id": "b", "content": "Quarterly revenue grew", "valid_from": datetime(2023, 1, 1), "valid_to": None},
+    ]
+    retriever = LocalDenseRetriever(docs, embedding_fn=hashing_embedder(64))
+    engine = TemporalGraphRAG(docs=docs, retrievers=[retriever])
+    res = engine.query("Who led Project Orion?", datetime(2024, 1, 1), top_k=1)
+    assert [s.doc_id for s in res.sources] == ["a"]
+
+
+def test_appended_rows_are_searchable_on_both_paths():
+    vectors = _vectors(300)
+    index = DenseIndex(vectors[:200])
+    index.train_ivf(nlist=4, seed=2)
+    assert list(index.add(vectors[200:250])) == list(range(200, 250))
+    assert list(index.add(vectors[250:])) == list(range(250, 300))
+    assert len(index) == 300
+
+    full = DenseIndex(vectors)
+    query = vectors[275]
+    assert index.search(query, k=5)[0].tolist() == full.search(query, k=5)[0].tolist()
+    assert index.search(query, k=1, nprobe=1)[0].tolist() == [275]
+
+
+def test_deleted_rows_vanish_and_compaction_keeps_row_ids():
+    vectors = _vectors(400, seed=4)
+    index = DenseIndex(vectors, compact_ratio=0.25)
+    index.train_ivf(nlist=8, seed=3)
+    dead = np.arange(0, 400, 3)
+    index.delete(dead[:20])
+    assert index.matrix.shape[0] == 400  # below the ratio: tombstoned only
+    index.delete(dead[20:])
+    assert index.matrix.shape[0] == 400 - dead.shape[0]  # compacted
+    index.add(vectors[:5])
+
+    live = np.setdiff1d(np.arange(405), dead)
+    full = np.vstack([vectors, vectors[:5]])
+    query = vectors[10] + 0.05
+    exact = DenseIndex(full[live]).search(query, k=10)[0]
+    assert index.search(query, k=10)[0].tolist() == live[exact].tolist()
+    assert index.search(query, k=10, nprobe=8)[0].tolist() == live[exact].tolist()
+    assert index.search_batch(query[None, :], k=10)[0][0].tolist() == live[exact].tolist()
+    assert index.search(query, rows=np.array([0, 1, 3]))[0].tolist() == [1]
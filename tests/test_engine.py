@@ -1,6 +1,12 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import pytest
+
 from temporal_graph_rag.engine import TemporalGraphRAG
+from temporal_graph_rag.types import RetrievalResult
 
 
 def dt(y, m, d):
@@ -23,3 +29,214 @@ def test_parse_temporal_context_month_end():
     assert ctx.time_start == dt(2024, 2, 1)
     assert ctx.time_end == dt(2024, 2, 29)
     assert ctx.granularity == "month"
+
+
+class _StubRetriever:
+    def __init__(self, name, results=None, delay_s=0.0, error=None):
+        self.name = name
+        self._results = results or []
+        self._delay_s = delay_s
+        self._error = error
+
+    def retrieve(self, query, ctx, top_k=None):
+        if self._delay_s:
+            time.sleep(self._delay_s)
+        if self._error:
+            raise self._error
+        return self._results
+
+
+def test_parallel_query_matches_sequential():
+    sequential = TemporalGraphRAG()
+    parallel = TemporalGraphRAG(parallel=True)
+    try:
+        a = sequential.query("Who led Orion before 2024?", dt(2025, 1, 1))
+        b = parallel.query("Who led Orion before 2024?", dt(2025, 1, 1))
+    finally:
+        parallel.close()
+    assert [s.doc_id for s in a.sources] == [s.doc_id for s in b.sources]
+    assert [s.fused_score for s in a.sources] == [s.fused_score for s in b.sources]
+    assert b.degraded_sources == []
+
+
+def test_slow_and_failed_retrievers_degrade_to_partial_fusion():
+    hit = RetrievalResult("doc-1", "Alice led Orion", "sparse", 1.0, dt(2023, 1, 1), None)
+    engine = TemporalGraphRAG(
+        retrievers=[
+            _StubRetriever("graph", delay_s=1.0),
+            _StubRetriever("dense", error=RuntimeError("backend down")),
+            _StubRetriever("sparse", [hit]),
+        ],
+        parallel=True,
+        retriever_timeouts={"graph": 0.05},
+    )
+    try:
+        res = engine.query("Who led Orion?", dt(2024, 1, 1))
+    finally:
+        engine.close()
+    assert [s.doc_id for s in res.sources] == ["doc-1"]
+    assert sorted(res.degraded_sources) == ["dense", "graph"]
+    assert res.degraded_reasons == {"graph": "timeout", "dense": "error"}
+
+
+def test_concurrent_queries_do_not_queue_into_deadlines():
+    hit = RetrievalResult("doc-1", "Alice led Orion", "sparse", 1.0, dt(2023, 1, 1), None)
+    engine = TemporalGraphRAG(
+        retrievers=[_StubRetriever(name, [hit], delay_s=0.1) for name in ("graph", "dense", "sparse")],
+        parallel=True,
+        retriever_timeout_s=0.25,
+    )
+    try:
+        with ThreadPoolExecutor(max_workers=8) as callers:
+            responses = list(callers.map(lambda _: engine.query("Who led Orion?", dt(2024, 1, 1)), range(8)))
+    finally:
+        engine.close()
+    assert all(res.degraded_sources == [] for res in responses)
+
+
+def test_failed_submit_returns_its_worker_permit():
+    engine = TemporalGraphRAG(retrievers=[_StubRetriever("graph"), _StubRetriever("sparse")], parallel=True)
+    closed = ThreadPoolExecutor(max_workers=1)
+    closed.shutdown()
+    engine._executor = closed  # as if close() ran between _pool() and submit
+    with pytest.raises(RuntimeError):
+        engine.query("Who led Orion?", dt(2024, 1, 1))
+    engine._executor = None
+    try:
+        permits = [engine._workers.acquire(blocking=False) for _ in range(engine._pool_size)]
+        assert all(permits)
+    finally:
+        for _ in permits:
+            engine._workers.release()
+        engine.close()
+
+
+class _AsyncStubRetriever(_StubRetriever):
+    async def aretrieve(self, query, ctx, top_k=None):
+        await asyncio.sleep(self._delay_s)
+        return self._results
+
+
+def test_aquery_matches_query():
+    engine = TemporalGraphRAG()
+    sync = engine.query("What changed during March 2024?", dt(2024, 6, 1))
+    res = asyncio.run(engine.aquery("What changed during March 2024?", dt(2024, 6, 1)))
+    assert [s.doc_id for s in res.sources] == [s.doc_id for s in sync.sources]
+    assert res.answer == sync.answer
+
+
+def test_aquery_uses_native_aretrieve_and_enforces_deadlines():
+    hit = RetrievalResult("doc-9", "Bob owns infra", "dense", 0.5, None, None)
+    engine = TemporalGraphRAG(
+        retrievers=[_AsyncStubRetriever("dense", [hit]), _AsyncStubRetriever("graph", delay_s=5.0)],
+        retriever_timeout_s=0.05,
+    )
+    res = asyncio.run(engine.aquery("Who owns infra?", dt(2024, 6, 1)))
+    assert [s.doc_id for s in res.sources] == ["doc-9"]
+    assert res.degraded_sources == ["graph"] and res.degraded_reasons == {"graph": "timeout"}
+
+
+def test_top_k_fusion_matches_full_ranking_prefix():
+    docs = [
+        {
+            "id": f"doc-{i}",
+            "content": f"Person{i % 7} led Project Orion in {2020 + i % 5}",
+            "valid_from": dt(2020 + i % 5, 1 + i % 12, 1),
+            "valid_to": None if i % 9 == 0 else dt(2020 + i % 5, 12, 31),
+        }
+        for i in range(120)
+    ]
+    full = TemporalGraphRAG(docs=docs, candidate_k=None)
+    ctx = full._parse_temporal_context("Who led Orion during 2022?", dt(2024, 1, 1))
+    lists = [r.retrieve("Who led Orion during 2022?", ctx) for r in full._retrievers]
+    ranked = full._temporal_rrf(lists, ctx)
+    top = full._temporal_rrf(lists, ctx, top_k=7)
+    assert [r.doc_id for r in top] == [r.doc_id for r in ranked[:7]]
+
+    bounded = TemporalGraphRAG(docs=docs, candidate_k=10)
+    res = bounded.query("Who led Orion during 2022?", dt(2024, 1, 1), top_k=3)
+    assert len(res.sources) == 3
+    assert all(len(r.retrieve("Who led Orion", ctx, top_k=10)) <= 10 for r in bounded._retrievers)
+
+
+def _sequential_rrf(lists, ctx, boost, k=60):
+    """Reference fusion: one dict update per hit, sorted stably by score."""
+    scores, per_source = {}, {}
+    for results in lists:
+        for rank, result in enumerate(results):
+            weight = 1.2 if result.source == "graph" else 1.0
+            final = 1.0 / (k + rank + 1) * boost(result.valid_from, result.valid_to, ctx) * weight
+            scores[result.doc_id] = scores.get(result.doc_id, 0.0) + final
+            sources = per_source.setdefault(result.doc_id, {})
+            sources[result.source] = sources.get(result.source, 0.0) + final
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    return [(doc_id, score, per_source[doc_id]) for doc_id, score in ranked]
+
+
+def test_vectorized_fusion_matches_sequential_reference():
+    docs = [
+        {
+            "id": f"doc-{i}",
+            "content": f"Person{i % 6} led Project {'Orion' if i % 3 else 'Nova'} in {2019 + i % 6}",
+            "valid_from": None if i % 11 == 0 else datetime(2019 + i % 6, 1 + i % 12, 1 + i % 27, i % 24),
+            "valid_to": None if i % 4 == 0 else dt(2019 + i % 6, 12, 31),
+        }
+        for i in range(200)
+    ]
+    engine = TemporalGraphRAG(docs=docs, candidate_k=None)
+    remote = [
+        RetrievalResult("doc-7", "Person1 led Project Orion in 2020", "remote", 1.0, dt(2020, 8, 8), None),
+        RetrievalResult("ext-1", "Outside fact", "remote", 0.5, dt(2022, 3, 1), None),
+    ]
+    for query in ("Who led Orion during 2022?", "Nova after March 2023", "Person4"):
+        ctx = engine._parse_temporal_context(query, datetime(2024, 5, 17, 9, 30, 0, 250))
+        rows = [r.retrieve_rows(query, ctx) for r in engine._retrievers] + [remote]
+        lists = [r.retrieve(query, ctx) for r in engine._retrievers] + [remote]
+        fused = [(r.doc_id, r.fused_score, r.source_scores) for r in engine._temporal_rrf(rows, ctx)]
+        assert fused == _sequential_rrf(lists, ctx, engine._temporal_boost)
+
+
+def test_query_many_matches_individual_queries():
+    docs = [
+        {
+            "id": f"doc-{i}",
+            "content": f"Person{i % 5} led Project {'Orion' if i % 2 else 'Nova'} in {2021 + i % 4}",
+            "valid_from": dt(2021 + i % 4, 1, 1),
+            "valid_to": dt(2021 + i % 4, 12, 31),
+        }
+        for i in range(60)
+    ]
+    engine = TemporalGraphRAG(docs=docs)
+    queries = ["Who led Orion during 2022?", "Who led Nova before 2024?", "Person3 projects"]
+    refs = [dt(2024, 1, 1), dt(2023, 6, 1), dt(2025, 1, 1)]
+    batch = engine.query_many(queries, refs, top_k=4)
+    for query, ref, res in zip(queries, refs, batch):
+        single = engine.query(query, ref, top_k=4)
+        assert [s.doc_id for s in res.sources] == [s.doc_id for s in single.sources]
+        assert [s.fused_score for s in res.sources] == [s.fused_score for s in single.sources]
+
+
+def test_update_and_delete_are_visible_without_rebuild():
+    from temporal_graph_rag.cache import LRUQueryCache
+
+    engine = TemporalGraphRAG(temporal_prefilter=True, cache=LRUQueryCache())
+    ref = datetime(2024, 6, 1)
+    before = engine.query("Who led Project Orion before 2024?", ref)
+    assert "doc-1" in [s.doc_id for s in before.sources]
+
+    engine.update_document(
+        {
+            "id": "doc-1",
+            "content": "Carol led Project Orion from 2022-06 to 2024-01.",
+            "valid_from": datetime(2022, 6, 1),
+            "valid_to": datetime(2024, 1, 31),
+        }
+    )
+    updated = engine.query("Who led Project Orion before 2024?", ref)
+    doc1 = [s for s in updated.sources if s.doc_id == "doc-1"]
+    assert len(doc1) == 1 and doc1[0].content.startswith("Carol")
+
+    assert engine.delete_document("doc-1") is True
+    assert engine.delete_document("doc-1") is False
+    after = engine.query("Who led Project Orion before 2024?", ref)
+    assert "doc-1" not in [s.doc_id for s in after.sources]
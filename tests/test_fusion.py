@@ -0,0 +1,132 @@
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from temporal_graph_rag import TemporalGraphRAG
+from temporal_graph_rag.fusion import CascadeConfig, FusionConfig, optimize, score_ranges
+from temporal_graph_rag.retrievers import RowHits
+from temporal_graph_rag.types import RetrievalResult
+
+DOCS = [
+    {"id": f"d{i}", "content": f"Person{i} led Orion", "valid_from": None, "valid_to": None}
+    for i in range(4)
+]
+
+
+def test_config_round_trips_and_validates(tmp_path):
+    config = FusionConfig(method="combsum", weights={"dense": 0.5}, normalization={"sparse": (1.0, 3.0)})
+    config.save(tmp_path / "fusion.json")
+    assert FusionConfig.load(tmp_path / "fusion.json") == config
+    assert config.normalize("sparse", np.array([0.0, 2.0, 9.0])).tolist() == [0.0, 0.5, 1.0]
+    assert score_ranges({"sparse": [1.0, 2.0, 3.0]}, (0.0, 1.0)) == {"sparse": (1.0, 3.0)}
+    with pytest.raises(ValueError):
+        FusionConfig(method="borda")
+
+
+def test_combmnz_rewards_agreement_across_lists():
+    engine = TemporalGraphRAG(DOCS)
+    ctx = engine._parse_temporal_context("Who led Orion", datetime(2024, 1, 1))
+    lists = [
+        RowHits("sparse", np.array([0, 1]), np.array([4.0, 3.0])),
+        RowHits("dense", np.array([1, 2]), np.array([0.9, 0.1])),
+        [RetrievalResult("ext", "Remote fact", "remote", 7.0, None, None)],
+    ]
+    combsum = engine._temporal_rrf(lists, ctx, config=FusionConfig(method="combsum", weights={}))
+    assert {r.doc_id: r.fused_score for r in combsum} == {"d0": 1.0, "d1": 1.0, "ext": 1.0, "d2": 0.0}
+    combmnz = engine._temporal_rrf(lists, ctx, config=FusionConfig(method="combmnz", weights={}))
+    assert combmnz[0].doc_id == "d1" and combmnz[0].fused_score == 2.0
+
+
+def test_engine_uses_and_snapshots_its_fusion_config(tmp_path):
+    config = FusionConfig(weights={"graph": 3.0}, in_window=2.0)
+    engine = TemporalGraphRAG(DOCS, fusion=config)
+    res = engine.query("Who led Orion")
+    assert res.sources[0].source_scores["graph"] == pytest.approx(3.0 / 61)
+    engine.save_snapshot(tmp_path / "snap")
+    assert TemporalGraphRAG.from_snapshot(tmp_path / "snap").fusion == config
+
+
+def test_optimize_improves_objective():
+    best, score = optimize(lambda c: -abs(c.weight("graph") - 2.4), sources=["graph"], methods=["rrf"])
+    assert best.weight("graph") == pytest.approx(2.4) and score == pytest.approx(0.0)
+
+
+class _Counting:
+    def __init__(self, name, hits):
+        self.name, self.hits, self.calls = name, hits, 0
+
+    def retrieve(self, query, ctx, top_k=None):
+        self.calls += 1
+        return self.hits
+
+
+def _hit(doc_id, source, score=1.0):
+    return RetrievalResult(doc_id, f"{doc_id} content", source, score, None, None)
+
+
+def test_cascade_skips_tiers_that_cannot_change_top_k():
+    graph = _Counting("graph", [_hit("a", "graph"), _hit("b", "graph")])
+    dense = _Counting("dense", [_hit("c", "dense"), _hit("a", "dense")])
+    engine = TemporalGraphRAG(
+        DOCS,
+        retrievers=[graph, dense],
+        fusion=FusionConfig(weights={"graph": 5.0, "dense": 0.5}),
+        cascade=CascadeConfig([["graph"], ["dense"]]),
+    )
+    # Top-1: a leads b by 5/61 - 5/62, less than dense's best 0.5/61, so dense runs.
+    res = engine.query("content", top_k=1)
+    assert res.skipped_sources == [] and dense.calls == 1
+    full = TemporalGraphRAG(DOCS, retrievers=[graph, dense], fusion=engine.fusion)
+    assert [s.doc_id for s in res.sources] == [s.doc_id for s in full.query("content", top_k=1).sources]
+
+    # Top-2: {a, b} leads every unseen doc (0 + 0.5/61) by far, but dense could
+    # still lift b past a, so it runs and the order matches a full run.
+    res = engine.query("content", top_k=2)
+    assert res.skipped_sources == [] and dense.calls == 3
+    assert [s.doc_id for s in res.sources] == [s.doc_id for s in full.query("content", top_k=2).sources]
+
+    # With rrf_k=1, a (5/2) leads b (5/3) by more than dense's best (0.5/2): skipped.
+    spread = TemporalGraphRAG(
+        DOCS,
+        retrievers=[graph, dense],
+        fusion=FusionConfig(rrf_k=1, weights={"graph": 5.0, "dense": 0.5}),
+        cascade=CascadeConfig([["graph"], ["dense"]]),
+    )
+    res = spread.query("content", top_k=2)
+    assert res.skipped_sources == ["dense"] and dense.calls == 4
+    assert [s.doc_id for s in res.sources] == ["a", "b"]
+    assert spread.cascade_stats() == {"queries": 1, "skipped": {"dense": 1}}
+
+    res = asyncio.run(spread.aquery("content", top_k=2))
+    assert res.skipped_sources == ["dense"] and dense.calls == 4
+    with pytest.raises(ValueError):
+        TemporalGraphRAG(DOCS, retrievers=[graph], cascade=CascadeConfig([["bm25"]]))
+
+
+def test_default_cascade_settles_top_1_with_per_document_boosts():
+    docs = [
+        {
+            "id": "orion",
+            "content": "Alice led Project Orion in March 2024",
+            "valid_from": datetime(2024, 3, 1),
+            "valid_to": datetime(2024, 3, 31),
+        }
+    ] + [
+        {
+            "id": f"nova-{i}",
+            "content": f"Person{i} led Project Nova",
+            "valid_from": datetime(2021, 1 + i, 1),
+            "valid_to": datetime(2021, 12, 31),
+        }
+        for i in range(5)
+    ]
+    query, ref = "Who led Project Orion during March 2024?", datetime(2025, 6, 1)
+    engine = TemporalGraphRAG(docs, cascade=CascadeConfig([["graph", "sparse"], ["dense"]]))
+    res = engine.query(query, ref, top_k=1)
+    # The runner-up is out of window and old, so its own boost caps what dense
+    # could add far below the largest possible boost.
+    assert res.skipped_sources == ["dense"]
+    full = TemporalGraphRAG(docs).query(query, ref, top_k=1)
+    assert [s.doc_id for s in res.sources] == [s.doc_id for s in full.sources]
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+import numpy as np
+
+from temporal_graph_rag import TemporalGraphRAG
+from temporal_graph_rag.index.graph import TemporalGraph
+from temporal_graph_rag.retrievers import TemporalGraphRetriever
+from temporal_graph_rag.store import DocumentStore
+from temporal_graph_rag.temporal.parser import parse_temporal_context
+
+DOCS = [
+    {"id": "mike", "content": "Mike managed the Platform team.", "valid_from": datetime(2021, 1, 1),
+     "valid_to": datetime(2022, 12, 31), "entities": ["Mike", "Platform"]},
+    {"id": "sarah", "content": "Sarah managed the Platform team.", "valid_from": datetime(2023, 1, 1),
+     "valid_to": None, "entities": ["Sarah", "Platform"]},
+    {"id": "lee", "content": "Lee managed the Platform team.", "valid_from": datetime(2015, 1, 1),
+     "valid_to": datetime(2016, 12, 31), "entities": ["Lee", "Platform"]},
+    {"id": "orion", "content": "Sarah launched Project Orion.", "valid_from": datetime(2023, 6, 1),
+     "valid_to": None},
+]
+
+
+def test_expand_follows_only_window_valid_edges():
+    graph = TemporalGraph()
+    graph.add([0, 1, 2], [["A", "B"], ["B", "C"], ["C", "D"]], [0, 10, 20], [9, 19, 29])
+    a = graph.node("a")
+    rows, hop, paths = graph.expand([a], 0, 100, hops=3)
+    assert rows.tolist() == [0, 1, 2] and hop.tolist() == [1, 2, 3] and paths.tolist() == [1, 1, 1]
+    assert graph.expand([a], 0, 15, hops=3)[0].tolist() == [0, 1]  # row 2 is out of window
+
+    graph.delete_rows([1])
+    graph.add([3], [["B", "D"]], [0], [100])  # stays in a delta segment
+    rows, hop, _ = graph.expand([a], 0, 100, hops=2)
+    assert rows.tolist() == [0, 3] and hop.tolist() == [1, 2]
+    graph._merge_segments()  # tombstoned edges stay for as_of queries
+    assert graph.expand([a], 0, 100, hops=2)[0].tolist() == [0, 3] and len(graph) == 16
+    assert graph.expand([a], 0, 100, hops=2, rows=np.asarray([0, 1]))[0].tolist() == [0, 1]
+
+
+def test_retriever_answers_multi_hop_question_in_window(tmp_path):
+    store = DocumentStore.from_docs(DOCS)
+    retriever = TemporalGraphRetriever(store)
+    ctx = parse_temporal_context("Who managed the team before Sarah between 2020 and 2024?", datetime(2024, 6, 1))
+    hits = retriever.retrieve_rows("Who managed the team before Sarah between 2020 and 2024?", ctx)
+    ids = [store.doc_id(row) for row in hits.rows.tolist()]
+    # Sarah's own facts first, then Mike through the Platform entity; Lee is out of window.
+    assert ids[:2] == ["sarah", "orion"] and ids[2] == "mike" and "lee" not in ids
+    assert hits.scores.tolist() == [1.0, 1.0, 0.5]
+
+    engine = TemporalGraphRAG(store, retrievers=[retriever])
+    engine.delete_document("mike")
+    engine.save_snapshot(tmp_path / "snap")
+    reopened = TemporalGraphRAG.from_snapshot(tmp_path / "snap")
+    again = reopened._retrievers[0].retrieve("Sarah", parse_temporal_context("Sarah", datetime(2024, 6, 1)))
+    assert {r.doc_id for r in again} == {"sarah", "orion", "lee"}
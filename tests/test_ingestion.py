@@ -0,0 +1,62 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from temporal_graph_rag import TemporalGraphRAG
+from temporal_graph_rag.cache import LRUQueryCache
+from temporal_graph_rag.ingestion.pipeline import IngestionPipeline, read_jsonl
+from temporal_graph_rag.ingestion.temporal_indexer import extract_entities, parse_timestamps
+
+
+def test_parse_timestamps_handles_mixed_columns():
+    when = datetime(2022, 5, 1)
+    assert parse_timestamps(["2024-03-01", None, when, ""]) == [datetime(2024, 3, 1), None, when, None]
+    # Offsets defeat the NumPy path; the fallback normalizes to naive UTC.
+    assert parse_timestamps(["2024-03-01T02:00:00+02:00", "2024-03-02T00:00:00Z"]) == [
+        datetime(2024, 3, 1),
+        datetime(2024, 3, 2),
+    ]
+
+
+def test_extract_entities_skips_sentence_and_date_words():
+    text = "The March 2024 reorg moved Project Orion to Platform Ops after Alice left."
+    assert extract_entities(text) == ["Project Orion", "Platform Ops", "Alice"]
+
+
+def _write_jsonl(path, count):
+    with open(path, "w", encoding="utf-8") as handle:
+        for i in range(count):
+            record = {
+                "id": f"n-{i}",
+                "content": f"Team {i} shipped the Falcon release.",
+                "valid_from": f"2024-{i % 12 + 1:02d}-01",
+                "valid_to": None,
+            }
+            handle.write(json.dumps(record) + "\n")
+
+
+def test_pipeline_streams_jsonl_into_engine(tmp_path):
+    path = tmp_path / "docs.jsonl"
+    _write_jsonl(path, 250)
+    engine = TemporalGraphRAG(docs=[], temporal_prefilter=True, cache=LRUQueryCache())
+    engine.query("Falcon release during June 2024", datetime(2024, 7, 1))
+
+    stats = IngestionPipeline(engine, chunk_size=40, max_pending_chunks=2).run(read_jsonl(path))
+
+    assert (stats.documents, stats.chunks) == (250, 7)
+    assert engine.cache.stats()["entries"] == 0
+    res = engine.query("Falcon release during June 2024", datetime(2024, 7, 1), top_k=3)
+    assert len(res.sources) == 3
+    assert all(s.valid_from <= datetime(2024, 6, 30) for s in res.sources)
+
+
+def test_pipeline_surfaces_sink_errors():
+    class FailingSink:
+        def add_documents(self, docs):
+            raise ConnectionError("backend down")
+
+    records = ({"id": str(i), "content": "x"} for i in range(100))
+    with pytest.raises(RuntimeError) as info:
+        IngestionPipeline(FailingSink(), chunk_size=10, max_pending_chunks=1).run(records)
+    assert isinstance(info.value.__cause__, ConnectionError)
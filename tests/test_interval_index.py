@@ -0,0 +1,79 @@
+import random
+from datetime import datetime
+
+from temporal_graph_rag.engine import TemporalGraphRAG
+from temporal_graph_rag.temporal.epoch import OPEN_END
+from temporal_graph_rag.temporal.interval_index import IntervalIndex
+
+
+def dt(y, m, d):
+    return datetime(y, m, d)
+
+
+def test_overlapping_matches_brute_force():
+    rng = random.Random(3)
+    starts, ends = [], []
+    for _ in range(1000):
+        start = rng.randint(0, 10_000)
+        starts.append(start)
+        ends.append(OPEN_END if rng.random() < 0.1 else start + rng.randint(0, 500))
+    index = IntervalIndex(starts, ends, leaf_size=8)
+
+    for _ in range(50):
+        lo = rng.randint(0, 10_000)
+        hi = lo + rng.randint(0, 800)
+        expected = [i for i, (s, e) in enumerate(zip(starts, ends)) if s <= hi and e >= lo]
+        assert index.overlapping_epochs(lo, hi).tolist() == expected
+
+
+def test_open_ended_docs_overlap_future_windows():
+    docs = [
+        {"id": "a", "valid_from": dt(2023, 1, 1), "valid_to": dt(2023, 6, 30)},
+        {"id": "b", "valid_from": dt(2024, 3, 1), "valid_to": None},
+    ]
+    index = IntervalIndex.from_docs(docs)
+    assert index.overlapping_ids(dt(2025, 1, 1), dt(2025, 12, 31)) == ["b"]
+    assert index.overlapping_ids(dt(2023, 5, 1), dt(2024, 3, 1)) == ["a", "b"]
+    assert index.overlapping_ids(None, dt(2022, 12, 31)) == []
+
+
+def test_engine_prefilter_drops_out_of_window_docs():
+    engine = TemporalGraphRAG(temporal_prefilter=True)
+    res = engine.query("Who led Project Orion during 2023?", dt(2024, 6, 1))
+    assert [s.doc_id for s in res.sources] == ["doc-1"]
+
+
+def test_inserted_rows_match_a_full_rebuild():
+    rng = random.Random(9)
+    starts = [rng.randint(0, 5_000) for _ in range(400)]
+    ends = [s + rng.randint(0, 300) for s in starts]
+    index = IntervalIndex(starts[:100], ends[:100], ids=[str(i) for i in range(100)], leaf_size=4)
+    for lo in range(100, 400, 7):
+        hi = min(lo + 7, 400)
+        rows = index.insert(starts[lo:hi], ends[lo:hi], ids=[str(i) for i in range(lo, hi)])
+        assert list(rows) == list(range(lo, hi))
+    full = IntervalIndex(starts, ends)
+    assert len(index) == 400
+    for _ in range(30):
+        lo = rng.randint(0, 5_000)
+        expected = full.overlapping_epochs(lo, lo + 200)
+        assert index.overlapping_epochs(lo, lo + 200).tolist() == expected.tolist()
+    assert index.overlapping_ids(None, None) == [str(i) for i in range(400)]
+
+
+def test_removed_rows_never_overlap():
+    rng = random.Random(4)
+    starts = [rng.randint(0, 2_000) for _ in range(300)]
+    ends = [s + rng.randint(0, 400) for s in starts]
+    index = IntervalIndex(starts[:250], ends[:250], leaf_size=4)
+    index.insert(starts[250:], ends[250:])
+    removed = set(rng.sample(range(300), 120)) | {299}
+    index.remove(removed)
+    for _ in range(40):
+        lo = rng.randint(0, 2_400)
+        hi = lo + rng.randint(0, 300)
+        expected = [
+            i for i in range(300) if i not in removed and starts[i] <= hi and ends[i] >= lo
+        ]
+        assert index.overlapping_epochs(lo, hi).tolist() == expected
+    assert len(index.overlapping(None, None)) == 300 - len(removed)
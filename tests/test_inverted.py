@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from temporal_graph_rag.index.inverted import InvertedIndex
+from temporal_graph_rag.index.tokenize import ENGLISH_STOPWORDS, Tokenizer
+from temporal_graph_rag.retrievers import InMemoryGraphRetriever
+from temporal_graph_rag.temporal.parser import parse_temporal_context
+
+
+def test_match_counts_union_postings_across_segments():
+    index = InvertedIndex([["a", "b"], ["b", "c", "b"], ["d"]])
+    rows, counts = index.match_counts(["b", "c", "b", "zzz"])
+    assert rows.tolist() == [0, 1] and counts.tolist() == [1, 2]
+
+    assert index.add([["c", "b"], ["e"]]) == range(3, 5)
+    index.delete([1])
+    assert index.top_k(["b", "c"])[0].tolist() == [3, 0]
+    assert index.top_k(["b", "c"], k=1, rows=[0, 4])[0].tolist() == [0]
+    index._merge_segments()
+    assert index.match_counts(["b"])[0].tolist() == [0, 3]
+
+
+def test_tokenizer_normalization():
+    tokenize = Tokenizer(stopwords=ENGLISH_STOPWORDS, strip_punctuation=True)
+    assert tokenize("Who led Project Orion?") == ["led", "project", "orion"]
+    assert Tokenizer()("Who led Orion?") == ["who", "led", "orion?"]
+    assert Tokenizer.from_config(tokenize.to_config()) == tokenize
+
+
+def test_graph_retriever_ranks_by_matched_tokens():
+    docs = [
+        {"id": "a", "content": "Bob joined Platform Ops", "valid_from": datetime(2024, 1, 1)},
+        {"id": "b", "content": "Alice led Project Orion", "valid_from": datetime(2024, 1, 1)},
+        {"id": "c", "content": "Orion shipped", "valid_from": datetime(2024, 1, 1)},
+    ]
+    retriever = InMemoryGraphRetriever(docs, tokenizer=Tokenizer(ENGLISH_STOPWORDS, True))
+    ctx = parse_temporal_context("Who led Orion?", datetime(2024, 6, 1))
+    hits = retriever.retrieve("Who led Orion?", ctx)
+    assert [(r.doc_id, r.score) for r in hits] == [("b", 2.0), ("c", 1.0)]
+    retriever.delete_document("b")
+    assert [r.doc_id for r in retriever.retrieve("Who led Orion?", ctx, top_k=5)] == ["c"]
@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from temporal_graph_rag.retrievers import Neo4jGraphRetriever, QdrantDenseRetriever
+from temporal_graph_rag.temporal.epoch import to_epoch
+from temporal_graph_rag.temporal.parser import parse_temporal_context
+
+DOCS = [
+    {"id": "old", "content": "Alice led Orion", "valid_from": datetime(2021, 1, 1), "valid_to": datetime(2021, 12, 31)},
+    {"id": "now", "content": "Bob leads Orion", "valid_from": datetime(2024, 3, 1), "valid_to": None},
+    {"id": "open", "content": "Orion was founded", "valid_from": None, "valid_to": datetime(2024, 1, 5)},
+]
+
+
+def _ctx(query):
+    return parse_temporal_context(query, datetime(2024, 6, 1))
+
+
+class _Tx:
+    def __init__(self, calls, rows):
+        self.calls, self.rows = calls, rows
+
+    def run(self, query, **params):
+        self.calls.append((query, params))
+        return self.rows
+
+
+class _Session:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def execute_read(self, work):
+        self.driver.modes.append("read")
+        return work(_Tx(self.driver.calls, self.driver.rows))
+
+    def execute_write(self, work):
+        self.driver.modes.append("write")
+        return work(_Tx(self.driver.calls, self.driver.rows))
+
+    def close(self):
+        pass
+
+
+class _Driver:
+    def __init__(self, rows=()):
+        self.calls, self.rows, self.modes, self.sessions = [], list(rows), [], 0
+
+    def session(self, database=None, **config):
+        self.sessions += 1
+        return _Session(self)
+
+    def close(self):
+        pass
+
+
+def test_neo4j_pushes_window_into_cypher():
+    retriever = Neo4jGraphRetriever("bolt://localhost:7687", "neo4j", "pw", window_slack=timedelta(days=1))
+    retriever._driver = driver = _Driver([{"id": "now", "content": "Bob leads Orion", "score": 2.5}])
+
+    results = retriever.retrieve("Who leads Orion in 2024?", _ctx("Who leads Orion in 2024?"))
+    assert [r.doc_id for r in results] == ["now"] and results[0].score == 2.5
+    cypher, params = driver.calls[-1]
+    assert "db.index.fulltext.queryNodes" in cypher and "d.valid_to_epoch >= $start" in cypher
+    assert params["start"] == to_epoch(datetime(2023, 12, 31)) and params["search"].startswith("who OR")
+
+    soft = Neo4jGraphRetriever("bolt://localhost:7687", "neo4j", "pw", temporal_mode="soft", fulltext_index=None)
+    soft._driver = driver = _Driver()
+    soft.retrieve_many(["Orion in 2024", "Bob"], [_ctx("Orion in 2024"), _ctx("Bob")])
+    cypher, params = driver.calls[-1]
+    assert "UNWIND $queries" in cypher and "epoch" not in cypher
+    assert [q["terms"] for q in params["queries"]] == [["orion", "in", "2024"], ["bob"]]
+    with pytest.raises(ValueError):
+        Neo4jGraphRetriever("bolt://localhost:7687", "neo4j", "pw", temporal_mode="hard")
+
+
+def test_neo4j_reuses_one_session_per_thread():
+    retriever = Neo4jGraphRetriever("neo4j://localhost:7687", "neo4j", "pw", max_connection_pool_size=8)
+    retriever._driver = driver = _Driver()
+    for query in ("Orion", "Bob", "Alice"):
+        retriever.retrieve(query, _ctx(query))
+    retriever.add_documents(DOCS)
+    assert driver.sessions == 1 and driver.modes == ["read", "read", "read", "write"]
+    retriever.close()
+
+
+def test_qdrant_range_filter_keeps_overlapping_points():
+    from qdrant_client import QdrantClient, models
+
+    retriever = QdrantDenseRetriever("http://localhost:6333", "docs", embedding_fn=lambda text: [1.0, 0.0])
+    retriever._client = QdrantClient(":memory:")
+    retriever._client.create_collection(
+        "docs", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE)
+    )
+    retriever.add_documents(DOCS)
+
+    in_2024 = retriever.retrieve("Orion in 2024", _ctx("Orion in 2024"))
+    assert sorted(r.doc_id for r in in_2024) == ["now", "open"]
+    assert [r.doc_id for r in retriever.retrieve("Orion in 2022", _ctx("Orion in 2022"))] == ["open"]
+    assert len(retriever.retrieve("Orion", _ctx("Orion"))) == 3  # no window, no filter
+
+
+def test_qdrant_caches_query_embeddings_and_decodes_epochs():
+    from qdrant_client import QdrantClient, models
+
+    embedded = []
+    retriever = QdrantDenseRetriever(
+        "http://localhost:6333", "docs", embedding_fn=lambda text: embedded.append(text) or [1.0, 0.0]
+    )
+    retriever._client = QdrantClient(":memory:")
+    retriever._client.create_collection(
+        "docs", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE)
+    )
+    retriever.add_documents(DOCS)
+    retriever.ensure_indexes()
+    embedded.clear()
+
+    retriever.retrieve("Orion  in 2024", _ctx("Orion in 2024"))
+    queries = ["Orion in 2024", " Orion in 2022"]
+    batch = retriever.retrieve_many(queries, [_ctx(query) for query in queries])
+    assert embedded == ["Orion  in 2024", " Orion in 2022"]  # normalized text hits the cache
+    assert retriever.embedding_cache.stats()["hits"] == 1
+    (hit,) = batch[1]
+    assert hit.doc_id == "open" and hit.valid_from is None and hit.valid_to == datetime(2024, 1, 5)
+
+    retriever.temporal_mode = "soft"
+    assert len(retriever.retrieve_many(["Orion in 2022"], [_ctx("Orion in 2022")])[0]) == 3
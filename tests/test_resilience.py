@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from temporal_graph_rag import TemporalGraphRAG
+from temporal_graph_rag.resilience import CircuitOpenError, ResiliencePolicy
+from temporal_graph_rag.retrievers import BM25Retriever
+
+
+class _Flaky:
+    def __init__(self, failures):
+        self.failures, self.calls = failures, 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("brownout")
+        return "ok"
+
+
+def test_retries_then_opens_circuit_and_recovers():
+    policy = ResiliencePolicy(max_retries=2, backoff_base_s=0.0, failure_threshold=3, reset_timeout_s=0.05)
+    assert policy.call(_Flaky(2)) == "ok"  # two retries absorb two failures
+
+    down = _Flaky(100)
+    with pytest.raises(RuntimeError):
+        policy.call(down)
+    assert policy.breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        policy.call(down)
+    assert down.calls == 3  # the open circuit failed fast
+
+    time.sleep(0.06)
+    assert policy.breaker.state == "half_open"
+    assert policy.call(lambda: "back") == "back"
+    assert policy.breaker.state == "closed"
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = ResiliencePolicy(backoff_base_s=0.1, backoff_max_s=0.3)
+    delays = [policy.backoff(5) for _ in range(200)]
+    assert max(delays) <= 0.3 and len(set(delays)) > 100
+
+
+def test_hedges_slow_reads_after_p95_delay():
+    policy = ResiliencePolicy(hedge_min_samples=5)
+    for _ in range(5):
+        policy.call(lambda: time.sleep(0.001), hedge=True)
+    first = threading.Event()
+
+    def read():
+        # The first request stalls; the hedge answers.
+        if not first.is_set():
+            first.set()
+            time.sleep(0.5)
+            return "slow"
+        return "fast"
+
+    started = time.monotonic()
+    assert policy.call(read, hedge=True) == "fast"
+    assert time.monotonic() - started < 0.4
+    stats = policy.stats()
+    assert stats["hedges"] == 1 and stats["hedge_wins"] == 1
+    policy.close()
+
+
+def test_async_hedge_cancels_the_loser():
+    policy = ResiliencePolicy(hedge_min_samples=1, hedge_min_delay_s=0.01)
+    calls = []
+
+    async def read():
+        calls.append(len(calls))
+        await asyncio.sleep(0.5 if len(calls) == 1 else 0.0)
+        return len(calls)
+
+    async def run():
+        await policy.acall(lambda: asyncio.sleep(0, "warm"))
+        return await policy.acall(read, hedge=True)
+
+    assert asyncio.run(run()) == 2 and calls == [0, 1]
+
+
+def test_hedge_success_wins_over_a_failure_finishing_with_it():
+    policy = ResiliencePolicy()
+    for _ in range(20):
+        primary, hedge = Future(), Future()
+        primary.set_exception(ConnectionError("reset"))
+        hedge.set_result("ok")
+        # Both are done when the wait returns, so they land in one ``done`` set.
+        assert policy._first_result({primary: time.monotonic(), hedge: time.monotonic()}, hedged=True) == "ok"
+    assert policy.stats()["hedge_wins"] == 20
+
+    failed = Future()
+    failed.set_exception(ConnectionError("reset"))
+    with pytest.raises(ConnectionError):
+        policy._first_result({failed: time.monotonic()}, hedged=False)
+
+
+class _Backend:
+    name = "graph"
+
+    def __init__(self):
+        self.resilience = ResiliencePolicy("neo4j", max_retries=0, failure_threshold=1)
+
+    def retrieve(self, query, ctx, top_k=None):
+        def down():
+            raise ConnectionError("refused")
+
+        return self.resilience.call(down)
+
+
+def test_engine_reports_open_circuit_as_degraded():
+    docs = [{"id": "d1", "content": "Alice led Project Orion", "valid_from": None, "valid_to": None}]
+    engine = TemporalGraphRAG(docs, retrievers=[_Backend(), BM25Retriever(docs)])
+    first = engine.query("Who led Project Orion?")
+    second = engine.query("Who led Project Orion?")
+    assert first.degraded_reasons == {"graph": "error"}
+    assert second.degraded_reasons == {"graph": "circuit_open"} and second.sources
+    assert engine.backend_status()["graph"]["state"] == "open"
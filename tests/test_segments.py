@@ -0,0 +1,51 @@
+import numpy as np
+
+from temporal_graph_rag.index.segments import SegmentedPostings
+
+
+def test_lookup_and_gather_match_brute_force_across_segments(tmp_path):
+    rng = np.random.default_rng(3)
+    postings = SegmentedPostings(("rows", "payload"))
+    keys, rows, payload = [], [], []
+    for batch in range(20):
+        n = int(rng.integers(1, 30))
+        batch_keys = rng.integers(0, 12, n)
+        batch_rows = np.sort(rng.integers(5 * batch, 5 * batch + 5, n))
+        batch_payload = rng.integers(0, 100, n)
+        postings.append(batch_keys, [batch_rows, batch_payload], 5 * batch + 5)
+        keys.extend(batch_keys.tolist())
+        rows.extend(batch_rows.tolist())
+        payload.extend(batch_payload.tolist())
+    postings.delete([7, 42])
+    keys, rows, payload = np.asarray(keys), np.asarray(rows), np.asarray(payload)
+
+    def expected(key):
+        mask = keys == key
+        return sorted(zip(rows[mask].tolist(), payload[mask].tolist()))
+
+    for key in range(13):
+        got_rows, got_payload = postings.lookup(key)
+        assert sorted(zip(got_rows.tolist(), got_payload.tolist())) == expected(key)
+    got_keys, got_rows, _ = postings.gather(np.asarray([2, 5, 11]))
+    assert sorted(zip(got_keys.tolist(), got_rows.tolist())) == sorted(
+        (int(k), int(r)) for k, r in zip(keys, rows) if k in (2, 5, 11)
+    )
+
+    postings.save(tmp_path / "p")
+    reopened = SegmentedPostings.open(tmp_path / "p", ("rows", "payload"))
+    assert reopened.n_rows == 100 and reopened.deleted[[7, 42]].all()
+    # Merging keeps tombstoned postings; only the mask marks them.
+    assert sorted(zip(*(column.tolist() for column in reopened.lookup(4)))) == expected(4)
+
+
+def test_purge_drops_only_tombstoned_rows(tmp_path):
+    postings = SegmentedPostings(("rows",))
+    postings.append(np.asarray([0, 1, 0, 1]), [np.asarray([0, 0, 1, 2])], 3)
+    postings.delete([0, 1])
+    assert postings.purge([0, 2]).tolist() == [0]  # row 2 is still live
+    assert postings.lookup(0)[0].tolist() == [1] and postings.lookup(1)[0].tolist() == [2]
+    assert postings.purge([0]).size == 0
+
+    postings.save(tmp_path / "p")
+    reopened = SegmentedPostings.open(tmp_path / "p", ("rows",))
+    assert reopened.purged.tolist() == [True, False, False]
@@ -0,0 +1,86 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from temporal_graph_rag import TemporalGraphRAG
+from temporal_graph_rag.index.bm25 import BM25Index
+from temporal_graph_rag.index.dense import DenseIndex, hashing_embedder
+from temporal_graph_rag.retrievers import BM25Retriever, LocalDenseRetriever
+from temporal_graph_rag.store import DocumentStore
+from temporal_graph_rag.temporal.interval_index import IntervalIndex
+
+
+def _docs(count):
+    return [
+        {
+            "id": f"d{i}",
+            "content": f"Team {i % 7} shipped release {i} of Project Orion",
+            "valid_from": datetime(2023 + i % 2, i % 12 + 1, 1),
+            "valid_to": datetime(2024, 12, 31) if i % 3 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def test_document_store_round_trip(tmp_path):
+    docs = _docs(5) + [None]
+    DocumentStore.from_docs(docs).save_snapshot(tmp_path)
+    store = DocumentStore.open_snapshot(tmp_path)
+    assert list(store) == docs
+    assert store.ids[:2] == ["d0", "d1"]
+
+
+def test_index_snapshots_match_built_indexes(tmp_path):
+    corpus = [doc["content"].lower().split() for doc in _docs(50)]
+    bm25 = BM25Index(corpus[:40])
+    bm25.add(corpus[40:])
+    bm25.delete(3, corpus[3])
+    bm25.save_snapshot(tmp_path / "bm25")
+    opened = BM25Index.open_snapshot(tmp_path / "bm25")
+    for query in (["release", "7"], ["team", "3", "orion"]):
+        np.testing.assert_allclose(opened.score(query), bm25.score(query))
+
+    intervals = IntervalIndex([1, 5, 3], [4, 9, 3], ids=["a", "b", "c"], leaf_size=2)
+    intervals.insert([2], [8], ids=["d"])
+    intervals.save_snapshot(tmp_path / "intervals")
+    restored = IntervalIndex.open_snapshot(tmp_path / "intervals")
+    assert restored.overlapping_epochs(3, 6).tolist() == intervals.overlapping_epochs(3, 6).tolist()
+    restored.remove([1])
+    assert restored.overlapping_epochs(3, 6).tolist() == [0, 2, 3]
+
+    dense = DenseIndex(np.random.default_rng(0).normal(size=(30, 8)))
+    dense.delete([4])
+    dense.save_snapshot(tmp_path / "dense")
+    mapped = DenseIndex.open_snapshot(tmp_path / "dense")
+    query = np.ones(8)
+    for got, want in zip(mapped.search(query, 5), dense.search(query, 5)):
+        np.testing.assert_allclose(got, want)
+
+
+def test_engine_snapshot_answers_and_accepts_writes(tmp_path):
+    embed = hashing_embedder(64)
+    docs = _docs(40)
+    engine = TemporalGraphRAG(docs, temporal_prefilter=True)
+    engine.delete_document("d5")
+    engine.save_snapshot(tmp_path / "snap")
+    restored = TemporalGraphRAG.from_snapshot(tmp_path / "snap")
+    for query in ("Which team shipped Project Orion in 2024?", "release 12"):
+        assert restored.query(query).sources == engine.query(query).sources
+
+    restored.add_documents(
+        [{"id": "new", "content": "Team Nova shipped Project Orion", "valid_from": datetime(2024, 2, 1), "valid_to": None}]
+    )
+    restored.delete_document("d1")
+    ids = [source.doc_id for source in restored.query("Nova shipped Orion in 2024", top_k=50).sources]
+    assert "new" in ids and "d1" not in ids and "d5" not in ids
+
+    store = DocumentStore.from_docs(docs)
+    dense_engine = TemporalGraphRAG(
+        store, retrievers=[BM25Retriever(store), LocalDenseRetriever(store, embed)]
+    )
+    dense_engine.save_snapshot(tmp_path / "dense")
+    with pytest.raises(ValueError):
+        TemporalGraphRAG.from_snapshot(tmp_path / "dense")
+    reopened = TemporalGraphRAG.from_snapshot(tmp_path / "dense", embedding_fn=embed)
+    assert reopened.query("release 3").sources == dense_engine.query("release 3").sources
@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from temporal_graph_rag import TemporalGraphRAG
+from temporal_graph_rag.retrievers import BM25Retriever, InMemoryGraphRetriever
+from temporal_graph_rag.store import DocumentStore
+from temporal_graph_rag.temporal.epoch import OPEN_END
+
+
+def _doc(doc_id, content, start=datetime(2024, 1, 1), end=None):
+    return {"id": doc_id, "content": content, "valid_from": start, "valid_to": end}
+
+
+def test_store_upsert_and_delete_keep_row_ids_stable():
+    store = DocumentStore.from_docs([_doc("a", "alpha"), _doc("b", "béta")])
+    assert store.valid_to[0] == OPEN_END and store[1]["content"] == "béta"
+
+    added, replaced = store.upsert([_doc("c", "gamma"), _doc("a", "alpha v2"), _doc("c", "gamma v2")])
+    assert list(added) == [2, 3] and replaced == [0]
+    assert store[0] is None and store.content(0) == "alpha"  # tombstoned, still readable
+    assert [store.row_of(i) for i in ("a", "b", "c")] == [3, 1, 2]
+    assert store[2]["content"] == "gamma v2"
+
+    assert store.delete(["b", "missing"]) == [1]
+    assert store.row_of("b") is None and len(store) == 4
+    for i in range(100):  # grows past the initial capacity
+        store.upsert([_doc(f"n{i}", f"note {i}")])
+    assert store.doc_id(103) == "n99" and store.ids.to_list()[:3] == ["a", "b", "c"]
+
+
+def test_engine_writes_shared_store_once():
+    store = DocumentStore.from_docs([_doc("a", "Alice led Orion"), _doc("b", "Bob led Nova")])
+    graph, sparse = InMemoryGraphRetriever(store), BM25Retriever(store)
+    engine = TemporalGraphRAG(store, retrievers=[graph, sparse])
+    engine.add_documents([_doc("c", "Chloe led Orion"), _doc("a", "Alice left Orion")])
+    engine.delete_document("b")
+    assert len(store) == 4 and graph.docs is store and sparse.docs is store
+
+    ids = {source.doc_id: source.content for source in engine.query("Who led Orion").sources}
+    assert ids == {"c": "Chloe led Orion", "a": "Alice left Orion"}
+    ctx = engine._parse_temporal_context("nova", datetime(2024, 6, 1))
+    assert sparse.retrieve("nova", ctx) == []
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+import pytest
+
+from temporal_graph_rag import TemporalGraphRAG, telemetry
+
+
+@pytest.fixture
+def registry():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    telemetry.configure(metrics=True, tracing=False, registry=registry)
+    yield registry
+    telemetry.disable()
+
+
+def _count(registry, stage, retriever=""):
+    return registry.get_sample_value(
+        f"{telemetry.STAGE_HISTOGRAM}_count", {"stage": stage, "retriever": retriever}
+    )
+
+
+def test_stage_is_shared_noop_when_disabled():
+    telemetry.configure(metrics=False, tracing=False)
+    assert not telemetry.enabled()
+    assert telemetry.stage("parse") is telemetry.stage("fusion", "graph")
+    with pytest.raises(RuntimeError):
+        telemetry.render_metrics()
+
+
+def test_query_records_each_stage(registry):
+    engine = TemporalGraphRAG()
+    engine.query("Who led Project Orion before 2024?", datetime(2024, 6, 1))
+
+    for stage in ("query", "parse", "fusion", "synthesis"):
+        assert _count(registry, stage) == 1
+    for name in ("graph", "dense", "sparse"):
+        assert _count(registry, "retrieve", name) >= 1
+
+
+def test_parallel_and_batch_paths_are_labelled(registry):
+    engine = TemporalGraphRAG(parallel=True)
+    engine.query("Who led Project Orion before 2024?", datetime(2024, 6, 1))
+    engine.query_many(["What changed during March 2024?", "Who managed infra after 2024?"])
+    engine.close()
+
+    assert _count(registry, "retrieve", "sparse") == 1
+    assert _count(registry, "retrieve_batch", "sparse") == 1
+    assert _count(registry, "parse") == 3
@@ -1,5 +1,20 @@
 from datetime import datetime
-from temporal_graph_rag.temporal.algebra import Interval, relate
+
+import numpy as np
+
+from temporal_graph_rag.temporal.algebra import (
+    CODES,
+    COMPOSITION,
+    RELATIONS,
+    Interval,
+    compose,
+    composition_allows,
+    neighbor_relations,
+    overlapping_pairs,
+    pairwise_relations,
+    relate,
+    relation_names,
+)
 
 
 def dt(y, m, d):
@@ -34,3 +49,61 @@ def test_during():
     a = Interval(dt(2024, 1, 2), dt(2024, 1, 3))
     b = Interval(dt(2024, 1, 1), dt(2024, 1, 5))
     assert relate(a, b) == "during"
+
+
+def test_relate_names_inverse_relations():
+    a = Interval(dt(2024, 1, 1), dt(2024, 1, 10))
+    b = Interval(dt(2024, 1, 3), dt(2024, 1, 5))
+    assert relate(a, b) == "contains"
+    assert relate(b, a) == "during"
+
+
+def test_relation_codes_match_scalar_relate():
+    rng = np.random.default_rng(0)
+    start = rng.integers(0, 8, 60)
+    end = start + rng.integers(0, 4, 60)
+    intervals = [Interval(dt(2024, 1, 1 + int(s)), dt(2024, 1, 1 + int(e))) for s, e in zip(start, end)]
+    codes = pairwise_relations(start, end)
+    for i, a in enumerate(intervals):
+        for j, b in enumerate(intervals):
+            assert RELATIONS[codes[i, j]] == relate(a, b)
+    assert (codes == 12 - codes.T).all()
+    order, neighbors = neighbor_relations(start, end)
+    assert (neighbors == codes[order[:-1], order[1:]]).all()
+
+
+def test_composition_table():
+    assert relation_names(int(compose(CODES["overlaps"], CODES["overlaps"]))) == [
+        "before",
+        "meets",
+        "overlaps",
+    ]
+    assert relation_names(int(compose(CODES["meets"], CODES["meets"]))) == ["before"]
+    # Allen's table lists 409 basic relations across its 169 entries.
+    assert sum(bin(int(mask)).count("1") for mask in COMPOSITION.ravel()) == 409
+    assert composition_allows(
+        np.array([CODES["before"]]), np.array([CODES["before"]]), np.array([CODES["after"]])
+    ).tolist() == [False]
+
+
+def test_overlapping_pairs_matches_brute_force():
+    rng = np.random.default_rng(1)
+    start = rng.integers(0, 50, 200)
+    end = start + rng.integers(0, 6, 200)
+    groups = rng.integers(0, 4, 200)
+    codes = pairwise_relations(start, end)
+    apart = {CODES["before"], CODES["after"]}
+    touching = {CODES["meets"], CODES["met_by"]}
+    for touch in (True, False):
+        for grouped in (None, groups):
+            i, j = overlapping_pairs(start, end, groups=grouped, touching=touch)
+            expected = {
+                (a, b)
+                for a in range(200)
+                for b in range(a + 1, 200)
+                if codes[a, b] not in apart
+                and (touch or codes[a, b] not in touching)
+                and (grouped is None or groups[a] == groups[b])
+            }
+            assert len(i) == len(expected)
+            assert set(zip(i.tolist(), j.tolist())) == expected
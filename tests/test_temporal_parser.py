@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from temporal_graph_rag.temporal.parser import parse_temporal_context, scan
+
+
+def dt(y, m, d):
+    return datetime(y, m, d)
+
+
+def test_quarter_expressions():
+    for text in ("Revenue during Q3 2023?", "revenue in 2023 q3", "third quarter of 2023 revenue"):
+        ctx = parse_temporal_context(text, dt(2025, 1, 1))
+        assert (ctx.time_start, ctx.time_end, ctx.granularity) == (dt(2023, 7, 1), dt(2023, 9, 30), "quarter")
+
+
+def test_ranges_span_both_ends():
+    ctx = parse_temporal_context("What changed between 2022 and 2024?", dt(2025, 1, 1))
+    assert ctx.operators == ["BETWEEN"]
+    assert (ctx.time_start, ctx.time_end) == (dt(2022, 1, 1), dt(2024, 12, 31))
+
+    ctx = parse_temporal_context("Owners from March 2023 to 2024-02", dt(2025, 1, 1))
+    assert (ctx.time_start, ctx.time_end, ctx.granularity) == (dt(2023, 3, 1), dt(2024, 2, 29), "month")
+
+
+def test_iso_dates_and_relative_phrases():
+    ctx = parse_temporal_context("Who was on call on 2024-03-15?", dt(2025, 1, 1))
+    assert (ctx.time_start, ctx.time_end, ctx.granularity) == (dt(2024, 3, 15), dt(2024, 3, 15), "day")
+
+    ref = datetime(2024, 2, 10, 13, 30)
+    ctx = parse_temporal_context("What shipped last quarter?", ref)
+    assert (ctx.time_start, ctx.time_end) == (dt(2023, 10, 1), dt(2023, 12, 31))
+    ctx = parse_temporal_context("Incidents in the last 30 days", ref)
+    assert (ctx.time_start, ctx.time_end) == (dt(2024, 1, 11), dt(2024, 2, 10))
+    ctx = parse_temporal_context("Who joined since last month?", ref)
+    assert ctx.operators == ["AFTER"]
+    assert (ctx.time_start, ctx.time_end) == (dt(2024, 1, 1), dt(2024, 1, 31))
+
+
+def test_operators_match_whole_words_and_scan_is_memoized():
+    assert parse_temporal_context("Plan beforehand for 2024", dt(2025, 1, 1)).operators == []
+    scan.cache_clear()
+    parse_temporal_context("Who led Orion before 2024?", dt(2025, 1, 1))
+    parse_temporal_context("Who led Orion before 2024?", dt(2026, 1, 1))
+    assert scan.cache_info().hits == 1